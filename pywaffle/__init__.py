@@ -1,4 +1,64 @@
 #!/usr/bin/python
 # -*-coding: utf-8 -*-
 
-from .waffle import Waffle
+# Public names are imported on first access, so "import pywaffle" does not load matplotlib.
+
+from importlib import import_module
+
+__all__ = [
+    "BatchResult",
+    "Waffle",
+    "WaffleLayout",
+    "WaffleStats",
+    "animate_waffle",
+    "compute_layout",
+    "interpolate_values",
+    "render_batch",
+    "save_png",
+    "save_svg",
+]
+
+# Public name -> module it is defined in
+_lazy_imports = {
+    "BatchResult": ".batch",
+    "render_batch": ".batch",
+    "Waffle": ".waffle",
+    "WaffleLayout": ".layout",
+    "WaffleStats": ".stats",
+    "animate_waffle": ".animation",
+    "interpolate_values": ".animation",
+    "compute_layout": ".layout",
+    "save_png": ".png",
+    "save_svg": ".svg",
+}
+
+
+# Submodules that are imported on first access, like "pywaffle.waffle" after "import pywaffle"
+_submodules = {
+    "animation",
+    "batch",
+    "cache",
+    "fontawesome_files",
+    "fontawesome_handler",
+    "fontawesome_index",
+    "fontawesome_mapping",
+    "layout",
+    "png",
+    "stats",
+    "svg",
+    "waffle",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        value = getattr(import_module(_lazy_imports[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _submodules:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
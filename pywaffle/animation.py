@@ -0,0 +1,90 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Animation of waffle charts moving between values, built on Matplotlib FuncAnimation.
+# Every frame updates the existing blocks in place with Waffle.set_waffle_values and returns only the block artists,
+# so with blitting, the title, legend and other static elements are drawn once into the cached background.
+
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+import numpy as np
+
+from pywaffle.waffle import Waffle, get_waffle_blocks
+
+
+def interpolate_values(snapshots: Sequence, steps: int = 10) -> Iterator[List[float]]:
+    """
+    Yield values moving linearly from each snapshot to the next, as frames of animate_waffle.
+    There are steps frames from one snapshot to the next one, and the last frame is the last snapshot.
+    For example: snapshots=[[0, 10], [10, 0]], steps=2 -> [0, 10], [5, 5], [10, 0]
+
+    :param snapshots: Values of each snapshot, in list, dict or pandas.Series. All snapshots have the same length.
+    :param steps: Number of frames between two snapshots [Default 10]
+    """
+    snapshots = [
+        np.asarray(list(s.values()) if isinstance(s, dict) else list(s), dtype=float)
+        for s in snapshots
+    ]
+    for start, end in zip(snapshots, snapshots[1:]):
+        for ratio in np.arange(steps) / steps:
+            yield (start + (end - start) * ratio).tolist()
+    if snapshots:
+        yield snapshots[-1].tolist()
+
+
+def animate_waffle(
+    fig: Figure,
+    frames: Iterable,
+    ax: Optional[Axes] = None,
+    blit: bool = True,
+    **kwargs,
+) -> FuncAnimation:
+    """
+    Animate a waffle chart by updating its values in every frame.
+
+    ``animate_waffle(fig, frames=interpolate_values([[48, 46, 6], [30, 60, 10]]), interval=40)``
+
+    With blitting, all block artists are redrawn in every frame. Use engine 'collection' or 'raster' for charts with
+    many blocks, so there are only a few artists to draw. Parameters rows and columns should be both set, so the
+    grid, which is in the cached background, does not change between frames.
+
+    :param fig: The figure with the waffle chart
+    :type fig: matplotlib.figure.Figure
+
+    :param frames: Values of the chart in each frame, like the output of interpolate_values
+    :type frames: iterable
+
+    :param ax: The axis of the waffle chart. [Default None, which is the first waffle chart in the figure]
+    :type ax: matplotlib.axes.Axes, optional
+
+    :param blit: Whether blitting is used to only redraw blocks in each frame. [Default True]
+    :type blit: bool, optional
+
+    :param **kwargs: Other arguments of matplotlib.animation.FuncAnimation, like interval, repeat and save_count
+
+    :return: The animation. A reference to it should be kept until the animation is done.
+    :rtype: matplotlib.animation.FuncAnimation
+    """
+    if ax is None:
+        waffle_axes = [a for a in fig.axes if get_waffle_blocks(a) is not None]
+        if not waffle_axes:
+            raise ValueError("There is no waffle chart in the figure.")
+        ax = waffle_axes[0]
+    blocks = get_waffle_blocks(ax)
+    if blocks is None:
+        raise ValueError("There is no waffle chart on the axis.")
+
+    def init() -> List[Artist]:
+        return list(blocks.artists)
+
+    def update(values) -> List[Artist]:
+        Waffle.set_waffle_values(ax=ax, values=values)
+        return list(blocks.artists)
+
+    return FuncAnimation(
+        fig, update, frames=frames, init_func=init, blit=blit, **kwargs
+    )
@@ -0,0 +1,152 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Batch rendering of many waffle charts across a pool of worker processes.
+# Each worker loads matplotlib, fonts and the icon mapping once. Figures are created without pyplot, so no GUI backend
+# is involved and nothing is left open after saving.
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import PathLike
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+
+class BatchResult:
+    """
+    The result of rendering one chart in a batch
+
+    :param index: Position of the chart in the batch
+    :param target: Path of the output file
+    :param error: Formatted traceback if rendering failed, otherwise None
+    """
+
+    __slots__ = ("index", "target", "error")
+
+    def __init__(
+        self, index: int, target: Union[str, PathLike], error: Optional[str] = None
+    ):
+        self.index = index
+        self.target = target
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else "error"
+        return f"{type(self).__name__}(index={self.index}, target={self.target!r}, {status})"
+
+
+def _init_worker():
+    """
+    Load everything needed for rendering, so it is done once per worker instead of once per chart
+    """
+    # Importing waffle loads matplotlib figure, text and font manager modules
+    import pywaffle.waffle  # noqa: F401
+    from pywaffle.fontawesome_handler import (
+        FA_STYLES,
+        get_font_file,
+        get_legend_handler,
+    )
+    from pywaffle.fontawesome_mapping import icons
+
+    for style in FA_STYLES:
+        get_font_file(style)
+        get_legend_handler(style)
+    for style in icons:
+        icons[style].names
+
+
+def _render(
+    index: int, spec: Dict, target: Union[str, PathLike], savefig_kwargs: Dict
+) -> BatchResult:
+    """
+    Render one chart, capturing any error into the result
+    """
+    from pywaffle.waffle import Waffle
+
+    try:
+        fig = Waffle(**spec)
+        fig.savefig(target, **savefig_kwargs)
+    except Exception:
+        return BatchResult(index=index, target=target, error=traceback.format_exc())
+    return BatchResult(index=index, target=target)
+
+
+def render_batch(
+    specs: Iterable[Dict],
+    targets: Iterable[Union[str, PathLike]],
+    processes: Optional[int] = None,
+    progress: Optional[Callable[[int, int, BatchResult], None]] = None,
+    savefig_kwargs: Optional[Dict] = None,
+) -> List[BatchResult]:
+    """
+    Render many waffle charts into files in parallel.
+
+    ``render_batch(specs=[{"rows": 5, "values": [48, 46, 6]}], targets=["chart.png"])``
+
+    :param specs: Arguments of each chart in a dict, including Waffle arguments and Figure arguments like figsize
+    :type specs: iterable of dict
+
+    :param targets: Path of the output file of each chart. The format is decided by the file extension.
+        It should have the same length as specs.
+    :type targets: iterable of str or path-like object
+
+    :param processes: Number of worker processes. If it is 1, charts are rendered in the current process.
+        [Default None, which is the number of CPUs]
+    :type processes: int, optional
+
+    :param progress: A function called in the current process every time a chart is done,
+        with the number of finished charts, the number of all charts and the BatchResult of the chart.
+    :type progress: callable, optional
+
+    :param savefig_kwargs: Arguments passed to Figure.savefig for every chart, like dpi or bbox_inches.
+    :type savefig_kwargs: dict, optional
+
+    :return: BatchResult of each chart, in the same order as specs. Errors are captured in results instead of raised.
+    :rtype: list[BatchResult]
+    """
+    specs, targets = list(specs), list(targets)
+    if len(specs) != len(targets):
+        raise ValueError("Length of targets doesn't match the specs.")
+    jobs = list(zip(specs, targets))
+    savefig_kwargs = savefig_kwargs or {}
+    results: List[Optional[BatchResult]] = [None] * len(jobs)
+    finished = 0
+
+    def finish(result: BatchResult):
+        nonlocal finished
+        results[result.index] = result
+        finished += 1
+        if progress is not None:
+            progress(finished, len(jobs), result)
+
+    if processes == 1:
+        _init_worker()
+        for index, (spec, target) in enumerate(jobs):
+            finish(_render(index, spec, target, savefig_kwargs))
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker
+    ) as executor:
+        futures = {
+            executor.submit(_render, index, spec, target, savefig_kwargs): (
+                index,
+                target,
+            )
+            for index, (spec, target) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception:
+                # The worker failed outside of rendering, e.g. spec can't be pickled or the process died
+                index, target = futures[future]
+                result = BatchResult(
+                    index=index, target=target, error=traceback.format_exc()
+                )
+            finish(result)
+
+    return results
@@ -0,0 +1,251 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Process-wide caches of block layouts, font properties and glyph paths.
+# Objects returned from the caches are shared, so they should not be modified.
+# Matplotlib is only imported when fonts are used, so block layouts can be cached without loading it.
+
+from collections import OrderedDict
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+
+from pywaffle.layout import block_layout
+
+if TYPE_CHECKING:
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.textpath import TextPath
+
+
+class LRUCache:
+    """
+    A thread-safe cache keeping at most maxsize items. The least recently used item is evicted first.
+
+    :param maxsize: The maximum number of items to keep. If it is 0, nothing is kept.
+    :type maxsize: int
+
+    :param maxbytes: The maximum total size of items in bytes, as measured by sizeof. Items larger than it are not
+        kept. If it is None, items are only limited by maxsize.
+    :type maxbytes: int, optional
+
+    :param sizeof: A function returning the size of an item in bytes. It is required if maxbytes is set.
+    :type sizeof: callable, optional
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        maxbytes: Optional[int] = None,
+        sizeof: Optional[Callable] = None,
+    ):
+        if maxbytes is not None and sizeof is None:
+            raise ValueError("Argument sizeof is required if maxbytes is set.")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        #:Total size of cached items in bytes, if maxbytes is set
+        self.nbytes = 0
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, factory: Callable):
+        """
+        Return the cached item of key. If it is not cached, create it by calling factory() and cache it.
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+
+        value = factory()
+
+        size = 0
+        if self.maxbytes is not None:
+            size = self._sizeof(value)
+            # Items that could never fit are not cached, so they don't evict everything else
+            if size > self.maxbytes:
+                return value
+
+        with self._lock:
+            self._discard(key)
+            self._data[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def resize(self, maxsize: int, maxbytes: Optional[int] = None):
+        """
+        Change the maximum number of items, and the maximum total size if maxbytes is given, evicting the least
+        recently used ones if necessary
+        """
+        if maxbytes is not None and self._sizeof is None:
+            raise ValueError("Argument maxbytes requires sizeof of the cache.")
+        with self._lock:
+            self.maxsize = maxsize
+            if maxbytes is not None:
+                self.maxbytes = maxbytes
+            self._evict()
+
+    def clear(self):
+        """
+        Remove all items and reset the counters
+        """
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Return the statistics of the cache in a dict with keys hits, misses, size and maxsize
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+    def _discard(self, key: Hashable):
+        if key in self._data:
+            del self._data[key]
+            self.nbytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        while len(self._data) > max(self.maxsize, 0) or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        ):
+            key, _ = self._data.popitem(last=False)
+            self.nbytes -= self._sizes.pop(key)
+
+
+def arrays_nbytes(arrays: Tuple[np.ndarray, ...]) -> int:
+    """
+    Return the total size of arrays in bytes
+    """
+    return sum(array.nbytes for array in arrays)
+
+
+# Each block layout holds two arrays with one element per block, so it is also limited by bytes.
+# Grids of about 2 million blocks or more are not cached with the default limit.
+layout_cache = LRUCache(maxsize=128, maxbytes=64 * 1024 * 1024, sizeof=arrays_nbytes)
+font_properties_cache = LRUCache(maxsize=256)
+glyph_path_cache = LRUCache(maxsize=1024)
+
+
+def get_block_layout(
+    rows: int,
+    columns: int,
+    row_order: int,
+    column_order: int,
+    is_vertical: bool,
+    is_snake: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the shared column and row indexes of every block, as calculated by pywaffle.layout.block_layout.
+    The arrays are read-only.
+    """
+
+    def factory():
+        cols, rows_ = block_layout(
+            rows=rows,
+            columns=columns,
+            row_order=row_order,
+            column_order=column_order,
+            is_vertical=is_vertical,
+            is_snake=is_snake,
+        )
+        cols.flags.writeable = rows_.flags.writeable = False
+        return cols, rows_
+
+    return layout_cache.get(
+        key=(rows, columns, row_order, column_order, bool(is_vertical), bool(is_snake)),
+        factory=factory,
+    )
+
+
+# rcParams read by FontProperties when it is created. Families and styles only matter without a font file, and the
+# default size only matters if size is None or relative, like 'large'.
+FONT_RC_PARAMS = (
+    "font.family",
+    "font.style",
+    "font.variant",
+    "font.weight",
+    "font.stretch",
+    "font.serif",
+    "font.sans-serif",
+    "font.cursive",
+    "font.fantasy",
+    "font.monospace",
+)
+
+
+def font_rc_key(font_file: Optional[str], size: Union[int, float, str, None]) -> Tuple:
+    """
+    Return the values of rcParams that a FontProperties of given font file and size depends on, so cached fonts
+    follow rc_context and style sheets
+    """
+    from matplotlib import rcParams
+
+    params = () if font_file else FONT_RC_PARAMS
+    if size is None or isinstance(size, str):
+        params += ("font.size",)
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (rcParams[param] for param in params)
+    )
+
+
+def get_font_properties(
+    font_file: Optional[str] = None, size: Union[int, float, str, None] = None
+) -> "FontProperties":
+    """
+    Return a shared FontProperties of given font file and size, created with the current rcParams
+
+    :param font_file: path to the font file. If it is None, the default font is used
+    :param size: font size, either a relative size like 'large' or an absolute size in points
+    """
+    from matplotlib.font_manager import FontProperties
+
+    font_file = str(font_file) if font_file else None
+    return font_properties_cache.get(
+        key=(font_file, size, font_rc_key(font_file, size)),
+        factory=lambda: FontProperties(fname=font_file, size=size),
+    )
+
+
+def get_glyph_path(
+    font_file: Optional[str], text: str, size: Union[int, float, str, None] = None
+) -> "TextPath":
+    """
+    Return the shared outline of text in given font file and size, with the text anchor at (0, 0) and in units of
+    points
+
+    :param font_file: path to the font file. If it is None, the default font is used
+    :param text: the character or icon Unicode symbol
+    :param size: font size, either a relative size like 'large' or an absolute size in points
+    """
+    from matplotlib.textpath import TextPath
+
+    font_file = str(font_file) if font_file else None
+    return glyph_path_cache.get(
+        key=(font_file, text, size, font_rc_key(font_file, size)),
+        factory=lambda: TextPath(
+            (0, 0), text, prop=get_font_properties(font_file=font_file, size=size)
+        ),
+    )
@@ -0,0 +1,43 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Locations of Font Awesome font files in the fontawesomefree package.
+# It only uses the standard library, since it is imported by the mapping generator in setup.py before other
+# dependencies are installed.
+
+from functools import lru_cache
+import importlib.util
+import pathlib
+
+FA_STYLES = {
+    "brands": "Brands-Regular-400",
+    "solid": "Free-Solid-900",
+    "regular": "Free-Regular-400",
+}
+
+
+FONTAWESOME_PACKAGE_NAME = "fontawesomefree"
+
+
+@lru_cache(maxsize=None)
+def fontawesome_package_path() -> pathlib.Path:
+    """
+    Return the directory of the installed fontawesomefree package, without importing it
+    """
+    return pathlib.Path(
+        importlib.util.find_spec(FONTAWESOME_PACKAGE_NAME).origin
+    ).parent
+
+
+@lru_cache(maxsize=None)
+def font_file_finder():
+    font_otf_path = (fontawesome_package_path() / "static/fontawesomefree/otfs").glob(
+        "*.otf"
+    )
+    font_file_mapping = {
+        style: path
+        for path in font_otf_path
+        for style, font_suffix in FA_STYLES.items()
+        if font_suffix.lower() in path.name.lower()
+    }
+    return font_file_mapping
@@ -1,31 +1,36 @@
-# This script finds the path to fontawesome files, and creates necessary mappings and matplotlib handlers.
+# This script finds fontawesome font files with pywaffle.fontawesome_files, and creates matplotlib handlers.
 # They will only be called when fontawesome is used.
+# Font files and legend handlers are looked up on first use, and memoized for each style.
 
-import inspect
+from functools import lru_cache
 import pathlib
 
-import fontawesomefree
-import matplotlib.font_manager as fm
 from matplotlib.legend_handler import HandlerBase
 from matplotlib.text import Text
 
-FA_STYLES = {
-    "brands": "Brands-Regular-400",
-    "solid": "Free-Solid-900",
-    "regular": "Free-Regular-400",
-}
+from pywaffle.cache import get_font_properties
+from pywaffle.fontawesome_files import (  # noqa: F401
+    FA_STYLES,
+    FONTAWESOME_PACKAGE_NAME,
+    font_file_finder,
+    fontawesome_package_path,
+)
+
 
+@lru_cache(maxsize=None)
+def get_font_file(style: str) -> pathlib.Path:
+    """
+    Return the path to the font file of given style.
+    The path resolved when generating the icon mapping is used if the file exists, otherwise font files are searched
+    in the fontawesomefree package.
+    """
+    from pywaffle.fontawesome_mapping import font_files
 
-def font_file_finder():
-    package_path = pathlib.Path(inspect.getsourcefile(fontawesomefree))
-    font_otf_path = (package_path.parent / "static/fontawesomefree/otfs").glob("*.otf")
-    font_file_mapping = {
-        style: path
-        for path in font_otf_path
-        for style, font_suffix in FA_STYLES.items()
-        if font_suffix.lower() in path.name.lower()
-    }
-    return font_file_mapping
+    if style in font_files:
+        path = fontawesome_package_path() / font_files[style]
+        if path.is_file():
+            return path
+    return font_file_finder()[style]
 
 
 class TextLegendBase:
@@ -63,15 +68,30 @@ class TextLegendHandler(HandlerBase):
             "horizontalalignment": "center",
             "verticalalignment": "center",
             "color": orig_handle.color,
-            "fontproperties": fm.FontProperties(fname=self.font_file, size=fontsize),
+            "fontproperties": get_font_properties(
+                font_file=self.font_file, size=fontsize
+            ),
         }
         kwargs.update(orig_handle.kwargs)
         annotation = Text(x, y, orig_handle.text, **kwargs)
         return [annotation]
 
 
-fontawesome_files = font_file_finder()
-legend_handler_style_mapping = {
-    v: TextLegendHandler(font_file=fontawesome_files[k])
-    for k, v in legend_style_class_mapping.items()
-}
+@lru_cache(maxsize=None)
+def get_legend_handler(style: str) -> TextLegendHandler:
+    """
+    Return the legend handler drawing icons of given style
+    """
+    return TextLegendHandler(font_file=get_font_file(style))
+
+
+def __getattr__(name):
+    # fontawesome_files and legend_handler_style_mapping are kept for compatibility, and built on first access
+    if name == "fontawesome_files":
+        return {style: get_font_file(style) for style in FA_STYLES}
+    if name == "legend_handler_style_mapping":
+        return {
+            legend_class: get_legend_handler(style)
+            for style, legend_class in legend_style_class_mapping.items()
+        }
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Lookup structures of the Font Awesome icon mapping in pywaffle/fontawesome_mapping.py.
+# Each style is stored as two packed strings, and it is only unpacked on the first lookup of that style.
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+NAME_SEPARATOR = "\n"
+
+
+class StyleIcons(Mapping):
+    """
+    Icons of one style, mapping icon names to Unicode symbols
+
+    :param names: Sorted icon names joined by NAME_SEPARATOR
+    :type names: str
+
+    :param symbols: The Unicode symbol of every icon name, in the same order
+    :type symbols: str
+    """
+
+    def __init__(self, names: str, symbols: str):
+        self._packed_names = names
+        self._symbols = symbols
+        self._names: Optional[List[str]] = None
+
+    @property
+    def names(self) -> List[str]:
+        if self._names is None:
+            self._names = (
+                self._packed_names.split(NAME_SEPARATOR) if self._symbols else []
+            )
+        return self._names
+
+    def __getitem__(self, name: str) -> str:
+        index = bisect_left(self.names, name)
+        if index < len(self.names) and self.names[index] == name:
+            return self._symbols[index]
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+class IconIndex(Mapping):
+    """
+    Icons of all styles, mapping style names to StyleIcons
+
+    :param styles: Packed names and symbols of each style, with format like {style: (names, symbols), }
+    :type styles: dict
+    """
+
+    def __init__(self, styles: Dict[str, Tuple[str, str]]):
+        self._styles = styles
+        self._loaded: Dict[str, StyleIcons] = {}
+
+    def __getitem__(self, style: str) -> StyleIcons:
+        if style not in self._loaded:
+            self._loaded[style] = StyleIcons(*self._styles[style])
+        return self._loaded[style]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._styles)
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+
+def pack_style(mapping: Dict[str, str]) -> Tuple[str, str]:
+    """
+    Pack the icon mapping of one style into sorted names and symbols, as accepted by StyleIcons
+    """
+    names = sorted(mapping)
+    return NAME_SEPARATOR.join(names), "".join(mapping[name] for name in names)
@@ -1,2310 +1,541 @@
 # For Font Awesome version: 5.14.0
+# Generated by scripts/fontawesome_mapping_generator.py
 
-icons = {
-    "solid": {
-        "0": "\ue2d2",
-        "1": "\ue2d3",
-        "2": "\ue2d4",
-        "3": "\ue2d5",
-        "4": "\ue2d6",
-        "5": "\ue2d7",
-        "6": "\ue2d8",
-        "7": "\ue2d9",
-        "8": "\ue2da",
-        "9": "\ue2db",
-        "a": "\ue2dd",
-        "address-book": "\uf2b9",
-        "contact-book": "\uf2b9",
-        "address-card": "\uf2bb",
-        "contact-card": "\uf2bb",
-        "vcard": "\uf2bb",
-        "align-center": "\uf037",
-        "align-justify": "\uf039",
-        "align-left": "\uf036",
-        "align-right": "\uf038",
-        "anchor": "\uf13d",
-        "angle-down": "\uf107",
-        "angle-left": "\uf104",
-        "angle-right": "\uf105",
-        "angle-up": "\uf106",
-        "angles-down": "\uf103",
-        "angle-double-down": "\uf103",
-        "angles-left": "\uf100",
-        "angle-double-left": "\uf100",
-        "angles-right": "\uf101",
-        "angle-double-right": "\uf101",
-        "angles-up": "\uf102",
-        "angle-double-up": "\uf102",
-        "ankh": "\uf644",
-        "apple-whole": "\uf5d1",
-        "apple-alt": "\uf5d1",
-        "archway": "\uf557",
-        "arrow-down": "\uf063",
-        "arrow-down-1-9": "\uf162",
-        "sort-numeric-asc": "\uf162",
-        "sort-numeric-down": "\uf162",
-        "arrow-down-9-1": "\uf886",
-        "sort-numeric-desc": "\uf886",
-        "sort-numeric-down-alt": "\uf886",
-        "arrow-down-a-z": "\uf15d",
-        "sort-alpha-asc": "\uf15d",
-        "sort-alpha-down": "\uf15d",
-        "arrow-down-short-wide": "\uf884",
-        "sort-amount-desc": "\uf884",
-        "sort-amount-down-alt": "\uf884",
-        "arrow-down-wide-short": "\uf160",
-        "sort-amount-asc": "\uf160",
-        "sort-amount-down": "\uf160",
-        "arrow-down-z-a": "\uf881",
-        "sort-alpha-desc": "\uf881",
-        "sort-alpha-down-alt": "\uf881",
-        "arrow-left": "\uf060",
-        "arrow-pointer": "\uf245",
-        "mouse-pointer": "\uf245",
-        "arrow-right": "\uf061",
-        "arrow-rotate-left": "\uf0e2",
-        "arrow-left-rotate": "\uf0e2",
-        "arrow-rotate-back": "\uf0e2",
-        "arrow-rotate-backward": "\uf0e2",
-        "undo": "\uf0e2",
-        "arrow-rotate-right": "\uf01e",
-        "arrow-right-rotate": "\uf01e",
-        "arrow-rotate-forward": "\uf01e",
-        "redo": "\uf01e",
-        "arrow-trend-down": "\ue097",
-        "arrow-trend-up": "\ue098",
-        "arrow-up": "\uf062",
-        "arrow-up-1-9": "\uf163",
-        "sort-numeric-up": "\uf163",
-        "arrow-up-9-1": "\uf887",
-        "sort-numeric-up-alt": "\uf887",
-        "arrow-up-a-z": "\uf15e",
-        "sort-alpha-up": "\uf15e",
-        "arrow-up-from-bracket": "\ue09a",
-        "arrow-up-short-wide": "\uf885",
-        "sort-amount-up-alt": "\uf885",
-        "arrow-up-wide-short": "\uf161",
-        "sort-amount-up": "\uf161",
-        "arrow-up-z-a": "\uf882",
-        "sort-alpha-up-alt": "\uf882",
-        "arrows-rotate": "\uf021",
-        "refresh": "\uf021",
-        "sync": "\uf021",
-        "asterisk": "\uf069",
-        "at": "\uf1fa",
-        "atom": "\uf5d2",
-        "audio-description": "\uf29e",
-        "austral-sign": "\ue0a9",
-        "award": "\uf559",
-        "b": "\ue2e2",
-        "baby": "\uf77c",
-        "baby-carriage": "\uf77d",
-        "carriage-baby": "\uf77d",
-        "backward": "\uf04a",
-        "backward-fast": "\uf049",
-        "fast-backward": "\uf049",
-        "backward-step": "\uf048",
-        "step-backward": "\uf048",
-        "bacon": "\uf7e5",
-        "bacteria": "\ue059",
-        "bacterium": "\ue05a",
-        "bag-shopping": "\uf290",
-        "shopping-bag": "\uf290",
-        "bahai": "\uf666",
-        "baht-sign": "\ue0ac",
-        "ban": "\uf05e",
-        "cancel": "\uf05e",
-        "ban-smoking": "\uf54d",
-        "smoking-ban": "\uf54d",
-        "bandage": "\uf462",
-        "band-aid": "\uf462",
-        "bank": "\uf19c",
-        "institution": "\uf19c",
-        "university": "\uf19c",
-        "barcode": "\uf02a",
-        "bars": "\uf0c9",
-        "navicon": "\uf0c9",
-        "bars-staggered": "\uf550",
-        "reorder": "\uf550",
-        "stream": "\uf550",
-        "baseball": "\uf433",
-        "baseball-ball": "\uf433",
-        "basket-shopping": "\uf291",
-        "shopping-basket": "\uf291",
-        "basketball": "\uf434",
-        "basketball-ball": "\uf434",
-        "bath": "\uf2cd",
-        "bathtub": "\uf2cd",
-        "battery-empty": "\uf244",
-        "battery-0": "\uf244",
-        "battery-full": "\uf240",
-        "battery": "\uf240",
-        "battery-5": "\uf240",
-        "battery-half": "\uf242",
-        "battery-3": "\uf242",
-        "battery-quarter": "\uf243",
-        "battery-2": "\uf243",
-        "battery-three-quarters": "\uf241",
-        "battery-4": "\uf241",
-        "bed": "\uf236",
-        "bed-pulse": "\uf487",
-        "procedures": "\uf487",
-        "beer-mug-empty": "\uf0fc",
-        "beer": "\uf0fc",
-        "bell": "\uf0f3",
-        "bell-concierge": "\uf562",
-        "concierge-bell": "\uf562",
-        "bell-slash": "\uf1f6",
-        "bezier-curve": "\uf55b",
-        "bicycle": "\uf206",
-        "binoculars": "\uf1e5",
-        "biohazard": "\uf780",
-        "bitcoin-sign": "\ue0b4",
-        "blender": "\uf517",
-        "blender-phone": "\uf6b6",
-        "blog": "\uf781",
-        "bold": "\uf032",
-        "bolt": "\uf0e7",
-        "flash": "\uf0e7",
-        "bomb": "\uf1e2",
-        "bone": "\uf5d7",
-        "bong": "\uf55c",
-        "book": "\uf02d",
-        "book-atlas": "\uf558",
-        "atlas": "\uf558",
-        "book-bible": "\uf647",
-        "bible": "\uf647",
-        "book-journal-whills": "\uf66a",
-        "journal-whills": "\uf66a",
-        "book-medical": "\uf7e6",
-        "book-open": "\uf518",
-        "book-open-reader": "\uf5da",
-        "book-reader": "\uf5da",
-        "book-quran": "\uf687",
-        "quran": "\uf687",
-        "book-skull": "\uf6b7",
-        "book-dead": "\uf6b7",
-        "bookmark": "\uf02e",
-        "border-all": "\uf84c",
-        "border-none": "\uf850",
-        "border-top-left": "\uf853",
-        "border-style": "\uf853",
-        "bowling-ball": "\uf436",
-        "box": "\uf466",
-        "box-archive": "\uf187",
-        "archive": "\uf187",
-        "box-open": "\uf49e",
-        "box-tissue": "\ue05b",
-        "boxes-stacked": "\uf468",
-        "boxes": "\uf468",
-        "boxes-alt": "\uf468",
-        "braille": "\uf2a1",
-        "brain": "\uf5dc",
-        "bread-slice": "\uf7ec",
-        "briefcase": "\uf0b1",
-        "briefcase-clock": "\uf64a",
-        "business-time": "\uf64a",
-        "briefcase-medical": "\uf469",
-        "broom": "\uf51a",
-        "brush": "\uf55d",
-        "bug": "\uf188",
-        "building": "\uf1ad",
-        "bullhorn": "\uf0a1",
-        "bullseye": "\uf140",
-        "burger": "\uf805",
-        "hamburger": "\uf805",
-        "bus": "\uf207",
-        "bus-simple": "\uf55e",
-        "bus-alt": "\uf55e",
-        "c": "\ue2f3",
-        "cake-candles": "\uf1fd",
-        "birthday-cake": "\uf1fd",
-        "calculator": "\uf1ec",
-        "calendar": "\uf133",
-        "calendar-check": "\uf274",
-        "calendar-day": "\uf783",
-        "calendar-days": "\uf073",
-        "calendar-alt": "\uf073",
-        "calendar-minus": "\uf272",
-        "calendar-plus": "\uf271",
-        "calendar-week": "\uf784",
-        "calendar-xmark": "\uf273",
-        "calendar-times": "\uf273",
-        "camera": "\uf030",
-        "camera-alt": "\uf030",
-        "camera-retro": "\uf083",
-        "camera-rotate": "\ue0d8",
-        "campground": "\uf6bb",
-        "candy-cane": "\uf786",
-        "cannabis": "\uf55f",
-        "capsules": "\uf46b",
-        "car": "\uf1b9",
-        "automobile": "\uf1b9",
-        "car-battery": "\uf5df",
-        "battery-car": "\uf5df",
-        "car-crash": "\uf5e1",
-        "car-rear": "\uf5de",
-        "car-alt": "\uf5de",
-        "car-side": "\uf5e4",
-        "caravan": "\uf8ff",
-        "caret-down": "\uf0d7",
-        "caret-left": "\uf0d9",
-        "caret-right": "\uf0da",
-        "caret-up": "\uf0d8",
-        "carrot": "\uf787",
-        "cart-arrow-down": "\uf218",
-        "cart-flatbed": "\uf474",
-        "dolly-flatbed": "\uf474",
-        "cart-flatbed-suitcase": "\uf59d",
-        "luggage-cart": "\uf59d",
-        "cart-plus": "\uf217",
-        "cart-shopping": "\uf07a",
-        "shopping-cart": "\uf07a",
-        "cash-register": "\uf788",
-        "cat": "\uf6be",
-        "cedi-sign": "\ue0df",
-        "cent-sign": "\ue0e0",
-        "certificate": "\uf0a3",
-        "chair": "\uf6c0",
-        "chalkboard": "\uf51b",
-        "blackboard": "\uf51b",
-        "chalkboard-user": "\uf51c",
-        "chalkboard-teacher": "\uf51c",
-        "champagne-glasses": "\uf79f",
-        "glass-cheers": "\uf79f",
-        "charging-station": "\uf5e7",
-        "chart-area": "\uf1fe",
-        "area-chart": "\uf1fe",
-        "chart-bar": "\uf080",
-        "bar-chart": "\uf080",
-        "chart-gantt": "\ue0e4",
-        "chart-line": "\uf201",
-        "line-chart": "\uf201",
-        "chart-pie": "\uf200",
-        "pie-chart": "\uf200",
-        "check": "\uf00c",
-        "check-double": "\uf560",
-        "check-to-slot": "\uf772",
-        "vote-yea": "\uf772",
-        "cheese": "\uf7ef",
-        "chess": "\uf439",
-        "chess-bishop": "\uf43a",
-        "chess-board": "\uf43c",
-        "chess-king": "\uf43f",
-        "chess-knight": "\uf441",
-        "chess-pawn": "\uf443",
-        "chess-queen": "\uf445",
-        "chess-rook": "\uf447",
-        "chevron-down": "\uf078",
-        "chevron-left": "\uf053",
-        "chevron-right": "\uf054",
-        "chevron-up": "\uf077",
-        "child": "\uf1ae",
-        "church": "\uf51d",
-        "circle": "\uf111",
-        "circle-arrow-down": "\uf0ab",
-        "arrow-circle-down": "\uf0ab",
-        "circle-arrow-left": "\uf0a8",
-        "arrow-circle-left": "\uf0a8",
-        "circle-arrow-right": "\uf0a9",
-        "arrow-circle-right": "\uf0a9",
-        "circle-arrow-up": "\uf0aa",
-        "arrow-circle-up": "\uf0aa",
-        "circle-check": "\uf058",
-        "check-circle": "\uf058",
-        "circle-chevron-down": "\uf13a",
-        "chevron-circle-down": "\uf13a",
-        "circle-chevron-left": "\uf137",
-        "chevron-circle-left": "\uf137",
-        "circle-chevron-right": "\uf138",
-        "chevron-circle-right": "\uf138",
-        "circle-chevron-up": "\uf139",
-        "chevron-circle-up": "\uf139",
-        "circle-dollar-to-slot": "\uf4b9",
-        "donate": "\uf4b9",
-        "circle-dot": "\uf192",
-        "dot-circle": "\uf192",
-        "circle-down": "\uf358",
-        "arrow-alt-circle-down": "\uf358",
-        "circle-exclamation": "\uf06a",
-        "exclamation-circle": "\uf06a",
-        "circle-h": "\uf47e",
-        "hospital-symbol": "\uf47e",
-        "circle-half-stroke": "\uf042",
-        "adjust": "\uf042",
-        "circle-info": "\uf05a",
-        "info-circle": "\uf05a",
-        "circle-left": "\uf359",
-        "arrow-alt-circle-left": "\uf359",
-        "circle-minus": "\uf056",
-        "minus-circle": "\uf056",
-        "circle-notch": "\uf1ce",
-        "circle-pause": "\uf28b",
-        "pause-circle": "\uf28b",
-        "circle-play": "\uf144",
-        "play-circle": "\uf144",
-        "circle-plus": "\uf055",
-        "plus-circle": "\uf055",
-        "circle-question": "\uf059",
-        "question-circle": "\uf059",
-        "circle-radiation": "\uf7ba",
-        "radiation-alt": "\uf7ba",
-        "circle-right": "\uf35a",
-        "arrow-alt-circle-right": "\uf35a",
-        "circle-stop": "\uf28d",
-        "stop-circle": "\uf28d",
-        "circle-up": "\uf35b",
-        "arrow-alt-circle-up": "\uf35b",
-        "circle-user": "\uf2bd",
-        "user-circle": "\uf2bd",
-        "circle-xmark": "\uf057",
-        "times-circle": "\uf057",
-        "xmark-circle": "\uf057",
-        "city": "\uf64f",
-        "clapperboard": "\ue131",
-        "clipboard": "\uf328",
-        "clipboard-check": "\uf46c",
-        "clipboard-list": "\uf46d",
-        "clock": "\ue33e",
-        "clock-four": "\ue33e",
-        "clock-rotate-left": "\uf1da",
-        "history": "\uf1da",
-        "clone": "\uf24d",
-        "closed-captioning": "\uf20a",
-        "cloud": "\uf0c2",
-        "cloud-arrow-down": "\uf0ed",
-        "cloud-download": "\uf0ed",
-        "cloud-download-alt": "\uf0ed",
-        "cloud-arrow-up": "\uf0ee",
-        "cloud-upload": "\uf0ee",
-        "cloud-upload-alt": "\uf0ee",
-        "cloud-meatball": "\uf73b",
-        "cloud-moon": "\uf6c3",
-        "cloud-moon-rain": "\uf73c",
-        "cloud-rain": "\uf73d",
-        "cloud-showers-heavy": "\uf740",
-        "cloud-sun": "\uf6c4",
-        "cloud-sun-rain": "\uf743",
-        "clover": "\ue139",
-        "code": "\uf121",
-        "code-branch": "\uf126",
-        "code-commit": "\uf386",
-        "code-compare": "\ue13a",
-        "code-fork": "\ue13b",
-        "code-merge": "\uf387",
-        "code-pull-request": "\ue13c",
-        "coins": "\uf51e",
-        "colon-sign": "\ue140",
-        "comment": "\uf075",
-        "comment-dollar": "\uf651",
-        "comment-dots": "\uf4ad",
-        "commenting": "\uf4ad",
-        "comment-medical": "\uf7f5",
-        "comment-slash": "\uf4b3",
-        "comment-sms": "\uf7cd",
-        "sms": "\uf7cd",
-        "comments": "\uf086",
-        "comments-dollar": "\uf653",
-        "compact-disc": "\uf51f",
-        "compass": "\uf14e",
-        "compass-drafting": "\uf568",
-        "drafting-compass": "\uf568",
-        "compress": "\uf066",
-        "computer-mouse": "\uf8cc",
-        "mouse": "\uf8cc",
-        "cookie": "\uf563",
-        "cookie-bite": "\uf564",
-        "copy": "\uf0c5",
-        "copyright": "\uf1f9",
-        "couch": "\uf4b8",
-        "credit-card": "\uf09d",
-        "credit-card-alt": "\uf09d",
-        "crop": "\uf125",
-        "crop-simple": "\uf565",
-        "crop-alt": "\uf565",
-        "cross": "\uf654",
-        "crosshairs": "\uf05b",
-        "crow": "\uf520",
-        "crown": "\uf521",
-        "crutch": "\uf7f7",
-        "cruzeiro-sign": "\ue152",
-        "cube": "\uf1b2",
-        "cubes": "\uf1b3",
-        "d": "\ue2f9",
-        "database": "\uf1c0",
-        "delete-left": "\uf55a",
-        "backspace": "\uf55a",
-        "democrat": "\uf747",
-        "desktop": "\uf108",
-        "desktop-alt": "\uf108",
-        "dharmachakra": "\uf655",
-        "diagram-project": "\uf542",
-        "project-diagram": "\uf542",
-        "diamond-turn-right": "\uf5eb",
-        "directions": "\uf5eb",
-        "dice": "\uf522",
-        "dice-d20": "\uf6cf",
-        "dice-d6": "\uf6d1",
-        "dice-five": "\uf523",
-        "dice-four": "\uf524",
-        "dice-one": "\uf525",
-        "dice-six": "\uf526",
-        "dice-three": "\uf527",
-        "dice-two": "\uf528",
-        "disease": "\uf7fa",
-        "divide": "\uf529",
-        "dna": "\uf471",
-        "dog": "\uf6d3",
-        "dollar-sign": "\uf155",
-        "dollar": "\uf155",
-        "usd": "\uf155",
-        "dolly": "\uf472",
-        "dolly-box": "\uf472",
-        "dong-sign": "\ue169",
-        "door-closed": "\uf52a",
-        "door-open": "\uf52b",
-        "dove": "\uf4ba",
-        "down-left-and-up-right-to-center": "\uf422",
-        "compress-alt": "\uf422",
-        "down-long": "\uf309",
-        "long-arrow-alt-down": "\uf309",
-        "download": "\uf019",
-        "dragon": "\uf6d5",
-        "draw-polygon": "\uf5ee",
-        "droplet": "\uf043",
-        "tint": "\uf043",
-        "droplet-slash": "\uf5c7",
-        "tint-slash": "\uf5c7",
-        "drum": "\uf569",
-        "drum-steelpan": "\uf56a",
-        "drumstick-bite": "\uf6d7",
-        "dumbbell": "\uf44b",
-        "dumpster": "\uf793",
-        "dumpster-fire": "\uf794",
-        "dungeon": "\uf6d9",
-        "e": "\ue2fc",
-        "ear-deaf": "\uf2a4",
-        "deaf": "\uf2a4",
-        "deafness": "\uf2a4",
-        "hard-of-hearing": "\uf2a4",
-        "ear-listen": "\uf2a2",
-        "assistive-listening-systems": "\uf2a2",
-        "earth-africa": "\uf57c",
-        "globe-africa": "\uf57c",
-        "earth-americas": "\uf57d",
-        "earth": "\uf57d",
-        "globe-americas": "\uf57d",
-        "earth-asia": "\uf57e",
-        "globe-asia": "\uf57e",
-        "earth-europa": "\uf7a2",
-        "globe-europe": "\uf7a2",
-        "egg": "\uf7fb",
-        "eject": "\uf052",
-        "elevator": "\ue16d",
-        "ellipsis": "\uf141",
-        "ellipsis-h": "\uf141",
-        "ellipsis-vertical": "\uf142",
-        "ellipsis-v": "\uf142",
-        "envelope": "\uf0e0",
-        "envelope-open": "\uf2b6",
-        "envelope-open-text": "\uf658",
-        "envelopes-bulk": "\uf674",
-        "mail-bulk": "\uf674",
-        "equals": "\uf52c",
-        "eraser": "\uf12d",
-        "ethernet": "\uf796",
-        "euro-sign": "\uf153",
-        "eur": "\uf153",
-        "euro": "\uf153",
-        "exclamation": "\uf12a",
-        "expand": "\uf065",
-        "eye": "\uf06e",
-        "eye-dropper": "\uf1fb",
-        "eye-dropper-empty": "\uf1fb",
-        "eyedropper": "\uf1fb",
-        "eye-low-vision": "\uf2a8",
-        "low-vision": "\uf2a8",
-        "eye-slash": "\uf070",
-        "f": "\ue2fd",
-        "face-angry": "\uf556",
-        "angry": "\uf556",
-        "face-dizzy": "\uf567",
-        "dizzy": "\uf567",
-        "face-flushed": "\uf579",
-        "flushed": "\uf579",
-        "face-frown": "\uf119",
-        "frown": "\uf119",
-        "face-frown-open": "\uf57a",
-        "frown-open": "\uf57a",
-        "face-grimace": "\uf57f",
-        "grimace": "\uf57f",
-        "face-grin": "\uf580",
-        "grin": "\uf580",
-        "face-grin-beam": "\uf582",
-        "grin-beam": "\uf582",
-        "face-grin-beam-sweat": "\uf583",
-        "grin-beam-sweat": "\uf583",
-        "face-grin-hearts": "\uf584",
-        "grin-hearts": "\uf584",
-        "face-grin-squint": "\uf585",
-        "grin-squint": "\uf585",
-        "face-grin-squint-tears": "\uf586",
-        "grin-squint-tears": "\uf586",
-        "face-grin-stars": "\uf587",
-        "grin-stars": "\uf587",
-        "face-grin-tears": "\uf588",
-        "grin-tears": "\uf588",
-        "face-grin-tongue": "\uf589",
-        "grin-tongue": "\uf589",
-        "face-grin-tongue-squint": "\uf58a",
-        "grin-tongue-squint": "\uf58a",
-        "face-grin-tongue-wink": "\uf58b",
-        "grin-tongue-wink": "\uf58b",
-        "face-grin-wide": "\uf581",
-        "grin-alt": "\uf581",
-        "face-grin-wink": "\uf58c",
-        "grin-wink": "\uf58c",
-        "face-kiss": "\uf596",
-        "kiss": "\uf596",
-        "face-kiss-beam": "\uf597",
-        "kiss-beam": "\uf597",
-        "face-kiss-wink-heart": "\uf598",
-        "kiss-wink-heart": "\uf598",
-        "face-laugh": "\uf599",
-        "laugh": "\uf599",
-        "face-laugh-beam": "\uf59a",
-        "laugh-beam": "\uf59a",
-        "face-laugh-squint": "\uf59b",
-        "laugh-squint": "\uf59b",
-        "face-laugh-wink": "\uf59c",
-        "laugh-wink": "\uf59c",
-        "face-meh": "\uf11a",
-        "meh": "\uf11a",
-        "face-meh-blank": "\uf5a4",
-        "meh-blank": "\uf5a4",
-        "face-rolling-eyes": "\uf5a5",
-        "meh-rolling-eyes": "\uf5a5",
-        "face-sad-cry": "\uf5b3",
-        "sad-cry": "\uf5b3",
-        "face-sad-tear": "\uf5b4",
-        "sad-tear": "\uf5b4",
-        "face-smile": "\uf118",
-        "smile": "\uf118",
-        "face-smile-beam": "\uf5b8",
-        "smile-beam": "\uf5b8",
-        "face-smile-wink": "\uf4da",
-        "smile-wink": "\uf4da",
-        "face-surprise": "\uf5c2",
-        "surprise": "\uf5c2",
-        "face-tired": "\uf5c8",
-        "tired": "\uf5c8",
-        "fan": "\uf863",
-        "faucet": "\ue005",
-        "fax": "\uf1ac",
-        "feather": "\uf52d",
-        "feather-pointed": "\uf56b",
-        "feather-alt": "\uf56b",
-        "file": "\uf15b",
-        "file-arrow-down": "\uf56d",
-        "file-download": "\uf56d",
-        "file-arrow-up": "\uf574",
-        "file-upload": "\uf574",
-        "file-audio": "\uf1c7",
-        "file-code": "\uf1c9",
-        "file-contract": "\uf56c",
-        "file-csv": "\uf6dd",
-        "file-excel": "\uf1c3",
-        "file-export": "\uf56e",
-        "arrow-right-from-file": "\uf56e",
-        "file-image": "\uf1c5",
-        "file-import": "\uf56f",
-        "arrow-right-to-file": "\uf56f",
-        "file-invoice": "\uf570",
-        "file-invoice-dollar": "\uf571",
-        "file-lines": "\uf15c",
-        "file-alt": "\uf15c",
-        "file-text": "\uf15c",
-        "file-medical": "\uf477",
-        "file-pdf": "\uf1c1",
-        "file-powerpoint": "\uf1c4",
-        "file-prescription": "\uf572",
-        "file-signature": "\uf573",
-        "file-video": "\uf1c8",
-        "file-waveform": "\uf478",
-        "file-medical-alt": "\uf478",
-        "file-word": "\uf1c2",
-        "file-zipper": "\uf1c6",
-        "file-archive": "\uf1c6",
-        "fill": "\uf575",
-        "fill-drip": "\uf576",
-        "film": "\uf008",
-        "filter": "\uf0b0",
-        "filter-circle-dollar": "\uf662",
-        "funnel-dollar": "\uf662",
-        "filter-circle-xmark": "\ue17b",
-        "fingerprint": "\uf577",
-        "fire": "\uf06d",
-        "fire-extinguisher": "\uf134",
-        "fire-flame-curved": "\uf7e4",
-        "fire-alt": "\uf7e4",
-        "fire-flame-simple": "\uf46a",
-        "burn": "\uf46a",
-        "fish": "\uf578",
-        "flag": "\uf024",
-        "flag-checkered": "\uf11e",
-        "flag-usa": "\uf74d",
-        "flask": "\uf0c3",
-        "floppy-disk": "\uf0c7",
-        "save": "\uf0c7",
-        "florin-sign": "\ue184",
-        "folder": "\uf07b",
-        "folder-minus": "\uf65d",
-        "folder-open": "\uf07c",
-        "folder-plus": "\uf65e",
-        "folder-tree": "\uf802",
-        "font": "\uf031",
-        "font-awesome": "\uf2b4",
-        "font-awesome-flag": "\uf2b4",
-        "font-awesome-logo-full": "\uf2b4",
-        "football": "\uf44e",
-        "football-ball": "\uf44e",
-        "forward": "\uf04e",
-        "forward-fast": "\uf050",
-        "fast-forward": "\uf050",
-        "forward-step": "\uf051",
-        "step-forward": "\uf051",
-        "franc-sign": "\ue18f",
-        "frog": "\uf52e",
-        "futbol": "\uf1e3",
-        "futbol-ball": "\uf1e3",
-        "soccer-ball": "\uf1e3",
-        "g": "\ue305",
-        "gamepad": "\uf11b",
-        "gas-pump": "\uf52f",
-        "gauge-simple": "\uf62a",
-        "gauge-simple-high": "\uf62a",
-        "tachometer": "\uf62a",
-        "gavel": "\uf0e3",
-        "legal": "\uf0e3",
-        "gear": "\uf013",
-        "cog": "\uf013",
-        "gears": "\uf085",
-        "cogs": "\uf085",
-        "gem": "\uf3a5",
-        "genderless": "\uf22d",
-        "ghost": "\uf6e2",
-        "gift": "\uf06b",
-        "gifts": "\uf79c",
-        "glasses": "\uf530",
-        "globe": "\uf0ac",
-        "golf-ball-tee": "\uf450",
-        "golf-ball": "\uf450",
-        "gopuram": "\uf664",
-        "graduation-cap": "\uf19d",
-        "mortar-board": "\uf19d",
-        "greater-than": "\uf531",
-        "greater-than-equal": "\uf532",
-        "grip": "\uf58d",
-        "grip-horizontal": "\uf58d",
-        "grip-lines": "\uf7a4",
-        "grip-lines-vertical": "\uf7a5",
-        "grip-vertical": "\uf58e",
-        "guarani-sign": "\ue19a",
-        "guitar": "\uf7a6",
-        "gun": "\ue19b",
-        "h": "\ue308",
-        "hammer": "\uf6e3",
-        "hamsa": "\uf665",
-        "hand": "\uf256",
-        "hand-paper": "\uf256",
-        "hand-back-fist": "\uf255",
-        "hand-rock": "\uf255",
-        "hand-dots": "\uf461",
-        "allergies": "\uf461",
-        "hand-fist": "\uf6de",
-        "fist-raised": "\uf6de",
-        "hand-holding": "\uf4bd",
-        "hand-holding-dollar": "\uf4c0",
-        "hand-holding-usd": "\uf4c0",
-        "hand-holding-droplet": "\uf4c1",
-        "hand-holding-water": "\uf4c1",
-        "hand-holding-heart": "\uf4be",
-        "hand-holding-medical": "\ue05c",
-        "hand-lizard": "\uf258",
-        "hand-middle-finger": "\uf806",
-        "hand-peace": "\uf25b",
-        "hand-point-down": "\uf0a7",
-        "hand-point-left": "\uf0a5",
-        "hand-point-right": "\uf0a4",
-        "hand-point-up": "\uf0a6",
-        "hand-pointer": "\uf25a",
-        "hand-scissors": "\uf257",
-        "hand-sparkles": "\ue05d",
-        "hand-spock": "\uf259",
-        "hands": "\uf2a7",
-        "sign-language": "\uf2a7",
-        "signing": "\uf2a7",
-        "hands-asl-interpreting": "\uf2a3",
-        "american-sign-language-interpreting": "\uf2a3",
-        "asl-interpreting": "\uf2a3",
-        "hands-american-sign-language-interpreting": "\uf2a3",
-        "hands-bubbles": "\ue05e",
-        "hands-wash": "\ue05e",
-        "hands-clapping": "\ue1a8",
-        "hands-holding": "\uf4c2",
-        "hands-praying": "\uf684",
-        "praying-hands": "\uf684",
-        "handshake": "\uf2b5",
-        "handshake-angle": "\uf4c4",
-        "hands-helping": "\uf4c4",
-        "handshake-simple-slash": "\ue05f",
-        "handshake-alt-slash": "\ue05f",
-        "handshake-slash": "\ue060",
-        "hanukiah": "\uf6e6",
-        "hard-drive": "\uf0a0",
-        "hdd": "\uf0a0",
-        "hashtag": "\uf292",
-        "hat-cowboy": "\uf8c0",
-        "hat-cowboy-side": "\uf8c1",
-        "hat-wizard": "\uf6e8",
-        "head-side-cough": "\ue061",
-        "head-side-cough-slash": "\ue062",
-        "head-side-mask": "\ue063",
-        "head-side-virus": "\ue064",
-        "heading": "\uf1dc",
-        "header": "\uf1dc",
-        "headphones": "\uf025",
-        "headphones-simple": "\uf58f",
-        "headphones-alt": "\uf58f",
-        "headset": "\uf590",
-        "heart": "\uf004",
-        "heart-crack": "\uf7a9",
-        "heart-broken": "\uf7a9",
-        "heart-pulse": "\uf21e",
-        "heartbeat": "\uf21e",
-        "helicopter": "\uf533",
-        "helmet-safety": "\uf807",
-        "hard-hat": "\uf807",
-        "hat-hard": "\uf807",
-        "highlighter": "\uf591",
-        "hippo": "\uf6ed",
-        "hockey-puck": "\uf453",
-        "holly-berry": "\uf7aa",
-        "horse": "\uf6f0",
-        "horse-head": "\uf7ab",
-        "hospital": "\uf0f8",
-        "hospital-user": "\uf80d",
-        "hospital-wide": "\uf47d",
-        "hospital-alt": "\uf47d",
-        "hot-tub-person": "\uf593",
-        "hot-tub": "\uf593",
-        "hotdog": "\uf80f",
-        "hotel": "\uf594",
-        "hourglass": "\uf254",
-        "hourglass-2": "\uf254",
-        "hourglass-half": "\uf254",
-        "hourglass-empty": "\uf252",
-        "hourglass-end": "\uf253",
-        "hourglass-3": "\uf253",
-        "hourglass-start": "\uf251",
-        "hourglass-1": "\uf251",
-        "house": "\uf015",
-        "home": "\uf015",
-        "house-chimney": "\ue340",
-        "home-lg": "\ue340",
-        "house-crack": "\ue341",
-        "house-laptop": "\ue066",
-        "laptop-house": "\ue066",
-        "house-medical": "\ue342",
-        "house-user": "\ue1b0",
-        "home-user": "\ue1b0",
-        "hryvnia-sign": "\uf6f2",
-        "hryvnia": "\uf6f2",
-        "i": "\ue309",
-        "i-cursor": "\uf246",
-        "ice-cream": "\uf810",
-        "icicles": "\uf7ad",
-        "icons": "\uf86d",
-        "heart-music-camera-bolt": "\uf86d",
-        "id-badge": "\uf2c1",
-        "id-card": "\uf2c2",
-        "drivers-license": "\uf2c2",
-        "id-card-clip": "\uf47f",
-        "id-card-alt": "\uf47f",
-        "igloo": "\uf7ae",
-        "image": "\uf03e",
-        "image-portrait": "\uf3e0",
-        "portrait": "\uf3e0",
-        "images": "\uf302",
-        "inbox": "\uf01c",
-        "indent": "\uf03c",
-        "indian-rupee-sign": "\ue1bc",
-        "indian-rupee": "\ue1bc",
-        "inr": "\ue1bc",
-        "industry": "\uf275",
-        "infinity": "\uf534",
-        "info": "\uf129",
-        "italic": "\uf033",
-        "j": "\ue30a",
-        "jedi": "\uf669",
-        "jet-fighter": "\uf0fb",
-        "fighter-jet": "\uf0fb",
-        "joint": "\uf595",
-        "k": "\ue30b",
-        "kaaba": "\uf66b",
-        "key": "\uf084",
-        "keyboard": "\uf11c",
-        "khanda": "\uf66d",
-        "kip-sign": "\ue1c4",
-        "kit-medical": "\uf479",
-        "first-aid": "\uf479",
-        "kiwi-bird": "\uf535",
-        "l": "\ue30d",
-        "landmark": "\uf66f",
-        "language": "\uf1ab",
-        "laptop": "\uf109",
-        "laptop-code": "\uf5fc",
-        "laptop-medical": "\uf812",
-        "lari-sign": "\ue1c8",
-        "layer-group": "\uf5fd",
-        "leaf": "\uf06c",
-        "left-long": "\uf30a",
-        "long-arrow-alt-left": "\uf30a",
-        "left-right": "\uf337",
-        "arrows-alt-h": "\uf337",
-        "lemon": "\uf094",
-        "less-than": "\uf536",
-        "less-than-equal": "\uf537",
-        "life-ring": "\uf1cd",
-        "lightbulb": "\uf0eb",
-        "link": "\uf0c1",
-        "chain": "\uf0c1",
-        "link-slash": "\uf127",
-        "chain-broken": "\uf127",
-        "chain-slash": "\uf127",
-        "unlink": "\uf127",
-        "lira-sign": "\uf195",
-        "list": "\uf03a",
-        "list-squares": "\uf03a",
-        "list-check": "\uf0ae",
-        "tasks": "\uf0ae",
-        "list-ol": "\uf0cb",
-        "list-1-2": "\uf0cb",
-        "list-numeric": "\uf0cb",
-        "list-ul": "\uf0ca",
-        "list-dots": "\uf0ca",
-        "litecoin-sign": "\ue1d3",
-        "location": "\uf041",
-        "map-marker": "\uf041",
-        "location-arrow": "\uf124",
-        "location-dot": "\uf3c5",
-        "map-marker-alt": "\uf3c5",
-        "lock": "\uf023",
-        "lock-open": "\uf3c1",
-        "lungs": "\uf604",
-        "lungs-virus": "\ue067",
-        "m": "\ue30e",
-        "magnet": "\uf076",
-        "magnifying-glass": "\uf002",
-        "search": "\uf002",
-        "magnifying-glass-dollar": "\uf688",
-        "search-dollar": "\uf688",
-        "magnifying-glass-location": "\uf689",
-        "search-location": "\uf689",
-        "magnifying-glass-minus": "\uf010",
-        "search-minus": "\uf010",
-        "magnifying-glass-plus": "\uf00e",
-        "search-plus": "\uf00e",
-        "manat-sign": "\ue1d5",
-        "map": "\uf279",
-        "map-location": "\uf59f",
-        "map-marked": "\uf59f",
-        "map-location-dot": "\uf5a0",
-        "map-marked-alt": "\uf5a0",
-        "map-pin": "\uf276",
-        "marker": "\uf5a1",
-        "mars": "\uf222",
-        "mars-and-venus": "\ue343",
-        "mars-double": "\uf227",
-        "mars-stroke": "\uf229",
-        "mars-stroke-right": "\uf22b",
-        "mars-stroke-h": "\uf22b",
-        "mars-stroke-up": "\uf22a",
-        "mars-stroke-v": "\uf22a",
-        "martini-glass": "\uf57b",
-        "glass-martini-alt": "\uf57b",
-        "martini-glass-citrus": "\uf561",
-        "cocktail": "\uf561",
-        "martini-glass-empty": "\uf000",
-        "glass-martini": "\uf000",
-        "mask": "\uf6fa",
-        "mask-face": "\ue1d7",
-        "masks-theater": "\uf630",
-        "theater-masks": "\uf630",
-        "maximize": "\uf31e",
-        "expand-arrows-alt": "\uf31e",
-        "medal": "\uf5a2",
-        "memory": "\uf538",
-        "menorah": "\uf676",
-        "mercury": "\uf223",
-        "message": "\uf27a",
-        "comment-alt": "\uf27a",
-        "meteor": "\uf753",
-        "microchip": "\uf2db",
-        "microphone": "\uf130",
-        "microphone-lines": "\uf3c9",
-        "microphone-alt": "\uf3c9",
-        "microphone-lines-slash": "\uf539",
-        "microphone-alt-slash": "\uf539",
-        "microphone-slash": "\uf131",
-        "microscope": "\uf610",
-        "mill-sign": "\ue1ed",
-        "minimize": "\uf78c",
-        "compress-arrows-alt": "\uf78c",
-        "minus": "\uf068",
-        "subtract": "\uf068",
-        "mitten": "\uf7b5",
-        "mobile-button": "\uf10b",
-        "mobile-screen-button": "\uf3cd",
-        "mobile-alt": "\uf3cd",
-        "money-bill": "\uf0d6",
-        "money-bill-1": "\uf3d1",
-        "money-bill-alt": "\uf3d1",
-        "money-bill-1-wave": "\uf53b",
-        "money-bill-wave-alt": "\uf53b",
-        "money-bill-wave": "\uf53a",
-        "money-check": "\uf53c",
-        "money-check-dollar": "\uf53d",
-        "money-check-alt": "\uf53d",
-        "monument": "\uf5a6",
-        "moon": "\uf186",
-        "mortar-pestle": "\uf5a7",
-        "mosque": "\uf678",
-        "motorcycle": "\uf21c",
-        "mountain": "\uf6fc",
-        "mug-hot": "\uf7b6",
-        "mug-saucer": "\uf0f4",
-        "coffee": "\uf0f4",
-        "music": "\uf001",
-        "n": "\ue314",
-        "naira-sign": "\ue1f6",
-        "network-wired": "\uf6ff",
-        "neuter": "\uf22c",
-        "newspaper": "\uf1ea",
-        "not-equal": "\uf53e",
-        "note-sticky": "\uf249",
-        "sticky-note": "\uf249",
-        "notes-medical": "\uf481",
-        "o": "\ue315",
-        "object-group": "\uf247",
-        "object-ungroup": "\uf248",
-        "oil-can": "\uf613",
-        "om": "\uf679",
-        "otter": "\uf700",
-        "outdent": "\uf03b",
-        "dedent": "\uf03b",
-        "p": "\ue319",
-        "pager": "\uf815",
-        "paint-brush": "\uf1fc",
-        "paint-roller": "\uf5aa",
-        "palette": "\uf53f",
-        "pallet": "\uf482",
-        "panorama": "\ue209",
-        "paper-plane": "\uf1d8",
-        "paperclip": "\uf0c6",
-        "parachute-box": "\uf4cd",
-        "paragraph": "\uf1dd",
-        "passport": "\uf5ab",
-        "paste": "\uf0ea",
-        "file-clipboard": "\uf0ea",
-        "pause": "\uf04c",
-        "paw": "\uf1b0",
-        "peace": "\uf67c",
-        "pen": "\uf304",
-        "pen-clip": "\uf305",
-        "pen-alt": "\uf305",
-        "pen-fancy": "\uf5ac",
-        "pen-nib": "\uf5ad",
-        "pen-ruler": "\uf5ae",
-        "pencil-ruler": "\uf5ae",
-        "pen-to-square": "\uf044",
-        "edit": "\uf044",
-        "pencil": "\uf040",
-        "pencil-alt": "\uf040",
-        "people-arrows-left-right": "\ue068",
-        "people-arrows": "\ue068",
-        "people-carry-box": "\uf4ce",
-        "people-carry": "\uf4ce",
-        "pepper-hot": "\uf816",
-        "percent": "\uf295",
-        "percentage": "\uf295",
-        "person": "\uf183",
-        "male": "\uf183",
-        "person-biking": "\uf84a",
-        "biking": "\uf84a",
-        "person-booth": "\uf756",
-        "person-dots-from-line": "\uf470",
-        "diagnoses": "\uf470",
-        "person-dress": "\uf182",
-        "female": "\uf182",
-        "person-hiking": "\uf6ec",
-        "hiking": "\uf6ec",
-        "person-praying": "\uf683",
-        "pray": "\uf683",
-        "person-running": "\uf70c",
-        "running": "\uf70c",
-        "person-skating": "\uf7c5",
-        "skating": "\uf7c5",
-        "person-skiing": "\uf7c9",
-        "skiing": "\uf7c9",
-        "person-skiing-nordic": "\uf7ca",
-        "skiing-nordic": "\uf7ca",
-        "person-snowboarding": "\uf7ce",
-        "snowboarding": "\uf7ce",
-        "person-swimming": "\uf5c4",
-        "swimmer": "\uf5c4",
-        "person-walking": "\uf554",
-        "walking": "\uf554",
-        "person-walking-with-cane": "\uf29d",
-        "blind": "\uf29d",
-        "peseta-sign": "\ue221",
-        "peso-sign": "\ue222",
-        "phone": "\uf095",
-        "phone-flip": "\uf879",
-        "phone-alt": "\uf879",
-        "phone-slash": "\uf3dd",
-        "phone-volume": "\uf2a0",
-        "volume-control-phone": "\uf2a0",
-        "photo-film": "\uf87c",
-        "photo-video": "\uf87c",
-        "piggy-bank": "\uf4d3",
-        "pills": "\uf484",
-        "pizza-slice": "\uf818",
-        "place-of-worship": "\uf67f",
-        "plane": "\uf072",
-        "plane-arrival": "\uf5af",
-        "plane-departure": "\uf5b0",
-        "plane-slash": "\ue069",
-        "play": "\uf04b",
-        "plug": "\uf1e6",
-        "plus": "\uf067",
-        "add": "\uf067",
-        "plus-minus": "\ue230",
-        "podcast": "\uf2ce",
-        "poo": "\uf2fe",
-        "poo-bolt": "\uf75a",
-        "poo-storm": "\uf75a",
-        "poop": "\uf619",
-        "power-off": "\uf011",
-        "prescription": "\uf5b1",
-        "prescription-bottle": "\uf485",
-        "prescription-bottle-medical": "\uf486",
-        "prescription-bottle-alt": "\uf486",
-        "print": "\uf02f",
-        "pump-medical": "\ue06a",
-        "pump-soap": "\ue06b",
-        "puzzle-piece": "\uf12e",
-        "q": "\ue320",
-        "qrcode": "\uf029",
-        "question": "\uf128",
-        "quidditch": "\uf458",
-        "broom-ball": "\uf458",
-        "quidditch-broom-ball": "\uf458",
-        "quote-left": "\uf10d",
-        "quote-left-alt": "\uf10d",
-        "quote-right": "\uf10e",
-        "quote-right-alt": "\uf10e",
-        "r": "\ue321",
-        "radiation": "\uf7b9",
-        "rainbow": "\uf75b",
-        "receipt": "\uf543",
-        "record-vinyl": "\uf8d9",
-        "rectangle-ad": "\uf641",
-        "ad": "\uf641",
-        "rectangle-list": "\uf022",
-        "list-alt": "\uf022",
-        "rectangle-xmark": "\uf410",
-        "rectangle-times": "\uf410",
-        "times-rectangle": "\uf410",
-        "window-close": "\uf410",
-        "recycle": "\uf1b8",
-        "registered": "\uf25d",
-        "repeat": "\uf363",
-        "reply": "\uf3e5",
-        "mail-reply": "\uf3e5",
-        "reply-all": "\uf122",
-        "mail-reply-all": "\uf122",
-        "republican": "\uf75e",
-        "restroom": "\uf7bd",
-        "retweet": "\uf079",
-        "ribbon": "\uf4d6",
-        "right-from-bracket": "\uf2f5",
-        "sign-out-alt": "\uf2f5",
-        "right-left": "\uf362",
-        "exchange-alt": "\uf362",
-        "right-long": "\uf30b",
-        "long-arrow-alt-right": "\uf30b",
-        "right-to-bracket": "\uf2f6",
-        "sign-in-alt": "\uf2f6",
-        "ring": "\uf70b",
-        "road": "\uf018",
-        "robot": "\uf544",
-        "rocket": "\uf135",
-        "rotate": "\uf2f1",
-        "sync-alt": "\uf2f1",
-        "rotate-left": "\uf2ea",
-        "rotate-back": "\uf2ea",
-        "rotate-backward": "\uf2ea",
-        "undo-alt": "\uf2ea",
-        "route": "\uf4d7",
-        "rss": "\uf09e",
-        "feed": "\uf09e",
-        "ruble-sign": "\uf158",
-        "rouble": "\uf158",
-        "rub": "\uf158",
-        "ruble": "\uf158",
-        "ruler": "\uf545",
-        "ruler-combined": "\uf546",
-        "ruler-horizontal": "\uf547",
-        "ruler-vertical": "\uf548",
-        "rupee-sign": "\uf156",
-        "rupee": "\uf156",
-        "rupiah-sign": "\ue23d",
-        "s": "\ue325",
-        "satellite": "\uf7bf",
-        "satellite-dish": "\uf7c0",
-        "scale-balanced": "\uf24e",
-        "balance-scale": "\uf24e",
-        "scale-unbalanced": "\uf515",
-        "balance-scale-left": "\uf515",
-        "scale-unbalanced-flip": "\uf516",
-        "balance-scale-right": "\uf516",
-        "school": "\uf549",
-        "scissors": "\uf0c4",
-        "cut": "\uf0c4",
-        "screwdriver": "\uf54a",
-        "screwdriver-wrench": "\uf7d9",
-        "tools": "\uf7d9",
-        "scroll": "\uf70e",
-        "scroll-torah": "\uf6a0",
-        "torah": "\uf6a0",
-        "sd-card": "\uf7c2",
-        "section": "\ue245",
-        "seedling": "\uf4d8",
-        "sprout": "\uf4d8",
-        "server": "\uf233",
-        "shapes": "\uf61f",
-        "triangle-circle-square": "\uf61f",
-        "share": "\uf064",
-        "arrow-turn-right": "\uf064",
-        "mail-forward": "\uf064",
-        "share-from-square": "\uf14d",
-        "share-square": "\uf14d",
-        "share-nodes": "\uf1e0",
-        "share-alt": "\uf1e0",
-        "shekel-sign": "\uf20b",
-        "ils": "\uf20b",
-        "shekel": "\uf20b",
-        "sheqel": "\uf20b",
-        "sheqel-sign": "\uf20b",
-        "shield-blank": "\uf3ed",
-        "shield-alt": "\uf3ed",
-        "shield-virus": "\ue06c",
-        "ship": "\uf21a",
-        "shirt": "\uf553",
-        "t-shirt": "\uf553",
-        "tshirt": "\uf553",
-        "shoe-prints": "\uf54b",
-        "shop": "\uf54f",
-        "store-alt": "\uf54f",
-        "shop-slash": "\ue070",
-        "store-alt-slash": "\ue070",
-        "shower": "\uf2cc",
-        "shuffle": "\uf074",
-        "random": "\uf074",
-        "shuttle-space": "\uf197",
-        "space-shuttle": "\uf197",
-        "sign-hanging": "\uf4d9",
-        "sign": "\uf4d9",
-        "signal": "\uf012",
-        "signal-5": "\uf012",
-        "signal-perfect": "\uf012",
-        "signature": "\uf5b7",
-        "signs-post": "\uf277",
-        "map-signs": "\uf277",
-        "sim-card": "\uf7c4",
-        "sink": "\ue06d",
-        "sitemap": "\uf0e8",
-        "skull": "\uf54c",
-        "skull-crossbones": "\uf714",
-        "slash": "\uf715",
-        "sleigh": "\uf7cc",
-        "sliders": "\uf1de",
-        "sliders-h": "\uf1de",
-        "smog": "\uf75f",
-        "smoking": "\uf48d",
-        "snowflake": "\uf2dc",
-        "snowman": "\uf7d0",
-        "snowplow": "\uf7d2",
-        "soap": "\ue06e",
-        "socks": "\uf696",
-        "solar-panel": "\uf5ba",
-        "sort": "\uf0dc",
-        "unsorted": "\uf0dc",
-        "sort-down": "\uf0dd",
-        "sort-desc": "\uf0dd",
-        "sort-up": "\uf0de",
-        "sort-asc": "\uf0de",
-        "spa": "\uf5bb",
-        "spaghetti-monster-flying": "\uf67b",
-        "pastafarianism": "\uf67b",
-        "spell-check": "\uf891",
-        "spider": "\uf717",
-        "spinner": "\uf110",
-        "splotch": "\uf5bc",
-        "spoon": "\uf2e5",
-        "utensil-spoon": "\uf2e5",
-        "spray-can": "\uf5bd",
-        "spray-can-sparkles": "\uf5d0",
-        "air-freshener": "\uf5d0",
-        "square": "\uf0c8",
-        "square-caret-down": "\uf150",
-        "caret-square-down": "\uf150",
-        "square-caret-left": "\uf191",
-        "caret-square-left": "\uf191",
-        "square-caret-right": "\uf152",
-        "caret-square-right": "\uf152",
-        "square-caret-up": "\uf151",
-        "caret-square-up": "\uf151",
-        "square-check": "\uf14a",
-        "check-square": "\uf14a",
-        "square-envelope": "\uf199",
-        "envelope-square": "\uf199",
-        "square-full": "\uf45c",
-        "square-h": "\uf0fd",
-        "h-square": "\uf0fd",
-        "square-minus": "\uf146",
-        "minus-square": "\uf146",
-        "square-parking": "\uf540",
-        "parking": "\uf540",
-        "square-pen": "\uf14b",
-        "pen-square": "\uf14b",
-        "pencil-square": "\uf14b",
-        "square-phone": "\uf098",
-        "phone-square": "\uf098",
-        "square-phone-flip": "\uf87b",
-        "phone-square-alt": "\uf87b",
-        "square-plus": "\uf0fe",
-        "plus-square": "\uf0fe",
-        "square-poll-horizontal": "\uf682",
-        "poll-h": "\uf682",
-        "square-poll-vertical": "\uf681",
-        "poll": "\uf681",
-        "square-root-variable": "\uf698",
-        "square-root-alt": "\uf698",
-        "square-rss": "\uf143",
-        "rss-square": "\uf143",
-        "square-share-nodes": "\uf1e1",
-        "share-alt-square": "\uf1e1",
-        "square-up-right": "\uf360",
-        "external-link-square-alt": "\uf360",
-        "stairs": "\ue289",
-        "stamp": "\uf5bf",
-        "star": "\uf005",
-        "star-and-crescent": "\uf699",
-        "star-half": "\uf089",
-        "star-half-stroke": "\uf5c0",
-        "star-half-alt": "\uf5c0",
-        "star-of-david": "\uf69a",
-        "star-of-life": "\uf621",
-        "sterling-sign": "\uf154",
-        "gbp": "\uf154",
-        "pound-sign": "\uf154",
-        "stethoscope": "\uf0f1",
-        "stop": "\uf04d",
-        "stopwatch": "\uf2f2",
-        "stopwatch-20": "\ue06f",
-        "store": "\uf54e",
-        "store-slash": "\ue071",
-        "street-view": "\uf21d",
-        "strikethrough": "\uf0cc",
-        "stroopwafel": "\uf551",
-        "subscript": "\uf12c",
-        "suitcase": "\uf0f2",
-        "suitcase-medical": "\uf0fa",
-        "medkit": "\uf0fa",
-        "suitcase-rolling": "\uf5c1",
-        "sun": "\uf185",
-        "superscript": "\uf12b",
-        "swatchbook": "\uf5c3",
-        "synagogue": "\uf69b",
-        "syringe": "\uf48e",
-        "t": "\ue32c",
-        "table": "\uf0ce",
-        "table-cells": "\uf00a",
-        "th": "\uf00a",
-        "table-cells-large": "\uf009",
-        "th-large": "\uf009",
-        "table-columns": "\uf0db",
-        "columns": "\uf0db",
-        "table-list": "\uf00b",
-        "th-list": "\uf00b",
-        "table-tennis-paddle-ball": "\uf45d",
-        "ping-pong-paddle-ball": "\uf45d",
-        "table-tennis": "\uf45d",
-        "tablet-button": "\uf10a",
-        "tablet-screen-button": "\uf3fa",
-        "tablet-alt": "\uf3fa",
-        "tablets": "\uf490",
-        "tachograph-digital": "\uf566",
-        "digital-tachograph": "\uf566",
-        "tag": "\uf02b",
-        "tags": "\uf02c",
-        "tape": "\uf4db",
-        "taxi": "\uf1ba",
-        "cab": "\uf1ba",
-        "teeth": "\uf62e",
-        "teeth-open": "\uf62f",
-        "temperature-empty": "\uf2cb",
-        "temperature-0": "\uf2cb",
-        "thermometer-0": "\uf2cb",
-        "thermometer-empty": "\uf2cb",
-        "temperature-full": "\uf2c7",
-        "temperature-4": "\uf2c7",
-        "thermometer-4": "\uf2c7",
-        "thermometer-full": "\uf2c7",
-        "temperature-half": "\uf2c9",
-        "temperature-2": "\uf2c9",
-        "thermometer-2": "\uf2c9",
-        "thermometer-half": "\uf2c9",
-        "temperature-high": "\uf769",
-        "temperature-low": "\uf76b",
-        "temperature-quarter": "\uf2ca",
-        "temperature-1": "\uf2ca",
-        "thermometer-1": "\uf2ca",
-        "thermometer-quarter": "\uf2ca",
-        "temperature-three-quarters": "\uf2c8",
-        "temperature-3": "\uf2c8",
-        "thermometer-3": "\uf2c8",
-        "thermometer-three-quarters": "\uf2c8",
-        "tenge-sign": "\uf7d7",
-        "tenge": "\uf7d7",
-        "terminal": "\uf120",
-        "text-height": "\uf034",
-        "text-slash": "\uf87d",
-        "remove-format": "\uf87d",
-        "text-width": "\uf035",
-        "thermometer": "\uf491",
-        "thumbs-down": "\uf165",
-        "thumbs-up": "\uf164",
-        "thumbtack": "\uf08d",
-        "thumb-tack": "\uf08d",
-        "ticket-simple": "\uf3ff",
-        "ticket-alt": "\uf3ff",
-        "timeline": "\ue29c",
-        "toggle-off": "\uf204",
-        "toggle-on": "\uf205",
-        "toilet": "\uf7d8",
-        "toilet-paper": "\uf71e",
-        "toilet-paper-slash": "\ue072",
-        "toolbox": "\uf552",
-        "tooth": "\uf5c9",
-        "torii-gate": "\uf6a1",
-        "tower-broadcast": "\uf519",
-        "broadcast-tower": "\uf519",
-        "tractor": "\uf722",
-        "trademark": "\uf25c",
-        "traffic-light": "\uf637",
-        "trailer": "\ue041",
-        "train": "\uf238",
-        "train-subway": "\uf239",
-        "subway": "\uf239",
-        "train-tram": "\uf7da",
-        "tram": "\uf7da",
-        "transgender": "\uf224",
-        "transgender-alt": "\uf224",
-        "trash": "\uf1f8",
-        "trash-arrow-up": "\uf829",
-        "trash-restore": "\uf829",
-        "trash-can": "\uf2ed",
-        "trash-alt": "\uf2ed",
-        "trash-can-arrow-up": "\uf82a",
-        "trash-restore-alt": "\uf82a",
-        "tree": "\uf1bb",
-        "triangle-exclamation": "\uf071",
-        "exclamation-triangle": "\uf071",
-        "warning": "\uf071",
-        "trophy": "\uf091",
-        "truck": "\uf0d1",
-        "truck-fast": "\uf48b",
-        "shipping-fast": "\uf48b",
-        "truck-medical": "\uf0f9",
-        "ambulance": "\uf0f9",
-        "truck-monster": "\uf63b",
-        "truck-moving": "\uf4df",
-        "truck-pickup": "\uf63c",
-        "truck-ramp-box": "\uf4de",
-        "truck-loading": "\uf4de",
-        "tty": "\uf1e4",
-        "teletype": "\uf1e4",
-        "turkish-lira-sign": "\ue2bb",
-        "try": "\ue2bb",
-        "turkish-lira": "\ue2bb",
-        "turn-down": "\uf3be",
-        "level-down-alt": "\uf3be",
-        "turn-up": "\uf3bf",
-        "level-up-alt": "\uf3bf",
-        "tv": "\uf26c",
-        "television": "\uf26c",
-        "tv-alt": "\uf26c",
-        "u": "\ue332",
-        "umbrella": "\uf0e9",
-        "umbrella-beach": "\uf5ca",
-        "underline": "\uf0cd",
-        "universal-access": "\uf29a",
-        "unlock": "\uf09c",
-        "unlock-keyhole": "\uf13e",
-        "unlock-alt": "\uf13e",
-        "up-down": "\uf338",
-        "arrows-alt-v": "\uf338",
-        "up-down-left-right": "\uf0b2",
-        "arrows-alt": "\uf0b2",
-        "up-long": "\uf30c",
-        "long-arrow-alt-up": "\uf30c",
-        "up-right-and-down-left-from-center": "\uf424",
-        "expand-alt": "\uf424",
-        "up-right-from-square": "\uf35d",
-        "external-link-alt": "\uf35d",
-        "upload": "\uf093",
-        "user": "\uf007",
-        "user-astronaut": "\uf4fb",
-        "user-check": "\uf4fc",
-        "user-clock": "\uf4fd",
-        "user-doctor": "\uf0f0",
-        "user-md": "\uf0f0",
-        "user-gear": "\uf4fe",
-        "user-cog": "\uf4fe",
-        "user-graduate": "\uf501",
-        "user-group": "\uf500",
-        "user-friends": "\uf500",
-        "user-injured": "\uf728",
-        "user-large": "\uf406",
-        "user-alt": "\uf406",
-        "user-large-slash": "\uf4fa",
-        "user-alt-slash": "\uf4fa",
-        "user-lock": "\uf502",
-        "user-minus": "\uf503",
-        "user-ninja": "\uf504",
-        "user-nurse": "\uf82f",
-        "user-pen": "\uf4ff",
-        "user-edit": "\uf4ff",
-        "user-plus": "\uf234",
-        "user-secret": "\uf21b",
-        "user-shield": "\uf505",
-        "user-slash": "\uf506",
-        "user-tag": "\uf507",
-        "user-tie": "\uf508",
-        "user-xmark": "\uf235",
-        "user-times": "\uf235",
-        "users": "\uf0c0",
-        "group": "\uf0c0",
-        "users-gear": "\uf509",
-        "users-cog": "\uf509",
-        "users-slash": "\ue073",
-        "utensils": "\uf2e7",
-        "cutlery": "\uf2e7",
-        "v": "\ue335",
-        "van-shuttle": "\uf5b6",
-        "shuttle-van": "\uf5b6",
-        "vault": "\ue2c5",
-        "vector-square": "\uf5cb",
-        "venus": "\uf221",
-        "venus-double": "\uf226",
-        "venus-mars": "\uf228",
-        "vest": "\ue085",
-        "vest-patches": "\ue086",
-        "vial": "\uf492",
-        "vials": "\uf493",
-        "video": "\uf03d",
-        "video-camera": "\uf03d",
-        "video-slash": "\uf4e2",
-        "vihara": "\uf6a7",
-        "virus": "\ue074",
-        "virus-slash": "\ue075",
-        "viruses": "\ue076",
-        "voicemail": "\uf897",
-        "volleyball": "\uf45f",
-        "volleyball-ball": "\uf45f",
-        "volume-high": "\uf028",
-        "volume-up": "\uf028",
-        "volume-low": "\uf027",
-        "volume-down": "\uf027",
-        "volume-off": "\uf026",
-        "volume-xmark": "\uf6a9",
-        "volume-mute": "\uf6a9",
-        "volume-times": "\uf6a9",
-        "vr-cardboard": "\uf729",
-        "w": "\ue336",
-        "wallet": "\uf555",
-        "wand-magic": "\uf0d0",
-        "magic": "\uf0d0",
-        "warehouse": "\uf494",
-        "water": "\uf773",
-        "water-ladder": "\uf5c5",
-        "ladder-water": "\uf5c5",
-        "swimming-pool": "\uf5c5",
-        "wave-square": "\uf83e",
-        "weight-hanging": "\uf5cd",
-        "weight-scale": "\uf496",
-        "weight": "\uf496",
-        "wheelchair": "\uf193",
-        "whiskey-glass": "\uf7a0",
-        "glass-whiskey": "\uf7a0",
-        "wifi": "\uf1eb",
-        "wifi-3": "\uf1eb",
-        "wifi-strong": "\uf1eb",
-        "wind": "\uf72e",
-        "window-maximize": "\uf2d0",
-        "window-minimize": "\uf2d1",
-        "window-restore": "\uf2d2",
-        "wine-bottle": "\uf72f",
-        "wine-glass": "\uf4e3",
-        "wine-glass-empty": "\uf5ce",
-        "wine-glass-alt": "\uf5ce",
-        "won-sign": "\uf159",
-        "krw": "\uf159",
-        "won": "\uf159",
-        "wrench": "\uf0ad",
-        "x": "\ue33a",
-        "x-ray": "\uf497",
-        "xmark": "\uf00d",
-        "close": "\uf00d",
-        "multiply": "\uf00d",
-        "remove": "\uf00d",
-        "times": "\uf00d",
-        "y": "\ue33b",
-        "yen-sign": "\uf157",
-        "cny": "\uf157",
-        "jpy": "\uf157",
-        "rmb": "\uf157",
-        "yen": "\uf157",
-        "yin-yang": "\uf6ad",
-        "z": "\ue33c"
-    },
-    "brands": {
-        "500px": "\uf26e",
-        "accessible-icon": "\uf368",
-        "accusoft": "\uf369",
-        "acquisitions-incorporated": "\uf6af",
-        "adn": "\uf170",
-        "adversal": "\uf36a",
-        "affiliatetheme": "\uf36b",
-        "airbnb": "\uf834",
-        "algolia": "\uf36c",
-        "alipay": "\uf642",
-        "amazon": "\uf270",
-        "amazon-pay": "\uf42c",
-        "amilia": "\uf36d",
-        "android": "\uf17b",
-        "angellist": "\uf209",
-        "angrycreative": "\uf36e",
-        "angular": "\uf420",
-        "app-store": "\uf36f",
-        "app-store-ios": "\uf370",
-        "apper": "\uf371",
-        "apple": "\uf179",
-        "apple-pay": "\uf415",
-        "artstation": "\uf77a",
-        "asymmetrik": "\uf372",
-        "atlassian": "\uf77b",
-        "audible": "\uf373",
-        "autoprefixer": "\uf41c",
-        "avianex": "\uf374",
-        "aviato": "\uf421",
-        "aws": "\uf375",
-        "bandcamp": "\uf2d5",
-        "battle-net": "\uf835",
-        "behance": "\uf1b4",
-        "behance-square": "\uf1b5",
-        "bimobject": "\uf378",
-        "bitbucket": "\uf171",
-        "bitcoin": "\uf379",
-        "bity": "\uf37a",
-        "black-tie": "\uf27e",
-        "blackberry": "\uf37b",
-        "blogger": "\uf37c",
-        "blogger-b": "\uf37d",
-        "bluetooth": "\uf293",
-        "bluetooth-b": "\uf294",
-        "bootstrap": "\uf836",
-        "bots": "\ue33d",
-        "btc": "\uf15a",
-        "buffer": "\uf837",
-        "buromobelexperte": "\uf37f",
-        "buy-n-large": "\uf8a6",
-        "buysellads": "\uf20d",
-        "canadian-maple-leaf": "\uf785",
-        "cc-amazon-pay": "\uf42d",
-        "cc-amex": "\uf1f3",
-        "cc-apple-pay": "\uf416",
-        "cc-diners-club": "\uf24c",
-        "cc-discover": "\uf1f2",
-        "cc-jcb": "\uf24b",
-        "cc-mastercard": "\uf1f1",
-        "cc-paypal": "\uf1f4",
-        "cc-stripe": "\uf1f5",
-        "cc-visa": "\uf1f0",
-        "centercode": "\uf380",
-        "centos": "\uf789",
-        "chrome": "\uf268",
-        "chromecast": "\uf838",
-        "cloudflare": "\ue07d",
-        "cloudscale": "\uf383",
-        "cloudsmith": "\uf384",
-        "cloudversify": "\uf385",
-        "cmplid": "\ue33f",
-        "codepen": "\uf1cb",
-        "codiepie": "\uf284",
-        "confluence": "\uf78d",
-        "connectdevelop": "\uf20e",
-        "contao": "\uf26d",
-        "cotton-bureau": "\uf89e",
-        "cpanel": "\uf388",
-        "creative-commons": "\uf25e",
-        "creative-commons-by": "\uf4e7",
-        "creative-commons-nc": "\uf4e8",
-        "creative-commons-nc-eu": "\uf4e9",
-        "creative-commons-nc-jp": "\uf4ea",
-        "creative-commons-nd": "\uf4eb",
-        "creative-commons-pd": "\uf4ec",
-        "creative-commons-pd-alt": "\uf4ed",
-        "creative-commons-remix": "\uf4ee",
-        "creative-commons-sa": "\uf4ef",
-        "creative-commons-sampling": "\uf4f0",
-        "creative-commons-sampling-plus": "\uf4f1",
-        "creative-commons-share": "\uf4f2",
-        "creative-commons-zero": "\uf4f3",
-        "critical-role": "\uf6c9",
-        "css3": "\uf13c",
-        "css3-alt": "\uf38b",
-        "cuttlefish": "\uf38c",
-        "d-and-d": "\uf38d",
-        "d-and-d-beyond": "\uf6ca",
-        "dailymotion": "\ue052",
-        "dashcube": "\uf210",
-        "deezer": "\ue077",
-        "delicious": "\uf1a5",
-        "deploydog": "\uf38e",
-        "deskpro": "\uf38f",
-        "dev": "\uf6cc",
-        "deviantart": "\uf1bd",
-        "dhl": "\uf790",
-        "diaspora": "\uf791",
-        "digg": "\uf1a6",
-        "digital-ocean": "\uf391",
-        "discord": "\uf392",
-        "discourse": "\uf393",
-        "dochub": "\uf394",
-        "docker": "\uf395",
-        "draft2digital": "\uf396",
-        "dribbble": "\uf17d",
-        "dribbble-square": "\uf397",
-        "dropbox": "\uf16b",
-        "drupal": "\uf1a9",
-        "dyalog": "\uf399",
-        "earlybirds": "\uf39a",
-        "ebay": "\uf4f4",
-        "edge": "\uf282",
-        "edge-legacy": "\ue078",
-        "elementor": "\uf430",
-        "ello": "\uf5f1",
-        "ember": "\uf423",
-        "empire": "\uf1d1",
-        "envira": "\uf299",
-        "erlang": "\uf39d",
-        "ethereum": "\uf42e",
-        "etsy": "\uf2d7",
-        "evernote": "\uf839",
-        "expeditedssl": "\uf23e",
-        "facebook": "\uf09a",
-        "facebook-f": "\uf39e",
-        "facebook-messenger": "\uf39f",
-        "facebook-square": "\uf082",
-        "fantasy-flight-games": "\uf6dc",
-        "fedex": "\uf797",
-        "fedora": "\uf798",
-        "figma": "\uf799",
-        "firefox": "\uf269",
-        "firefox-browser": "\ue007",
-        "first-order": "\uf2b0",
-        "first-order-alt": "\uf50a",
-        "firstdraft": "\uf3a1",
-        "flickr": "\uf16e",
-        "flipboard": "\uf44d",
-        "fly": "\uf417",
-        "font-awesome": "\uf2b4",
-        "font-awesome-flag": "\uf2b4",
-        "font-awesome-logo-full": "\uf2b4",
-        "fonticons": "\uf280",
-        "fonticons-fi": "\uf3a2",
-        "fort-awesome": "\uf286",
-        "fort-awesome-alt": "\uf3a3",
-        "forumbee": "\uf211",
-        "foursquare": "\uf180",
-        "free-code-camp": "\uf2c5",
-        "freebsd": "\uf3a4",
-        "fulcrum": "\uf50b",
-        "galactic-republic": "\uf50c",
-        "galactic-senate": "\uf50d",
-        "get-pocket": "\uf265",
-        "gg": "\uf260",
-        "gg-circle": "\uf261",
-        "git": "\uf1d3",
-        "git-alt": "\uf841",
-        "git-square": "\uf1d2",
-        "github": "\uf09b",
-        "github-alt": "\uf113",
-        "github-square": "\uf092",
-        "gitkraken": "\uf3a6",
-        "gitlab": "\uf296",
-        "gitter": "\uf426",
-        "glide": "\uf2a5",
-        "glide-g": "\uf2a6",
-        "gofore": "\uf3a7",
-        "goodreads": "\uf3a8",
-        "goodreads-g": "\uf3a9",
-        "google": "\uf1a0",
-        "google-drive": "\uf3aa",
-        "google-pay": "\ue079",
-        "google-play": "\uf3ab",
-        "google-plus": "\uf2b3",
-        "google-plus-g": "\uf0d5",
-        "google-plus-square": "\uf0d4",
-        "google-wallet": "\uf1ee",
-        "gratipay": "\uf184",
-        "grav": "\uf2d6",
-        "gripfire": "\uf3ac",
-        "grunt": "\uf3ad",
-        "guilded": "\ue07e",
-        "gulp": "\uf3ae",
-        "hacker-news": "\uf1d4",
-        "hacker-news-square": "\uf3af",
-        "hackerrank": "\uf5f7",
-        "hips": "\uf452",
-        "hire-a-helper": "\uf3b0",
-        "hive": "\ue07f",
-        "hooli": "\uf427",
-        "hornbill": "\uf592",
-        "hotjar": "\uf3b1",
-        "houzz": "\uf27c",
-        "html5": "\uf13b",
-        "hubspot": "\uf3b2",
-        "ideal": "\ue013",
-        "imdb": "\uf2d8",
-        "innosoft": "\ue080",
-        "instagram": "\uf16d",
-        "instagram-square": "\ue055",
-        "instalod": "\ue081",
-        "intercom": "\uf7af",
-        "internet-explorer": "\uf26b",
-        "invision": "\uf7b0",
-        "ioxhost": "\uf208",
-        "itch-io": "\uf83a",
-        "itunes": "\uf3b4",
-        "itunes-note": "\uf3b5",
-        "java": "\uf4e4",
-        "jedi-order": "\uf50e",
-        "jenkins": "\uf3b6",
-        "jira": "\uf7b1",
-        "joget": "\uf3b7",
-        "joomla": "\uf1aa",
-        "js": "\uf3b8",
-        "js-square": "\uf3b9",
-        "jsfiddle": "\uf1cc",
-        "kaggle": "\uf5fa",
-        "keybase": "\uf4f5",
-        "keycdn": "\uf3ba",
-        "kickstarter": "\uf3bb",
-        "kickstarter-k": "\uf3bc",
-        "korvue": "\uf42f",
-        "laravel": "\uf3bd",
-        "lastfm": "\uf202",
-        "lastfm-square": "\uf203",
-        "leanpub": "\uf212",
-        "less": "\uf41d",
-        "line": "\uf3c0",
-        "linkedin": "\uf08c",
-        "linkedin-in": "\uf0e1",
-        "linode": "\uf2b8",
-        "linux": "\uf17c",
-        "lyft": "\uf3c3",
-        "magento": "\uf3c4",
-        "mailchimp": "\uf59e",
-        "mandalorian": "\uf50f",
-        "markdown": "\uf60f",
-        "mastodon": "\uf4f6",
-        "maxcdn": "\uf136",
-        "mdb": "\uf8ca",
-        "medapps": "\uf3c6",
-        "medium": "\uf23a",
-        "medium-m": "\uf23a",
-        "medrt": "\uf3c8",
-        "meetup": "\uf2e0",
-        "megaport": "\uf5a3",
-        "mendeley": "\uf7b3",
-        "microblog": "\ue01a",
-        "microsoft": "\uf3ca",
-        "mix": "\uf3cb",
-        "mixcloud": "\uf289",
-        "mixer": "\ue056",
-        "mizuni": "\uf3cc",
-        "modx": "\uf285",
-        "monero": "\uf3d0",
-        "napster": "\uf3d2",
-        "neos": "\uf612",
-        "nimblr": "\uf5a8",
-        "node": "\uf419",
-        "node-js": "\uf3d3",
-        "npm": "\uf3d4",
-        "ns8": "\uf3d5",
-        "nutritionix": "\uf3d6",
-        "octopus-deploy": "\ue082",
-        "odnoklassniki": "\uf263",
-        "odnoklassniki-square": "\uf264",
-        "old-republic": "\uf510",
-        "opencart": "\uf23d",
-        "openid": "\uf19b",
-        "opera": "\uf26a",
-        "optin-monster": "\uf23c",
-        "orcid": "\uf8d2",
-        "osi": "\uf41a",
-        "page4": "\uf3d7",
-        "pagelines": "\uf18c",
-        "palfed": "\uf3d8",
-        "patreon": "\uf3d9",
-        "paypal": "\uf1ed",
-        "penny-arcade": "\uf704",
-        "perbyte": "\ue083",
-        "periscope": "\uf3da",
-        "phabricator": "\uf3db",
-        "phoenix-framework": "\uf3dc",
-        "phoenix-squadron": "\uf511",
-        "php": "\uf457",
-        "pied-piper": "\uf2ae",
-        "pied-piper-alt": "\uf1a8",
-        "pied-piper-hat": "\uf4e5",
-        "pied-piper-pp": "\uf1a7",
-        "pied-piper-square": "\ue01e",
-        "pinterest": "\uf0d2",
-        "pinterest-p": "\uf231",
-        "pinterest-square": "\uf0d3",
-        "playstation": "\uf3df",
-        "product-hunt": "\uf288",
-        "pushed": "\uf3e1",
-        "python": "\uf3e2",
-        "qq": "\uf1d6",
-        "quinscape": "\uf459",
-        "quora": "\uf2c4",
-        "r-project": "\uf4f7",
-        "raspberry-pi": "\uf7bb",
-        "ravelry": "\uf2d9",
-        "react": "\uf41b",
-        "reacteurope": "\uf75d",
-        "readme": "\uf4d5",
-        "rebel": "\uf1d0",
-        "red-river": "\uf3e3",
-        "reddit": "\uf1a1",
-        "reddit-alien": "\uf281",
-        "reddit-square": "\uf1a2",
-        "redhat": "\uf7bc",
-        "renren": "\uf18b",
-        "replyd": "\uf3e6",
-        "researchgate": "\uf4f8",
-        "resolving": "\uf3e7",
-        "rev": "\uf5b2",
-        "rocketchat": "\uf3e8",
-        "rockrms": "\uf3e9",
-        "rust": "\ue07a",
-        "safari": "\uf267",
-        "salesforce": "\uf83b",
-        "sass": "\uf41e",
-        "schlix": "\uf3ea",
-        "scribd": "\uf28a",
-        "searchengin": "\uf3eb",
-        "sellcast": "\uf2da",
-        "sellsy": "\uf213",
-        "servicestack": "\uf3ec",
-        "shirtsinbulk": "\uf214",
-        "shopify": "\ue057",
-        "shopware": "\uf5b5",
-        "simplybuilt": "\uf215",
-        "sistrix": "\uf3ee",
-        "sith": "\uf512",
-        "sketch": "\uf7c6",
-        "skyatlas": "\uf216",
-        "skype": "\uf17e",
-        "slack": "\uf198",
-        "slack-hash": "\uf198",
-        "slideshare": "\uf1e7",
-        "snapchat": "\uf2ab",
-        "snapchat-ghost": "\uf2ab",
-        "snapchat-square": "\uf2ad",
-        "soundcloud": "\uf1be",
-        "sourcetree": "\uf7d3",
-        "speakap": "\uf3f3",
-        "speaker-deck": "\uf83c",
-        "spotify": "\uf1bc",
-        "square-font-awesome": "\uf425",
-        "square-font-awesome-stroke": "\uf35c",
-        "font-awesome-alt": "\uf35c",
-        "squarespace": "\uf5be",
-        "stack-exchange": "\uf18d",
-        "stack-overflow": "\uf16c",
-        "stackpath": "\uf842",
-        "staylinked": "\uf3f5",
-        "steam": "\uf1b6",
-        "steam-square": "\uf1b7",
-        "steam-symbol": "\uf3f6",
-        "sticker-mule": "\uf3f7",
-        "strava": "\uf428",
-        "stripe": "\uf429",
-        "stripe-s": "\uf42a",
-        "studiovinari": "\uf3f8",
-        "stumbleupon": "\uf1a4",
-        "stumbleupon-circle": "\uf1a3",
-        "superpowers": "\uf2dd",
-        "supple": "\uf3f9",
-        "suse": "\uf7d6",
-        "swift": "\uf8e1",
-        "symfony": "\uf83d",
-        "teamspeak": "\uf4f9",
-        "telegram": "\uf2c6",
-        "telegram-plane": "\uf2c6",
-        "tencent-weibo": "\uf1d5",
-        "the-red-yeti": "\uf69d",
-        "themeco": "\uf5c6",
-        "themeisle": "\uf2b2",
-        "think-peaks": "\uf731",
-        "tiktok": "\ue07b",
-        "trade-federation": "\uf513",
-        "trello": "\uf181",
-        "tripadvisor": "\uf262",
-        "tumblr": "\uf173",
-        "tumblr-square": "\uf174",
-        "twitch": "\uf1e8",
-        "twitter": "\uf099",
-        "twitter-square": "\uf081",
-        "typo3": "\uf42b",
-        "uber": "\uf402",
-        "ubuntu": "\uf7df",
-        "uikit": "\uf403",
-        "umbraco": "\uf8e8",
-        "uncharted": "\ue084",
-        "uniregistry": "\uf404",
-        "unity": "\ue049",
-        "unsplash": "\ue07c",
-        "untappd": "\uf405",
-        "ups": "\uf7e0",
-        "usb": "\uf287",
-        "usps": "\uf7e1",
-        "ussunnah": "\uf407",
-        "vaadin": "\uf408",
-        "viacoin": "\uf237",
-        "viadeo": "\uf2a9",
-        "viadeo-square": "\uf2aa",
-        "viber": "\uf409",
-        "vimeo": "\uf40a",
-        "vimeo-square": "\uf194",
-        "vimeo-v": "\uf27d",
-        "vine": "\uf1ca",
-        "vk": "\uf189",
-        "vnv": "\uf40b",
-        "vuejs": "\uf41f",
-        "watchman-monitoring": "\ue087",
-        "waze": "\uf83f",
-        "weebly": "\uf5cc",
-        "weibo": "\uf18a",
-        "weixin": "\uf1d7",
-        "whatsapp": "\uf232",
-        "whatsapp-square": "\uf40c",
-        "whmcs": "\uf40d",
-        "wikipedia-w": "\uf266",
-        "windows": "\uf17a",
-        "wirsindhanderk": "\ue2d0",
-        "wsh": "\ue2d0",
-        "wix": "\uf5cf",
-        "wizards-of-the-coast": "\uf730",
-        "wodu": "\ue088",
-        "wolf-pack-battalion": "\uf514",
-        "wordpress": "\uf19a",
-        "wordpress-simple": "\uf411",
-        "wpbeginner": "\uf297",
-        "wpexplorer": "\uf2de",
-        "wpforms": "\uf298",
-        "wpressr": "\uf3e4",
-        "xbox": "\uf412",
-        "xing": "\uf168",
-        "xing-square": "\uf169",
-        "y-combinator": "\uf23b",
-        "yahoo": "\uf19e",
-        "yammer": "\uf840",
-        "yandex": "\uf413",
-        "yandex-international": "\uf414",
-        "yarn": "\uf7e3",
-        "yelp": "\uf1e9",
-        "yoast": "\uf2b1",
-        "youtube": "\uf167",
-        "youtube-square": "\uf431",
-        "zhihu": "\uf63f"
-    },
-    "regular": {
-        "address-book": "\uf2b9",
-        "contact-book": "\uf2b9",
-        "address-card": "\uf2bb",
-        "contact-card": "\uf2bb",
-        "vcard": "\uf2bb",
-        "bell": "\uf0f3",
-        "bell-slash": "\uf1f6",
-        "bookmark": "\uf02e",
-        "building": "\uf1ad",
-        "calendar": "\uf133",
-        "calendar-check": "\uf274",
-        "calendar-days": "\uf073",
-        "calendar-alt": "\uf073",
-        "calendar-minus": "\uf272",
-        "calendar-plus": "\uf271",
-        "calendar-xmark": "\uf273",
-        "calendar-times": "\uf273",
-        "chart-bar": "\uf080",
-        "bar-chart": "\uf080",
-        "chess-bishop": "\uf43a",
-        "chess-king": "\uf43f",
-        "chess-knight": "\uf441",
-        "chess-pawn": "\uf443",
-        "chess-queen": "\uf445",
-        "chess-rook": "\uf447",
-        "circle": "\uf111",
-        "circle-check": "\uf058",
-        "check-circle": "\uf058",
-        "circle-dot": "\uf192",
-        "dot-circle": "\uf192",
-        "circle-down": "\uf358",
-        "arrow-alt-circle-down": "\uf358",
-        "circle-left": "\uf359",
-        "arrow-alt-circle-left": "\uf359",
-        "circle-pause": "\uf28b",
-        "pause-circle": "\uf28b",
-        "circle-play": "\uf144",
-        "play-circle": "\uf144",
-        "circle-question": "\uf059",
-        "question-circle": "\uf059",
-        "circle-right": "\uf35a",
-        "arrow-alt-circle-right": "\uf35a",
-        "circle-stop": "\uf28d",
-        "stop-circle": "\uf28d",
-        "circle-up": "\uf35b",
-        "arrow-alt-circle-up": "\uf35b",
-        "circle-user": "\uf2bd",
-        "user-circle": "\uf2bd",
-        "circle-xmark": "\uf057",
-        "times-circle": "\uf057",
-        "xmark-circle": "\uf057",
-        "clipboard": "\uf328",
-        "clock": "\ue33e",
-        "clock-four": "\ue33e",
-        "clone": "\uf24d",
-        "closed-captioning": "\uf20a",
-        "comment": "\uf075",
-        "comment-dots": "\uf4ad",
-        "commenting": "\uf4ad",
-        "comments": "\uf086",
-        "compass": "\uf14e",
-        "copy": "\uf0c5",
-        "copyright": "\uf1f9",
-        "credit-card": "\uf09d",
-        "credit-card-alt": "\uf09d",
-        "envelope": "\uf0e0",
-        "envelope-open": "\uf2b6",
-        "eye": "\uf06e",
-        "eye-slash": "\uf070",
-        "face-angry": "\uf556",
-        "angry": "\uf556",
-        "face-dizzy": "\uf567",
-        "dizzy": "\uf567",
-        "face-flushed": "\uf579",
-        "flushed": "\uf579",
-        "face-frown": "\uf119",
-        "frown": "\uf119",
-        "face-frown-open": "\uf57a",
-        "frown-open": "\uf57a",
-        "face-grimace": "\uf57f",
-        "grimace": "\uf57f",
-        "face-grin": "\uf580",
-        "grin": "\uf580",
-        "face-grin-beam": "\uf582",
-        "grin-beam": "\uf582",
-        "face-grin-beam-sweat": "\uf583",
-        "grin-beam-sweat": "\uf583",
-        "face-grin-hearts": "\uf584",
-        "grin-hearts": "\uf584",
-        "face-grin-squint": "\uf585",
-        "grin-squint": "\uf585",
-        "face-grin-squint-tears": "\uf586",
-        "grin-squint-tears": "\uf586",
-        "face-grin-stars": "\uf587",
-        "grin-stars": "\uf587",
-        "face-grin-tears": "\uf588",
-        "grin-tears": "\uf588",
-        "face-grin-tongue": "\uf589",
-        "grin-tongue": "\uf589",
-        "face-grin-tongue-squint": "\uf58a",
-        "grin-tongue-squint": "\uf58a",
-        "face-grin-tongue-wink": "\uf58b",
-        "grin-tongue-wink": "\uf58b",
-        "face-grin-wide": "\uf581",
-        "grin-alt": "\uf581",
-        "face-grin-wink": "\uf58c",
-        "grin-wink": "\uf58c",
-        "face-kiss": "\uf596",
-        "kiss": "\uf596",
-        "face-kiss-beam": "\uf597",
-        "kiss-beam": "\uf597",
-        "face-kiss-wink-heart": "\uf598",
-        "kiss-wink-heart": "\uf598",
-        "face-laugh": "\uf599",
-        "laugh": "\uf599",
-        "face-laugh-beam": "\uf59a",
-        "laugh-beam": "\uf59a",
-        "face-laugh-squint": "\uf59b",
-        "laugh-squint": "\uf59b",
-        "face-laugh-wink": "\uf59c",
-        "laugh-wink": "\uf59c",
-        "face-meh": "\uf11a",
-        "meh": "\uf11a",
-        "face-meh-blank": "\uf5a4",
-        "meh-blank": "\uf5a4",
-        "face-rolling-eyes": "\uf5a5",
-        "meh-rolling-eyes": "\uf5a5",
-        "face-sad-cry": "\uf5b3",
-        "sad-cry": "\uf5b3",
-        "face-sad-tear": "\uf5b4",
-        "sad-tear": "\uf5b4",
-        "face-smile": "\uf118",
-        "smile": "\uf118",
-        "face-smile-beam": "\uf5b8",
-        "smile-beam": "\uf5b8",
-        "face-smile-wink": "\uf4da",
-        "smile-wink": "\uf4da",
-        "face-surprise": "\uf5c2",
-        "surprise": "\uf5c2",
-        "face-tired": "\uf5c8",
-        "tired": "\uf5c8",
-        "file": "\uf15b",
-        "file-audio": "\uf1c7",
-        "file-code": "\uf1c9",
-        "file-excel": "\uf1c3",
-        "file-image": "\uf1c5",
-        "file-lines": "\uf15c",
-        "file-alt": "\uf15c",
-        "file-text": "\uf15c",
-        "file-pdf": "\uf1c1",
-        "file-powerpoint": "\uf1c4",
-        "file-video": "\uf1c8",
-        "file-word": "\uf1c2",
-        "file-zipper": "\uf1c6",
-        "file-archive": "\uf1c6",
-        "flag": "\uf024",
-        "floppy-disk": "\uf0c7",
-        "save": "\uf0c7",
-        "folder": "\uf07b",
-        "folder-open": "\uf07c",
-        "font-awesome": "\uf2b4",
-        "font-awesome-flag": "\uf2b4",
-        "font-awesome-logo-full": "\uf2b4",
-        "futbol": "\uf1e3",
-        "futbol-ball": "\uf1e3",
-        "soccer-ball": "\uf1e3",
-        "gem": "\uf3a5",
-        "hand": "\uf256",
-        "hand-paper": "\uf256",
-        "hand-back-fist": "\uf255",
-        "hand-rock": "\uf255",
-        "hand-lizard": "\uf258",
-        "hand-peace": "\uf25b",
-        "hand-point-down": "\uf0a7",
-        "hand-point-left": "\uf0a5",
-        "hand-point-right": "\uf0a4",
-        "hand-point-up": "\uf0a6",
-        "hand-pointer": "\uf25a",
-        "hand-scissors": "\uf257",
-        "hand-spock": "\uf259",
-        "handshake": "\uf2b5",
-        "hard-drive": "\uf0a0",
-        "hdd": "\uf0a0",
-        "heart": "\uf004",
-        "hospital": "\uf0f8",
-        "hourglass": "\uf254",
-        "hourglass-2": "\uf254",
-        "hourglass-half": "\uf254",
-        "id-badge": "\uf2c1",
-        "id-card": "\uf2c2",
-        "drivers-license": "\uf2c2",
-        "image": "\uf03e",
-        "images": "\uf302",
-        "keyboard": "\uf11c",
-        "lemon": "\uf094",
-        "life-ring": "\uf1cd",
-        "lightbulb": "\uf0eb",
-        "map": "\uf279",
-        "message": "\uf27a",
-        "comment-alt": "\uf27a",
-        "money-bill-1": "\uf3d1",
-        "money-bill-alt": "\uf3d1",
-        "moon": "\uf186",
-        "newspaper": "\uf1ea",
-        "note-sticky": "\uf249",
-        "sticky-note": "\uf249",
-        "object-group": "\uf247",
-        "object-ungroup": "\uf248",
-        "paper-plane": "\uf1d8",
-        "pen-to-square": "\uf044",
-        "edit": "\uf044",
-        "rectangle-list": "\uf022",
-        "list-alt": "\uf022",
-        "rectangle-xmark": "\uf410",
-        "rectangle-times": "\uf410",
-        "times-rectangle": "\uf410",
-        "window-close": "\uf410",
-        "registered": "\uf25d",
-        "share-from-square": "\uf14d",
-        "share-square": "\uf14d",
-        "snowflake": "\uf2dc",
-        "square": "\uf0c8",
-        "square-caret-down": "\uf150",
-        "caret-square-down": "\uf150",
-        "square-caret-left": "\uf191",
-        "caret-square-left": "\uf191",
-        "square-caret-right": "\uf152",
-        "caret-square-right": "\uf152",
-        "square-caret-up": "\uf151",
-        "caret-square-up": "\uf151",
-        "square-check": "\uf14a",
-        "check-square": "\uf14a",
-        "square-full": "\uf45c",
-        "square-minus": "\uf146",
-        "minus-square": "\uf146",
-        "square-plus": "\uf0fe",
-        "plus-square": "\uf0fe",
-        "star": "\uf005",
-        "star-half": "\uf089",
-        "sun": "\uf185",
-        "thumbs-down": "\uf165",
-        "thumbs-up": "\uf164",
-        "trash-can": "\uf2ed",
-        "trash-alt": "\uf2ed",
-        "user": "\uf007",
-        "window-maximize": "\uf2d0",
-        "window-minimize": "\uf2d1",
-        "window-restore": "\uf2d2"
+from pywaffle.fontawesome_index import IconIndex
+
+icons = IconIndex(
+    {
+        "solid": (
+            "0\n1\n2\n3\n4\n5\n6\n7\n8\n9\na\nad\nadd\naddress-book\naddress-card\nadjust\nair-freshener\n"
+            "align-center\nalign-justify\nalign-left\nalign-right\nallergies\nambulance\namerican-sign-language-interpreting\n"
+            "anchor\nangle-double-down\nangle-double-left\nangle-double-right\nangle-double-up\n"
+            "angle-down\nangle-left\nangle-right\nangle-up\nangles-down\nangles-left\nangles-right\n"
+            "angles-up\nangry\nankh\napple-alt\napple-whole\narchive\narchway\narea-chart\narrow-alt-circle-down\n"
+            "arrow-alt-circle-left\narrow-alt-circle-right\narrow-alt-circle-up\narrow-circle-down\n"
+            "arrow-circle-left\narrow-circle-right\narrow-circle-up\narrow-down\narrow-down-1-9\n"
+            "arrow-down-9-1\narrow-down-a-z\narrow-down-short-wide\narrow-down-wide-short\n"
+            "arrow-down-z-a\narrow-left\narrow-left-rotate\narrow-pointer\narrow-right\narrow-right-from-file\n"
+            "arrow-right-rotate\narrow-right-to-file\narrow-rotate-back\narrow-rotate-backward\n"
+            "arrow-rotate-forward\narrow-rotate-left\narrow-rotate-right\narrow-trend-down\n"
+            "arrow-trend-up\narrow-turn-right\narrow-up\narrow-up-1-9\narrow-up-9-1\narrow-up-a-z\n"
+            "arrow-up-from-bracket\narrow-up-short-wide\narrow-up-wide-short\narrow-up-z-a\n"
+            "arrows-alt\narrows-alt-h\narrows-alt-v\narrows-rotate\nasl-interpreting\nassistive-listening-systems\n"
+            "asterisk\nat\natlas\natom\naudio-description\naustral-sign\nautomobile\naward\nb\n"
+            "baby\nbaby-carriage\nbackspace\nbackward\nbackward-fast\nbackward-step\nbacon\nbacteria\n"
+            "bacterium\nbag-shopping\nbahai\nbaht-sign\nbalance-scale\nbalance-scale-left\nbalance-scale-right\n"
+            "ban\nban-smoking\nband-aid\nbandage\nbank\nbar-chart\nbarcode\nbars\nbars-staggered\n"
+            "baseball\nbaseball-ball\nbasket-shopping\nbasketball\nbasketball-ball\nbath\nbathtub\n"
+            "battery\nbattery-0\nbattery-2\nbattery-3\nbattery-4\nbattery-5\nbattery-car\nbattery-empty\n"
+            "battery-full\nbattery-half\nbattery-quarter\nbattery-three-quarters\nbed\nbed-pulse\n"
+            "beer\nbeer-mug-empty\nbell\nbell-concierge\nbell-slash\nbezier-curve\nbible\nbicycle\n"
+            "biking\nbinoculars\nbiohazard\nbirthday-cake\nbitcoin-sign\nblackboard\nblender\n"
+            "blender-phone\nblind\nblog\nbold\nbolt\nbomb\nbone\nbong\nbook\nbook-atlas\nbook-bible\n"
+            "book-dead\nbook-journal-whills\nbook-medical\nbook-open\nbook-open-reader\nbook-quran\n"
+            "book-reader\nbook-skull\nbookmark\nborder-all\nborder-none\nborder-style\nborder-top-left\n"
+            "bowling-ball\nbox\nbox-archive\nbox-open\nbox-tissue\nboxes\nboxes-alt\nboxes-stacked\n"
+            "braille\nbrain\nbread-slice\nbriefcase\nbriefcase-clock\nbriefcase-medical\nbroadcast-tower\n"
+            "broom\nbroom-ball\nbrush\nbug\nbuilding\nbullhorn\nbullseye\nburger\nburn\nbus\nbus-alt\n"
+            "bus-simple\nbusiness-time\nc\ncab\ncake-candles\ncalculator\ncalendar\ncalendar-alt\n"
+            "calendar-check\ncalendar-day\ncalendar-days\ncalendar-minus\ncalendar-plus\ncalendar-times\n"
+            "calendar-week\ncalendar-xmark\ncamera\ncamera-alt\ncamera-retro\ncamera-rotate\n"
+            "campground\ncancel\ncandy-cane\ncannabis\ncapsules\ncar\ncar-alt\ncar-battery\ncar-crash\n"
+            "car-rear\ncar-side\ncaravan\ncaret-down\ncaret-left\ncaret-right\ncaret-square-down\n"
+            "caret-square-left\ncaret-square-right\ncaret-square-up\ncaret-up\ncarriage-baby\n"
+            "carrot\ncart-arrow-down\ncart-flatbed\ncart-flatbed-suitcase\ncart-plus\ncart-shopping\n"
+            "cash-register\ncat\ncedi-sign\ncent-sign\ncertificate\nchain\nchain-broken\nchain-slash\n"
+            "chair\nchalkboard\nchalkboard-teacher\nchalkboard-user\nchampagne-glasses\ncharging-station\n"
+            "chart-area\nchart-bar\nchart-gantt\nchart-line\nchart-pie\ncheck\ncheck-circle\n"
+            "check-double\ncheck-square\ncheck-to-slot\ncheese\nchess\nchess-bishop\nchess-board\n"
+            "chess-king\nchess-knight\nchess-pawn\nchess-queen\nchess-rook\nchevron-circle-down\n"
+            "chevron-circle-left\nchevron-circle-right\nchevron-circle-up\nchevron-down\nchevron-left\n"
+            "chevron-right\nchevron-up\nchild\nchurch\ncircle\ncircle-arrow-down\ncircle-arrow-left\n"
+            "circle-arrow-right\ncircle-arrow-up\ncircle-check\ncircle-chevron-down\ncircle-chevron-left\n"
+            "circle-chevron-right\ncircle-chevron-up\ncircle-dollar-to-slot\ncircle-dot\ncircle-down\n"
+            "circle-exclamation\ncircle-h\ncircle-half-stroke\ncircle-info\ncircle-left\ncircle-minus\n"
+            "circle-notch\ncircle-pause\ncircle-play\ncircle-plus\ncircle-question\ncircle-radiation\n"
+            "circle-right\ncircle-stop\ncircle-up\ncircle-user\ncircle-xmark\ncity\nclapperboard\n"
+            "clipboard\nclipboard-check\nclipboard-list\nclock\nclock-four\nclock-rotate-left\n"
+            "clone\nclose\nclosed-captioning\ncloud\ncloud-arrow-down\ncloud-arrow-up\ncloud-download\n"
+            "cloud-download-alt\ncloud-meatball\ncloud-moon\ncloud-moon-rain\ncloud-rain\ncloud-showers-heavy\n"
+            "cloud-sun\ncloud-sun-rain\ncloud-upload\ncloud-upload-alt\nclover\ncny\ncocktail\n"
+            "code\ncode-branch\ncode-commit\ncode-compare\ncode-fork\ncode-merge\ncode-pull-request\n"
+            "coffee\ncog\ncogs\ncoins\ncolon-sign\ncolumns\ncomment\ncomment-alt\ncomment-dollar\n"
+            "comment-dots\ncomment-medical\ncomment-slash\ncomment-sms\ncommenting\ncomments\n"
+            "comments-dollar\ncompact-disc\ncompass\ncompass-drafting\ncompress\ncompress-alt\n"
+            "compress-arrows-alt\ncomputer-mouse\nconcierge-bell\ncontact-book\ncontact-card\n"
+            "cookie\ncookie-bite\ncopy\ncopyright\ncouch\ncredit-card\ncredit-card-alt\ncrop\n"
+            "crop-alt\ncrop-simple\ncross\ncrosshairs\ncrow\ncrown\ncrutch\ncruzeiro-sign\ncube\n"
+            "cubes\ncut\ncutlery\nd\ndatabase\ndeaf\ndeafness\ndedent\ndelete-left\ndemocrat\ndesktop\n"
+            "desktop-alt\ndharmachakra\ndiagnoses\ndiagram-project\ndiamond-turn-right\ndice\n"
+            "dice-d20\ndice-d6\ndice-five\ndice-four\ndice-one\ndice-six\ndice-three\ndice-two\n"
+            "digital-tachograph\ndirections\ndisease\ndivide\ndizzy\ndna\ndog\ndollar\ndollar-sign\n"
+            "dolly\ndolly-box\ndolly-flatbed\ndonate\ndong-sign\ndoor-closed\ndoor-open\ndot-circle\n"
+            "dove\ndown-left-and-up-right-to-center\ndown-long\ndownload\ndrafting-compass\n"
+            "dragon\ndraw-polygon\ndrivers-license\ndroplet\ndroplet-slash\ndrum\ndrum-steelpan\n"
+            "drumstick-bite\ndumbbell\ndumpster\ndumpster-fire\ndungeon\ne\near-deaf\near-listen\n"
+            "earth\nearth-africa\nearth-americas\nearth-asia\nearth-europa\nedit\negg\neject\n"
+            "elevator\nellipsis\nellipsis-h\nellipsis-v\nellipsis-vertical\nenvelope\nenvelope-open\n"
+            "envelope-open-text\nenvelope-square\nenvelopes-bulk\nequals\neraser\nethernet\n"
+            "eur\neuro\neuro-sign\nexchange-alt\nexclamation\nexclamation-circle\nexclamation-triangle\n"
+            "expand\nexpand-alt\nexpand-arrows-alt\nexternal-link-alt\nexternal-link-square-alt\n"
+            "eye\neye-dropper\neye-dropper-empty\neye-low-vision\neye-slash\neyedropper\nf\nface-angry\n"
+            "face-dizzy\nface-flushed\nface-frown\nface-frown-open\nface-grimace\nface-grin\n"
+            "face-grin-beam\nface-grin-beam-sweat\nface-grin-hearts\nface-grin-squint\nface-grin-squint-tears\n"
+            "face-grin-stars\nface-grin-tears\nface-grin-tongue\nface-grin-tongue-squint\n"
+            "face-grin-tongue-wink\nface-grin-wide\nface-grin-wink\nface-kiss\nface-kiss-beam\n"
+            "face-kiss-wink-heart\nface-laugh\nface-laugh-beam\nface-laugh-squint\nface-laugh-wink\n"
+            "face-meh\nface-meh-blank\nface-rolling-eyes\nface-sad-cry\nface-sad-tear\nface-smile\n"
+            "face-smile-beam\nface-smile-wink\nface-surprise\nface-tired\nfan\nfast-backward\n"
+            "fast-forward\nfaucet\nfax\nfeather\nfeather-alt\nfeather-pointed\nfeed\nfemale\nfighter-jet\n"
+            "file\nfile-alt\nfile-archive\nfile-arrow-down\nfile-arrow-up\nfile-audio\nfile-clipboard\n"
+            "file-code\nfile-contract\nfile-csv\nfile-download\nfile-excel\nfile-export\nfile-image\n"
+            "file-import\nfile-invoice\nfile-invoice-dollar\nfile-lines\nfile-medical\nfile-medical-alt\n"
+            "file-pdf\nfile-powerpoint\nfile-prescription\nfile-signature\nfile-text\nfile-upload\n"
+            "file-video\nfile-waveform\nfile-word\nfile-zipper\nfill\nfill-drip\nfilm\nfilter\n"
+            "filter-circle-dollar\nfilter-circle-xmark\nfingerprint\nfire\nfire-alt\nfire-extinguisher\n"
+            "fire-flame-curved\nfire-flame-simple\nfirst-aid\nfish\nfist-raised\nflag\nflag-checkered\n"
+            "flag-usa\nflash\nflask\nfloppy-disk\nflorin-sign\nflushed\nfolder\nfolder-minus\n"
+            "folder-open\nfolder-plus\nfolder-tree\nfont\nfont-awesome\nfont-awesome-flag\nfont-awesome-logo-full\n"
+            "football\nfootball-ball\nforward\nforward-fast\nforward-step\nfranc-sign\nfrog\n"
+            "frown\nfrown-open\nfunnel-dollar\nfutbol\nfutbol-ball\ng\ngamepad\ngas-pump\ngauge-simple\n"
+            "gauge-simple-high\ngavel\ngbp\ngear\ngears\ngem\ngenderless\nghost\ngift\ngifts\nglass-cheers\n"
+            "glass-martini\nglass-martini-alt\nglass-whiskey\nglasses\nglobe\nglobe-africa\n"
+            "globe-americas\nglobe-asia\nglobe-europe\ngolf-ball\ngolf-ball-tee\ngopuram\ngraduation-cap\n"
+            "greater-than\ngreater-than-equal\ngrimace\ngrin\ngrin-alt\ngrin-beam\ngrin-beam-sweat\n"
+            "grin-hearts\ngrin-squint\ngrin-squint-tears\ngrin-stars\ngrin-tears\ngrin-tongue\n"
+            "grin-tongue-squint\ngrin-tongue-wink\ngrin-wink\ngrip\ngrip-horizontal\ngrip-lines\n"
+            "grip-lines-vertical\ngrip-vertical\ngroup\nguarani-sign\nguitar\ngun\nh\nh-square\n"
+            "hamburger\nhammer\nhamsa\nhand\nhand-back-fist\nhand-dots\nhand-fist\nhand-holding\n"
+            "hand-holding-dollar\nhand-holding-droplet\nhand-holding-heart\nhand-holding-medical\n"
+            "hand-holding-usd\nhand-holding-water\nhand-lizard\nhand-middle-finger\nhand-paper\n"
+            "hand-peace\nhand-point-down\nhand-point-left\nhand-point-right\nhand-point-up\n"
+            "hand-pointer\nhand-rock\nhand-scissors\nhand-sparkles\nhand-spock\nhands\nhands-american-sign-language-interpreting\n"
+            "hands-asl-interpreting\nhands-bubbles\nhands-clapping\nhands-helping\nhands-holding\n"
+            "hands-praying\nhands-wash\nhandshake\nhandshake-alt-slash\nhandshake-angle\nhandshake-simple-slash\n"
+            "handshake-slash\nhanukiah\nhard-drive\nhard-hat\nhard-of-hearing\nhashtag\nhat-cowboy\n"
+            "hat-cowboy-side\nhat-hard\nhat-wizard\nhdd\nhead-side-cough\nhead-side-cough-slash\n"
+            "head-side-mask\nhead-side-virus\nheader\nheading\nheadphones\nheadphones-alt\nheadphones-simple\n"
+            "headset\nheart\nheart-broken\nheart-crack\nheart-music-camera-bolt\nheart-pulse\n"
+            "heartbeat\nhelicopter\nhelmet-safety\nhighlighter\nhiking\nhippo\nhistory\nhockey-puck\n"
+            "holly-berry\nhome\nhome-lg\nhome-user\nhorse\nhorse-head\nhospital\nhospital-alt\n"
+            "hospital-symbol\nhospital-user\nhospital-wide\nhot-tub\nhot-tub-person\nhotdog\n"
+            "hotel\nhourglass\nhourglass-1\nhourglass-2\nhourglass-3\nhourglass-empty\nhourglass-end\n"
+            "hourglass-half\nhourglass-start\nhouse\nhouse-chimney\nhouse-crack\nhouse-laptop\n"
+            "house-medical\nhouse-user\nhryvnia\nhryvnia-sign\ni\ni-cursor\nice-cream\nicicles\n"
+            "icons\nid-badge\nid-card\nid-card-alt\nid-card-clip\nigloo\nils\nimage\nimage-portrait\n"
+            "images\ninbox\nindent\nindian-rupee\nindian-rupee-sign\nindustry\ninfinity\ninfo\n"
+            "info-circle\ninr\ninstitution\nitalic\nj\njedi\njet-fighter\njoint\njournal-whills\n"
+            "jpy\nk\nkaaba\nkey\nkeyboard\nkhanda\nkip-sign\nkiss\nkiss-beam\nkiss-wink-heart\nkit-medical\n"
+            "kiwi-bird\nkrw\nl\nladder-water\nlandmark\nlanguage\nlaptop\nlaptop-code\nlaptop-house\n"
+            "laptop-medical\nlari-sign\nlaugh\nlaugh-beam\nlaugh-squint\nlaugh-wink\nlayer-group\n"
+            "leaf\nleft-long\nleft-right\nlegal\nlemon\nless-than\nless-than-equal\nlevel-down-alt\n"
+            "level-up-alt\nlife-ring\nlightbulb\nline-chart\nlink\nlink-slash\nlira-sign\nlist\n"
+            "list-1-2\nlist-alt\nlist-check\nlist-dots\nlist-numeric\nlist-ol\nlist-squares\n"
+            "list-ul\nlitecoin-sign\nlocation\nlocation-arrow\nlocation-dot\nlock\nlock-open\n"
+            "long-arrow-alt-down\nlong-arrow-alt-left\nlong-arrow-alt-right\nlong-arrow-alt-up\n"
+            "low-vision\nluggage-cart\nlungs\nlungs-virus\nm\nmagic\nmagnet\nmagnifying-glass\n"
+            "magnifying-glass-dollar\nmagnifying-glass-location\nmagnifying-glass-minus\n"
+            "magnifying-glass-plus\nmail-bulk\nmail-forward\nmail-reply\nmail-reply-all\nmale\n"
+            "manat-sign\nmap\nmap-location\nmap-location-dot\nmap-marked\nmap-marked-alt\nmap-marker\n"
+            "map-marker-alt\nmap-pin\nmap-signs\nmarker\nmars\nmars-and-venus\nmars-double\nmars-stroke\n"
+            "mars-stroke-h\nmars-stroke-right\nmars-stroke-up\nmars-stroke-v\nmartini-glass\n"
+            "martini-glass-citrus\nmartini-glass-empty\nmask\nmask-face\nmasks-theater\nmaximize\n"
+            "medal\nmedkit\nmeh\nmeh-blank\nmeh-rolling-eyes\nmemory\nmenorah\nmercury\nmessage\n"
+            "meteor\nmicrochip\nmicrophone\nmicrophone-alt\nmicrophone-alt-slash\nmicrophone-lines\n"
+            "microphone-lines-slash\nmicrophone-slash\nmicroscope\nmill-sign\nminimize\nminus\n"
+            "minus-circle\nminus-square\nmitten\nmobile-alt\nmobile-button\nmobile-screen-button\n"
+            "money-bill\nmoney-bill-1\nmoney-bill-1-wave\nmoney-bill-alt\nmoney-bill-wave\n"
+            "money-bill-wave-alt\nmoney-check\nmoney-check-alt\nmoney-check-dollar\nmonument\n"
+            "moon\nmortar-board\nmortar-pestle\nmosque\nmotorcycle\nmountain\nmouse\nmouse-pointer\n"
+            "mug-hot\nmug-saucer\nmultiply\nmusic\nn\nnaira-sign\nnavicon\nnetwork-wired\nneuter\n"
+            "newspaper\nnot-equal\nnote-sticky\nnotes-medical\no\nobject-group\nobject-ungroup\n"
+            "oil-can\nom\notter\noutdent\np\npager\npaint-brush\npaint-roller\npalette\npallet\n"
+            "panorama\npaper-plane\npaperclip\nparachute-box\nparagraph\nparking\npassport\npastafarianism\n"
+            "paste\npause\npause-circle\npaw\npeace\npen\npen-alt\npen-clip\npen-fancy\npen-nib\n"
+            "pen-ruler\npen-square\npen-to-square\npencil\npencil-alt\npencil-ruler\npencil-square\n"
+            "people-arrows\npeople-arrows-left-right\npeople-carry\npeople-carry-box\npepper-hot\n"
+            "percent\npercentage\nperson\nperson-biking\nperson-booth\nperson-dots-from-line\n"
+            "person-dress\nperson-hiking\nperson-praying\nperson-running\nperson-skating\nperson-skiing\n"
+            "person-skiing-nordic\nperson-snowboarding\nperson-swimming\nperson-walking\nperson-walking-with-cane\n"
+            "peseta-sign\npeso-sign\nphone\nphone-alt\nphone-flip\nphone-slash\nphone-square\n"
+            "phone-square-alt\nphone-volume\nphoto-film\nphoto-video\npie-chart\npiggy-bank\n"
+            "pills\nping-pong-paddle-ball\npizza-slice\nplace-of-worship\nplane\nplane-arrival\n"
+            "plane-departure\nplane-slash\nplay\nplay-circle\nplug\nplus\nplus-circle\nplus-minus\n"
+            "plus-square\npodcast\npoll\npoll-h\npoo\npoo-bolt\npoo-storm\npoop\nportrait\npound-sign\n"
+            "power-off\npray\npraying-hands\nprescription\nprescription-bottle\nprescription-bottle-alt\n"
+            "prescription-bottle-medical\nprint\nprocedures\nproject-diagram\npump-medical\n"
+            "pump-soap\npuzzle-piece\nq\nqrcode\nquestion\nquestion-circle\nquidditch\nquidditch-broom-ball\n"
+            "quote-left\nquote-left-alt\nquote-right\nquote-right-alt\nquran\nr\nradiation\nradiation-alt\n"
+            "rainbow\nrandom\nreceipt\nrecord-vinyl\nrectangle-ad\nrectangle-list\nrectangle-times\n"
+            "rectangle-xmark\nrecycle\nredo\nrefresh\nregistered\nremove\nremove-format\nreorder\n"
+            "repeat\nreply\nreply-all\nrepublican\nrestroom\nretweet\nribbon\nright-from-bracket\n"
+            "right-left\nright-long\nright-to-bracket\nring\nrmb\nroad\nrobot\nrocket\nrotate\n"
+            "rotate-back\nrotate-backward\nrotate-left\nrouble\nroute\nrss\nrss-square\nrub\nruble\n"
+            "ruble-sign\nruler\nruler-combined\nruler-horizontal\nruler-vertical\nrunning\nrupee\n"
+            "rupee-sign\nrupiah-sign\ns\nsad-cry\nsad-tear\nsatellite\nsatellite-dish\nsave\nscale-balanced\n"
+            "scale-unbalanced\nscale-unbalanced-flip\nschool\nscissors\nscrewdriver\nscrewdriver-wrench\n"
+            "scroll\nscroll-torah\nsd-card\nsearch\nsearch-dollar\nsearch-location\nsearch-minus\n"
+            "search-plus\nsection\nseedling\nserver\nshapes\nshare\nshare-alt\nshare-alt-square\n"
+            "share-from-square\nshare-nodes\nshare-square\nshekel\nshekel-sign\nsheqel\nsheqel-sign\n"
+            "shield-alt\nshield-blank\nshield-virus\nship\nshipping-fast\nshirt\nshoe-prints\n"
+            "shop\nshop-slash\nshopping-bag\nshopping-basket\nshopping-cart\nshower\nshuffle\n"
+            "shuttle-space\nshuttle-van\nsign\nsign-hanging\nsign-in-alt\nsign-language\nsign-out-alt\n"
+            "signal\nsignal-5\nsignal-perfect\nsignature\nsigning\nsigns-post\nsim-card\nsink\n"
+            "sitemap\nskating\nskiing\nskiing-nordic\nskull\nskull-crossbones\nslash\nsleigh\n"
+            "sliders\nsliders-h\nsmile\nsmile-beam\nsmile-wink\nsmog\nsmoking\nsmoking-ban\nsms\n"
+            "snowboarding\nsnowflake\nsnowman\nsnowplow\nsoap\nsoccer-ball\nsocks\nsolar-panel\n"
+            "sort\nsort-alpha-asc\nsort-alpha-desc\nsort-alpha-down\nsort-alpha-down-alt\nsort-alpha-up\n"
+            "sort-alpha-up-alt\nsort-amount-asc\nsort-amount-desc\nsort-amount-down\nsort-amount-down-alt\n"
+            "sort-amount-up\nsort-amount-up-alt\nsort-asc\nsort-desc\nsort-down\nsort-numeric-asc\n"
+            "sort-numeric-desc\nsort-numeric-down\nsort-numeric-down-alt\nsort-numeric-up\n"
+            "sort-numeric-up-alt\nsort-up\nspa\nspace-shuttle\nspaghetti-monster-flying\nspell-check\n"
+            "spider\nspinner\nsplotch\nspoon\nspray-can\nspray-can-sparkles\nsprout\nsquare\nsquare-caret-down\n"
+            "square-caret-left\nsquare-caret-right\nsquare-caret-up\nsquare-check\nsquare-envelope\n"
+            "square-full\nsquare-h\nsquare-minus\nsquare-parking\nsquare-pen\nsquare-phone\n"
+            "square-phone-flip\nsquare-plus\nsquare-poll-horizontal\nsquare-poll-vertical\n"
+            "square-root-alt\nsquare-root-variable\nsquare-rss\nsquare-share-nodes\nsquare-up-right\n"
+            "stairs\nstamp\nstar\nstar-and-crescent\nstar-half\nstar-half-alt\nstar-half-stroke\n"
+            "star-of-david\nstar-of-life\nstep-backward\nstep-forward\nsterling-sign\nstethoscope\n"
+            "sticky-note\nstop\nstop-circle\nstopwatch\nstopwatch-20\nstore\nstore-alt\nstore-alt-slash\n"
+            "store-slash\nstream\nstreet-view\nstrikethrough\nstroopwafel\nsubscript\nsubtract\n"
+            "subway\nsuitcase\nsuitcase-medical\nsuitcase-rolling\nsun\nsuperscript\nsurprise\n"
+            "swatchbook\nswimmer\nswimming-pool\nsynagogue\nsync\nsync-alt\nsyringe\nt\nt-shirt\n"
+            "table\ntable-cells\ntable-cells-large\ntable-columns\ntable-list\ntable-tennis\n"
+            "table-tennis-paddle-ball\ntablet-alt\ntablet-button\ntablet-screen-button\ntablets\n"
+            "tachograph-digital\ntachometer\ntag\ntags\ntape\ntasks\ntaxi\nteeth\nteeth-open\nteletype\n"
+            "television\ntemperature-0\ntemperature-1\ntemperature-2\ntemperature-3\ntemperature-4\n"
+            "temperature-empty\ntemperature-full\ntemperature-half\ntemperature-high\ntemperature-low\n"
+            "temperature-quarter\ntemperature-three-quarters\ntenge\ntenge-sign\nterminal\n"
+            "text-height\ntext-slash\ntext-width\nth\nth-large\nth-list\ntheater-masks\nthermometer\n"
+            "thermometer-0\nthermometer-1\nthermometer-2\nthermometer-3\nthermometer-4\nthermometer-empty\n"
+            "thermometer-full\nthermometer-half\nthermometer-quarter\nthermometer-three-quarters\n"
+            "thumb-tack\nthumbs-down\nthumbs-up\nthumbtack\nticket-alt\nticket-simple\ntimeline\n"
+            "times\ntimes-circle\ntimes-rectangle\ntint\ntint-slash\ntired\ntoggle-off\ntoggle-on\n"
+            "toilet\ntoilet-paper\ntoilet-paper-slash\ntoolbox\ntools\ntooth\ntorah\ntorii-gate\n"
+            "tower-broadcast\ntractor\ntrademark\ntraffic-light\ntrailer\ntrain\ntrain-subway\n"
+            "train-tram\ntram\ntransgender\ntransgender-alt\ntrash\ntrash-alt\ntrash-arrow-up\n"
+            "trash-can\ntrash-can-arrow-up\ntrash-restore\ntrash-restore-alt\ntree\ntriangle-circle-square\n"
+            "triangle-exclamation\ntrophy\ntruck\ntruck-fast\ntruck-loading\ntruck-medical\n"
+            "truck-monster\ntruck-moving\ntruck-pickup\ntruck-ramp-box\ntry\ntshirt\ntty\nturkish-lira\n"
+            "turkish-lira-sign\nturn-down\nturn-up\ntv\ntv-alt\nu\numbrella\numbrella-beach\nunderline\n"
+            "undo\nundo-alt\nuniversal-access\nuniversity\nunlink\nunlock\nunlock-alt\nunlock-keyhole\n"
+            "unsorted\nup-down\nup-down-left-right\nup-long\nup-right-and-down-left-from-center\n"
+            "up-right-from-square\nupload\nusd\nuser\nuser-alt\nuser-alt-slash\nuser-astronaut\n"
+            "user-check\nuser-circle\nuser-clock\nuser-cog\nuser-doctor\nuser-edit\nuser-friends\n"
+            "user-gear\nuser-graduate\nuser-group\nuser-injured\nuser-large\nuser-large-slash\n"
+            "user-lock\nuser-md\nuser-minus\nuser-ninja\nuser-nurse\nuser-pen\nuser-plus\nuser-secret\n"
+            "user-shield\nuser-slash\nuser-tag\nuser-tie\nuser-times\nuser-xmark\nusers\nusers-cog\n"
+            "users-gear\nusers-slash\nutensil-spoon\nutensils\nv\nvan-shuttle\nvault\nvcard\nvector-square\n"
+            "venus\nvenus-double\nvenus-mars\nvest\nvest-patches\nvial\nvials\nvideo\nvideo-camera\n"
+            "video-slash\nvihara\nvirus\nvirus-slash\nviruses\nvoicemail\nvolleyball\nvolleyball-ball\n"
+            "volume-control-phone\nvolume-down\nvolume-high\nvolume-low\nvolume-mute\nvolume-off\n"
+            "volume-times\nvolume-up\nvolume-xmark\nvote-yea\nvr-cardboard\nw\nwalking\nwallet\n"
+            "wand-magic\nwarehouse\nwarning\nwater\nwater-ladder\nwave-square\nweight\nweight-hanging\n"
+            "weight-scale\nwheelchair\nwhiskey-glass\nwifi\nwifi-3\nwifi-strong\nwind\nwindow-close\n"
+            "window-maximize\nwindow-minimize\nwindow-restore\nwine-bottle\nwine-glass\nwine-glass-alt\n"
+            "wine-glass-empty\nwon\nwon-sign\nwrench\nx\nx-ray\nxmark\nxmark-circle\ny\nyen\nyen-sign\n"
+            "yin-yang\nz",
+            "\ue2d2\ue2d3\ue2d4\ue2d5\ue2d6\ue2d7\ue2d8\ue2d9\ue2da\ue2db\ue2dd\uf641"
+            "\uf067\uf2b9\uf2bb\uf042\uf5d0\uf037\uf039\uf036\uf038\uf461\uf0f9\uf2a3"
+            "\uf13d\uf103\uf100\uf101\uf102\uf107\uf104\uf105\uf106\uf103\uf100\uf101"
+            "\uf102\uf556\uf644\uf5d1\uf5d1\uf187\uf557\uf1fe\uf358\uf359\uf35a\uf35b"
+            "\uf0ab\uf0a8\uf0a9\uf0aa\uf063\uf162\uf886\uf15d\uf884\uf160\uf881\uf060"
+            "\uf0e2\uf245\uf061\uf56e\uf01e\uf56f\uf0e2\uf0e2\uf01e\uf0e2\uf01e\ue097"
+            "\ue098\uf064\uf062\uf163\uf887\uf15e\ue09a\uf885\uf161\uf882\uf0b2\uf337"
+            "\uf338\uf021\uf2a3\uf2a2\uf069\uf1fa\uf558\uf5d2\uf29e\ue0a9\uf1b9\uf559"
+            "\ue2e2\uf77c\uf77d\uf55a\uf04a\uf049\uf048\uf7e5\ue059\ue05a\uf290\uf666"
+            "\ue0ac\uf24e\uf515\uf516\uf05e\uf54d\uf462\uf462\uf19c\uf080\uf02a\uf0c9"
+            "\uf550\uf433\uf433\uf291\uf434\uf434\uf2cd\uf2cd\uf240\uf244\uf243\uf242"
+            "\uf241\uf240\uf5df\uf244\uf240\uf242\uf243\uf241\uf236\uf487\uf0fc\uf0fc"
+            "\uf0f3\uf562\uf1f6\uf55b\uf647\uf206\uf84a\uf1e5\uf780\uf1fd\ue0b4\uf51b"
+            "\uf517\uf6b6\uf29d\uf781\uf032\uf0e7\uf1e2\uf5d7\uf55c\uf02d\uf558\uf647"
+            "\uf6b7\uf66a\uf7e6\uf518\uf5da\uf687\uf5da\uf6b7\uf02e\uf84c\uf850\uf853"
+            "\uf853\uf436\uf466\uf187\uf49e\ue05b\uf468\uf468\uf468\uf2a1\uf5dc\uf7ec"
+            "\uf0b1\uf64a\uf469\uf519\uf51a\uf458\uf55d\uf188\uf1ad\uf0a1\uf140\uf805"
+            "\uf46a\uf207\uf55e\uf55e\uf64a\ue2f3\uf1ba\uf1fd\uf1ec\uf133\uf073\uf274"
+            "\uf783\uf073\uf272\uf271\uf273\uf784\uf273\uf030\uf030\uf083\ue0d8\uf6bb"
+            "\uf05e\uf786\uf55f\uf46b\uf1b9\uf5de\uf5df\uf5e1\uf5de\uf5e4\uf8ff\uf0d7"
+            "\uf0d9\uf0da\uf150\uf191\uf152\uf151\uf0d8\uf77d\uf787\uf218\uf474\uf59d"
+            "\uf217\uf07a\uf788\uf6be\ue0df\ue0e0\uf0a3\uf0c1\uf127\uf127\uf6c0\uf51b"
+            "\uf51c\uf51c\uf79f\uf5e7\uf1fe\uf080\ue0e4\uf201\uf200\uf00c\uf058\uf560"
+            "\uf14a\uf772\uf7ef\uf439\uf43a\uf43c\uf43f\uf441\uf443\uf445\uf447\uf13a"
+            "\uf137\uf138\uf139\uf078\uf053\uf054\uf077\uf1ae\uf51d\uf111\uf0ab\uf0a8"
+            "\uf0a9\uf0aa\uf058\uf13a\uf137\uf138\uf139\uf4b9\uf192\uf358\uf06a\uf47e"
+            "\uf042\uf05a\uf359\uf056\uf1ce\uf28b\uf144\uf055\uf059\uf7ba\uf35a\uf28d"
+            "\uf35b\uf2bd\uf057\uf64f\ue131\uf328\uf46c\uf46d\ue33e\ue33e\uf1da\uf24d"
+            "\uf00d\uf20a\uf0c2\uf0ed\uf0ee\uf0ed\uf0ed\uf73b\uf6c3\uf73c\uf73d\uf740"
+            "\uf6c4\uf743\uf0ee\uf0ee\ue139\uf157\uf561\uf121\uf126\uf386\ue13a\ue13b"
+            "\uf387\ue13c\uf0f4\uf013\uf085\uf51e\ue140\uf0db\uf075\uf27a\uf651\uf4ad"
+            "\uf7f5\uf4b3\uf7cd\uf4ad\uf086\uf653\uf51f\uf14e\uf568\uf066\uf422\uf78c"
+            "\uf8cc\uf562\uf2b9\uf2bb\uf563\uf564\uf0c5\uf1f9\uf4b8\uf09d\uf09d\uf125"
+            "\uf565\uf565\uf654\uf05b\uf520\uf521\uf7f7\ue152\uf1b2\uf1b3\uf0c4\uf2e7"
+            "\ue2f9\uf1c0\uf2a4\uf2a4\uf03b\uf55a\uf747\uf108\uf108\uf655\uf470\uf542"
+            "\uf5eb\uf522\uf6cf\uf6d1\uf523\uf524\uf525\uf526\uf527\uf528\uf566\uf5eb"
+            "\uf7fa\uf529\uf567\uf471\uf6d3\uf155\uf155\uf472\uf472\uf474\uf4b9\ue169"
+            "\uf52a\uf52b\uf192\uf4ba\uf422\uf309\uf019\uf568\uf6d5\uf5ee\uf2c2\uf043"
+            "\uf5c7\uf569\uf56a\uf6d7\uf44b\uf793\uf794\uf6d9\ue2fc\uf2a4\uf2a2\uf57d"
+            "\uf57c\uf57d\uf57e\uf7a2\uf044\uf7fb\uf052\ue16d\uf141\uf141\uf142\uf142"
+            "\uf0e0\uf2b6\uf658\uf199\uf674\uf52c\uf12d\uf796\uf153\uf153\uf153\uf362"
+            "\uf12a\uf06a\uf071\uf065\uf424\uf31e\uf35d\uf360\uf06e\uf1fb\uf1fb\uf2a8"
+            "\uf070\uf1fb\ue2fd\uf556\uf567\uf579\uf119\uf57a\uf57f\uf580\uf582\uf583"
+            "\uf584\uf585\uf586\uf587\uf588\uf589\uf58a\uf58b\uf581\uf58c\uf596\uf597"
+            "\uf598\uf599\uf59a\uf59b\uf59c\uf11a\uf5a4\uf5a5\uf5b3\uf5b4\uf118\uf5b8"
+            "\uf4da\uf5c2\uf5c8\uf863\uf049\uf050\ue005\uf1ac\uf52d\uf56b\uf56b\uf09e"
+            "\uf182\uf0fb\uf15b\uf15c\uf1c6\uf56d\uf574\uf1c7\uf0ea\uf1c9\uf56c\uf6dd"
+            "\uf56d\uf1c3\uf56e\uf1c5\uf56f\uf570\uf571\uf15c\uf477\uf478\uf1c1\uf1c4"
+            "\uf572\uf573\uf15c\uf574\uf1c8\uf478\uf1c2\uf1c6\uf575\uf576\uf008\uf0b0"
+            "\uf662\ue17b\uf577\uf06d\uf7e4\uf134\uf7e4\uf46a\uf479\uf578\uf6de\uf024"
+            "\uf11e\uf74d\uf0e7\uf0c3\uf0c7\ue184\uf579\uf07b\uf65d\uf07c\uf65e\uf802"
+            "\uf031\uf2b4\uf2b4\uf2b4\uf44e\uf44e\uf04e\uf050\uf051\ue18f\uf52e\uf119"
+            "\uf57a\uf662\uf1e3\uf1e3\ue305\uf11b\uf52f\uf62a\uf62a\uf0e3\uf154\uf013"
+            "\uf085\uf3a5\uf22d\uf6e2\uf06b\uf79c\uf79f\uf000\uf57b\uf7a0\uf530\uf0ac"
+            "\uf57c\uf57d\uf57e\uf7a2\uf450\uf450\uf664\uf19d\uf531\uf532\uf57f\uf580"
+            "\uf581\uf582\uf583\uf584\uf585\uf586\uf587\uf588\uf589\uf58a\uf58b\uf58c"
+            "\uf58d\uf58d\uf7a4\uf7a5\uf58e\uf0c0\ue19a\uf7a6\ue19b\ue308\uf0fd\uf805"
+            "\uf6e3\uf665\uf256\uf255\uf461\uf6de\uf4bd\uf4c0\uf4c1\uf4be\ue05c\uf4c0"
+            "\uf4c1\uf258\uf806\uf256\uf25b\uf0a7\uf0a5\uf0a4\uf0a6\uf25a\uf255\uf257"
+            "\ue05d\uf259\uf2a7\uf2a3\uf2a3\ue05e\ue1a8\uf4c4\uf4c2\uf684\ue05e\uf2b5"
+            "\ue05f\uf4c4\ue05f\ue060\uf6e6\uf0a0\uf807\uf2a4\uf292\uf8c0\uf8c1\uf807"
+            "\uf6e8\uf0a0\ue061\ue062\ue063\ue064\uf1dc\uf1dc\uf025\uf58f\uf58f\uf590"
+            "\uf004\uf7a9\uf7a9\uf86d\uf21e\uf21e\uf533\uf807\uf591\uf6ec\uf6ed\uf1da"
+            "\uf453\uf7aa\uf015\ue340\ue1b0\uf6f0\uf7ab\uf0f8\uf47d\uf47e\uf80d\uf47d"
+            "\uf593\uf593\uf80f\uf594\uf254\uf251\uf254\uf253\uf252\uf253\uf254\uf251"
+            "\uf015\ue340\ue341\ue066\ue342\ue1b0\uf6f2\uf6f2\ue309\uf246\uf810\uf7ad"
+            "\uf86d\uf2c1\uf2c2\uf47f\uf47f\uf7ae\uf20b\uf03e\uf3e0\uf302\uf01c\uf03c"
+            "\ue1bc\ue1bc\uf275\uf534\uf129\uf05a\ue1bc\uf19c\uf033\ue30a\uf669\uf0fb"
+            "\uf595\uf66a\uf157\ue30b\uf66b\uf084\uf11c\uf66d\ue1c4\uf596\uf597\uf598"
+            "\uf479\uf535\uf159\ue30d\uf5c5\uf66f\uf1ab\uf109\uf5fc\ue066\uf812\ue1c8"
+            "\uf599\uf59a\uf59b\uf59c\uf5fd\uf06c\uf30a\uf337\uf0e3\uf094\uf536\uf537"
+            "\uf3be\uf3bf\uf1cd\uf0eb\uf201\uf0c1\uf127\uf195\uf03a\uf0cb\uf022\uf0ae"
+            "\uf0ca\uf0cb\uf0cb\uf03a\uf0ca\ue1d3\uf041\uf124\uf3c5\uf023\uf3c1\uf309"
+            "\uf30a\uf30b\uf30c\uf2a8\uf59d\uf604\ue067\ue30e\uf0d0\uf076\uf002\uf688"
+            "\uf689\uf010\uf00e\uf674\uf064\uf3e5\uf122\uf183\ue1d5\uf279\uf59f\uf5a0"
+            "\uf59f\uf5a0\uf041\uf3c5\uf276\uf277\uf5a1\uf222\ue343\uf227\uf229\uf22b"
+            "\uf22b\uf22a\uf22a\uf57b\uf561\uf000\uf6fa\ue1d7\uf630\uf31e\uf5a2\uf0fa"
+            "\uf11a\uf5a4\uf5a5\uf538\uf676\uf223\uf27a\uf753\uf2db\uf130\uf3c9\uf539"
+            "\uf3c9\uf539\uf131\uf610\ue1ed\uf78c\uf068\uf056\uf146\uf7b5\uf3cd\uf10b"
+            "\uf3cd\uf0d6\uf3d1\uf53b\uf3d1\uf53a\uf53b\uf53c\uf53d\uf53d\uf5a6\uf186"
+            "\uf19d\uf5a7\uf678\uf21c\uf6fc\uf8cc\uf245\uf7b6\uf0f4\uf00d\uf001\ue314"
+            "\ue1f6\uf0c9\uf6ff\uf22c\uf1ea\uf53e\uf249\uf481\ue315\uf247\uf248\uf613"
+            "\uf679\uf700\uf03b\ue319\uf815\uf1fc\uf5aa\uf53f\uf482\ue209\uf1d8\uf0c6"
+            "\uf4cd\uf1dd\uf540\uf5ab\uf67b\uf0ea\uf04c\uf28b\uf1b0\uf67c\uf304\uf305"
+            "\uf305\uf5ac\uf5ad\uf5ae\uf14b\uf044\uf040\uf040\uf5ae\uf14b\ue068\ue068"
+            "\uf4ce\uf4ce\uf816\uf295\uf295\uf183\uf84a\uf756\uf470\uf182\uf6ec\uf683"
+            "\uf70c\uf7c5\uf7c9\uf7ca\uf7ce\uf5c4\uf554\uf29d\ue221\ue222\uf095\uf879"
+            "\uf879\uf3dd\uf098\uf87b\uf2a0\uf87c\uf87c\uf200\uf4d3\uf484\uf45d\uf818"
+            "\uf67f\uf072\uf5af\uf5b0\ue069\uf04b\uf144\uf1e6\uf067\uf055\ue230\uf0fe"
+            "\uf2ce\uf681\uf682\uf2fe\uf75a\uf75a\uf619\uf3e0\uf154\uf011\uf683\uf684"
+            "\uf5b1\uf485\uf486\uf486\uf02f\uf487\uf542\ue06a\ue06b\uf12e\ue320\uf029"
+            "\uf128\uf059\uf458\uf458\uf10d\uf10d\uf10e\uf10e\uf687\ue321\uf7b9\uf7ba"
+            "\uf75b\uf074\uf543\uf8d9\uf641\uf022\uf410\uf410\uf1b8\uf01e\uf021\uf25d"
+            "\uf00d\uf87d\uf550\uf363\uf3e5\uf122\uf75e\uf7bd\uf079\uf4d6\uf2f5\uf362"
+            "\uf30b\uf2f6\uf70b\uf157\uf018\uf544\uf135\uf2f1\uf2ea\uf2ea\uf2ea\uf158"
+            "\uf4d7\uf09e\uf143\uf158\uf158\uf158\uf545\uf546\uf547\uf548\uf70c\uf156"
+            "\uf156\ue23d\ue325\uf5b3\uf5b4\uf7bf\uf7c0\uf0c7\uf24e\uf515\uf516\uf549"
+            "\uf0c4\uf54a\uf7d9\uf70e\uf6a0\uf7c2\uf002\uf688\uf689\uf010\uf00e\ue245"
+            "\uf4d8\uf233\uf61f\uf064\uf1e0\uf1e1\uf14d\uf1e0\uf14d\uf20b\uf20b\uf20b"
+            "\uf20b\uf3ed\uf3ed\ue06c\uf21a\uf48b\uf553\uf54b\uf54f\ue070\uf290\uf291"
+            "\uf07a\uf2cc\uf074\uf197\uf5b6\uf4d9\uf4d9\uf2f6\uf2a7\uf2f5\uf012\uf012"
+            "\uf012\uf5b7\uf2a7\uf277\uf7c4\ue06d\uf0e8\uf7c5\uf7c9\uf7ca\uf54c\uf714"
+            "\uf715\uf7cc\uf1de\uf1de\uf118\uf5b8\uf4da\uf75f\uf48d\uf54d\uf7cd\uf7ce"
+            "\uf2dc\uf7d0\uf7d2\ue06e\uf1e3\uf696\uf5ba\uf0dc\uf15d\uf881\uf15d\uf881"
+            "\uf15e\uf882\uf160\uf884\uf160\uf884\uf161\uf885\uf0de\uf0dd\uf0dd\uf162"
+            "\uf886\uf162\uf886\uf163\uf887\uf0de\uf5bb\uf197\uf67b\uf891\uf717\uf110"
+            "\uf5bc\uf2e5\uf5bd\uf5d0\uf4d8\uf0c8\uf150\uf191\uf152\uf151\uf14a\uf199"
+            "\uf45c\uf0fd\uf146\uf540\uf14b\uf098\uf87b\uf0fe\uf682\uf681\uf698\uf698"
+            "\uf143\uf1e1\uf360\ue289\uf5bf\uf005\uf699\uf089\uf5c0\uf5c0\uf69a\uf621"
+            "\uf048\uf051\uf154\uf0f1\uf249\uf04d\uf28d\uf2f2\ue06f\uf54e\uf54f\ue070"
+            "\ue071\uf550\uf21d\uf0cc\uf551\uf12c\uf068\uf239\uf0f2\uf0fa\uf5c1\uf185"
+            "\uf12b\uf5c2\uf5c3\uf5c4\uf5c5\uf69b\uf021\uf2f1\uf48e\ue32c\uf553\uf0ce"
+            "\uf00a\uf009\uf0db\uf00b\uf45d\uf45d\uf3fa\uf10a\uf3fa\uf490\uf566\uf62a"
+            "\uf02b\uf02c\uf4db\uf0ae\uf1ba\uf62e\uf62f\uf1e4\uf26c\uf2cb\uf2ca\uf2c9"
+            "\uf2c8\uf2c7\uf2cb\uf2c7\uf2c9\uf769\uf76b\uf2ca\uf2c8\uf7d7\uf7d7\uf120"
+            "\uf034\uf87d\uf035\uf00a\uf009\uf00b\uf630\uf491\uf2cb\uf2ca\uf2c9\uf2c8"
+            "\uf2c7\uf2cb\uf2c7\uf2c9\uf2ca\uf2c8\uf08d\uf165\uf164\uf08d\uf3ff\uf3ff"
+            "\ue29c\uf00d\uf057\uf410\uf043\uf5c7\uf5c8\uf204\uf205\uf7d8\uf71e\ue072"
+            "\uf552\uf7d9\uf5c9\uf6a0\uf6a1\uf519\uf722\uf25c\uf637\ue041\uf238\uf239"
+            "\uf7da\uf7da\uf224\uf224\uf1f8\uf2ed\uf829\uf2ed\uf82a\uf829\uf82a\uf1bb"
+            "\uf61f\uf071\uf091\uf0d1\uf48b\uf4de\uf0f9\uf63b\uf4df\uf63c\uf4de\ue2bb"
+            "\uf553\uf1e4\ue2bb\ue2bb\uf3be\uf3bf\uf26c\uf26c\ue332\uf0e9\uf5ca\uf0cd"
+            "\uf0e2\uf2ea\uf29a\uf19c\uf127\uf09c\uf13e\uf13e\uf0dc\uf338\uf0b2\uf30c"
+            "\uf424\uf35d\uf093\uf155\uf007\uf406\uf4fa\uf4fb\uf4fc\uf2bd\uf4fd\uf4fe"
+            "\uf0f0\uf4ff\uf500\uf4fe\uf501\uf500\uf728\uf406\uf4fa\uf502\uf0f0\uf503"
+            "\uf504\uf82f\uf4ff\uf234\uf21b\uf505\uf506\uf507\uf508\uf235\uf235\uf0c0"
+            "\uf509\uf509\ue073\uf2e5\uf2e7\ue335\uf5b6\ue2c5\uf2bb\uf5cb\uf221\uf226"
+            "\uf228\ue085\ue086\uf492\uf493\uf03d\uf03d\uf4e2\uf6a7\ue074\ue075\ue076"
+            "\uf897\uf45f\uf45f\uf2a0\uf027\uf028\uf027\uf6a9\uf026\uf6a9\uf028\uf6a9"
+            "\uf772\uf729\ue336\uf554\uf555\uf0d0\uf494\uf071\uf773\uf5c5\uf83e\uf496"
+            "\uf5cd\uf496\uf193\uf7a0\uf1eb\uf1eb\uf1eb\uf72e\uf410\uf2d0\uf2d1\uf2d2"
+            "\uf72f\uf4e3\uf5ce\uf5ce\uf159\uf159\uf0ad\ue33a\uf497\uf00d\uf057\ue33b"
+            "\uf157\uf157\uf6ad\ue33c",
+        ),
+        "brands": (
+            "500px\naccessible-icon\naccusoft\nacquisitions-incorporated\nadn\nadversal\naffiliatetheme\n"
+            "airbnb\nalgolia\nalipay\namazon\namazon-pay\namilia\nandroid\nangellist\nangrycreative\n"
+            "angular\napp-store\napp-store-ios\napper\napple\napple-pay\nartstation\nasymmetrik\n"
+            "atlassian\naudible\nautoprefixer\navianex\naviato\naws\nbandcamp\nbattle-net\nbehance\n"
+            "behance-square\nbimobject\nbitbucket\nbitcoin\nbity\nblack-tie\nblackberry\nblogger\n"
+            "blogger-b\nbluetooth\nbluetooth-b\nbootstrap\nbots\nbtc\nbuffer\nburomobelexperte\n"
+            "buy-n-large\nbuysellads\ncanadian-maple-leaf\ncc-amazon-pay\ncc-amex\ncc-apple-pay\n"
+            "cc-diners-club\ncc-discover\ncc-jcb\ncc-mastercard\ncc-paypal\ncc-stripe\ncc-visa\n"
+            "centercode\ncentos\nchrome\nchromecast\ncloudflare\ncloudscale\ncloudsmith\ncloudversify\n"
+            "cmplid\ncodepen\ncodiepie\nconfluence\nconnectdevelop\ncontao\ncotton-bureau\ncpanel\n"
+            "creative-commons\ncreative-commons-by\ncreative-commons-nc\ncreative-commons-nc-eu\n"
+            "creative-commons-nc-jp\ncreative-commons-nd\ncreative-commons-pd\ncreative-commons-pd-alt\n"
+            "creative-commons-remix\ncreative-commons-sa\ncreative-commons-sampling\ncreative-commons-sampling-plus\n"
+            "creative-commons-share\ncreative-commons-zero\ncritical-role\ncss3\ncss3-alt\n"
+            "cuttlefish\nd-and-d\nd-and-d-beyond\ndailymotion\ndashcube\ndeezer\ndelicious\ndeploydog\n"
+            "deskpro\ndev\ndeviantart\ndhl\ndiaspora\ndigg\ndigital-ocean\ndiscord\ndiscourse\n"
+            "dochub\ndocker\ndraft2digital\ndribbble\ndribbble-square\ndropbox\ndrupal\ndyalog\n"
+            "earlybirds\nebay\nedge\nedge-legacy\nelementor\nello\nember\nempire\nenvira\nerlang\n"
+            "ethereum\netsy\nevernote\nexpeditedssl\nfacebook\nfacebook-f\nfacebook-messenger\n"
+            "facebook-square\nfantasy-flight-games\nfedex\nfedora\nfigma\nfirefox\nfirefox-browser\n"
+            "first-order\nfirst-order-alt\nfirstdraft\nflickr\nflipboard\nfly\nfont-awesome\n"
+            "font-awesome-alt\nfont-awesome-flag\nfont-awesome-logo-full\nfonticons\nfonticons-fi\n"
+            "fort-awesome\nfort-awesome-alt\nforumbee\nfoursquare\nfree-code-camp\nfreebsd\n"
+            "fulcrum\ngalactic-republic\ngalactic-senate\nget-pocket\ngg\ngg-circle\ngit\ngit-alt\n"
+            "git-square\ngithub\ngithub-alt\ngithub-square\ngitkraken\ngitlab\ngitter\nglide\n"
+            "glide-g\ngofore\ngoodreads\ngoodreads-g\ngoogle\ngoogle-drive\ngoogle-pay\ngoogle-play\n"
+            "google-plus\ngoogle-plus-g\ngoogle-plus-square\ngoogle-wallet\ngratipay\ngrav\n"
+            "gripfire\ngrunt\nguilded\ngulp\nhacker-news\nhacker-news-square\nhackerrank\nhips\n"
+            "hire-a-helper\nhive\nhooli\nhornbill\nhotjar\nhouzz\nhtml5\nhubspot\nideal\nimdb\ninnosoft\n"
+            "instagram\ninstagram-square\ninstalod\nintercom\ninternet-explorer\ninvision\nioxhost\n"
+            "itch-io\nitunes\nitunes-note\njava\njedi-order\njenkins\njira\njoget\njoomla\njs\njs-square\n"
+            "jsfiddle\nkaggle\nkeybase\nkeycdn\nkickstarter\nkickstarter-k\nkorvue\nlaravel\nlastfm\n"
+            "lastfm-square\nleanpub\nless\nline\nlinkedin\nlinkedin-in\nlinode\nlinux\nlyft\nmagento\n"
+            "mailchimp\nmandalorian\nmarkdown\nmastodon\nmaxcdn\nmdb\nmedapps\nmedium\nmedium-m\n"
+            "medrt\nmeetup\nmegaport\nmendeley\nmicroblog\nmicrosoft\nmix\nmixcloud\nmixer\nmizuni\n"
+            "modx\nmonero\nnapster\nneos\nnimblr\nnode\nnode-js\nnpm\nns8\nnutritionix\noctopus-deploy\n"
+            "odnoklassniki\nodnoklassniki-square\nold-republic\nopencart\nopenid\nopera\noptin-monster\n"
+            "orcid\nosi\npage4\npagelines\npalfed\npatreon\npaypal\npenny-arcade\nperbyte\nperiscope\n"
+            "phabricator\nphoenix-framework\nphoenix-squadron\nphp\npied-piper\npied-piper-alt\n"
+            "pied-piper-hat\npied-piper-pp\npied-piper-square\npinterest\npinterest-p\npinterest-square\n"
+            "playstation\nproduct-hunt\npushed\npython\nqq\nquinscape\nquora\nr-project\nraspberry-pi\n"
+            "ravelry\nreact\nreacteurope\nreadme\nrebel\nred-river\nreddit\nreddit-alien\nreddit-square\n"
+            "redhat\nrenren\nreplyd\nresearchgate\nresolving\nrev\nrocketchat\nrockrms\nrust\nsafari\n"
+            "salesforce\nsass\nschlix\nscribd\nsearchengin\nsellcast\nsellsy\nservicestack\nshirtsinbulk\n"
+            "shopify\nshopware\nsimplybuilt\nsistrix\nsith\nsketch\nskyatlas\nskype\nslack\nslack-hash\n"
+            "slideshare\nsnapchat\nsnapchat-ghost\nsnapchat-square\nsoundcloud\nsourcetree\n"
+            "speakap\nspeaker-deck\nspotify\nsquare-font-awesome\nsquare-font-awesome-stroke\n"
+            "squarespace\nstack-exchange\nstack-overflow\nstackpath\nstaylinked\nsteam\nsteam-square\n"
+            "steam-symbol\nsticker-mule\nstrava\nstripe\nstripe-s\nstudiovinari\nstumbleupon\n"
+            "stumbleupon-circle\nsuperpowers\nsupple\nsuse\nswift\nsymfony\nteamspeak\ntelegram\n"
+            "telegram-plane\ntencent-weibo\nthe-red-yeti\nthemeco\nthemeisle\nthink-peaks\ntiktok\n"
+            "trade-federation\ntrello\ntripadvisor\ntumblr\ntumblr-square\ntwitch\ntwitter\ntwitter-square\n"
+            "typo3\nuber\nubuntu\nuikit\numbraco\nuncharted\nuniregistry\nunity\nunsplash\nuntappd\n"
+            "ups\nusb\nusps\nussunnah\nvaadin\nviacoin\nviadeo\nviadeo-square\nviber\nvimeo\nvimeo-square\n"
+            "vimeo-v\nvine\nvk\nvnv\nvuejs\nwatchman-monitoring\nwaze\nweebly\nweibo\nweixin\nwhatsapp\n"
+            "whatsapp-square\nwhmcs\nwikipedia-w\nwindows\nwirsindhanderk\nwix\nwizards-of-the-coast\n"
+            "wodu\nwolf-pack-battalion\nwordpress\nwordpress-simple\nwpbeginner\nwpexplorer\n"
+            "wpforms\nwpressr\nwsh\nxbox\nxing\nxing-square\ny-combinator\nyahoo\nyammer\nyandex\n"
+            "yandex-international\nyarn\nyelp\nyoast\nyoutube\nyoutube-square\nzhihu",
+            "\uf26e\uf368\uf369\uf6af\uf170\uf36a\uf36b\uf834\uf36c\uf642\uf270\uf42c"
+            "\uf36d\uf17b\uf209\uf36e\uf420\uf36f\uf370\uf371\uf179\uf415\uf77a\uf372"
+            "\uf77b\uf373\uf41c\uf374\uf421\uf375\uf2d5\uf835\uf1b4\uf1b5\uf378\uf171"
+            "\uf379\uf37a\uf27e\uf37b\uf37c\uf37d\uf293\uf294\uf836\ue33d\uf15a\uf837"
+            "\uf37f\uf8a6\uf20d\uf785\uf42d\uf1f3\uf416\uf24c\uf1f2\uf24b\uf1f1\uf1f4"
+            "\uf1f5\uf1f0\uf380\uf789\uf268\uf838\ue07d\uf383\uf384\uf385\ue33f\uf1cb"
+            "\uf284\uf78d\uf20e\uf26d\uf89e\uf388\uf25e\uf4e7\uf4e8\uf4e9\uf4ea\uf4eb"
+            "\uf4ec\uf4ed\uf4ee\uf4ef\uf4f0\uf4f1\uf4f2\uf4f3\uf6c9\uf13c\uf38b\uf38c"
+            "\uf38d\uf6ca\ue052\uf210\ue077\uf1a5\uf38e\uf38f\uf6cc\uf1bd\uf790\uf791"
+            "\uf1a6\uf391\uf392\uf393\uf394\uf395\uf396\uf17d\uf397\uf16b\uf1a9\uf399"
+            "\uf39a\uf4f4\uf282\ue078\uf430\uf5f1\uf423\uf1d1\uf299\uf39d\uf42e\uf2d7"
+            "\uf839\uf23e\uf09a\uf39e\uf39f\uf082\uf6dc\uf797\uf798\uf799\uf269\ue007"
+            "\uf2b0\uf50a\uf3a1\uf16e\uf44d\uf417\uf2b4\uf35c\uf2b4\uf2b4\uf280\uf3a2"
+            "\uf286\uf3a3\uf211\uf180\uf2c5\uf3a4\uf50b\uf50c\uf50d\uf265\uf260\uf261"
+            "\uf1d3\uf841\uf1d2\uf09b\uf113\uf092\uf3a6\uf296\uf426\uf2a5\uf2a6\uf3a7"
+            "\uf3a8\uf3a9\uf1a0\uf3aa\ue079\uf3ab\uf2b3\uf0d5\uf0d4\uf1ee\uf184\uf2d6"
+            "\uf3ac\uf3ad\ue07e\uf3ae\uf1d4\uf3af\uf5f7\uf452\uf3b0\ue07f\uf427\uf592"
+            "\uf3b1\uf27c\uf13b\uf3b2\ue013\uf2d8\ue080\uf16d\ue055\ue081\uf7af\uf26b"
+            "\uf7b0\uf208\uf83a\uf3b4\uf3b5\uf4e4\uf50e\uf3b6\uf7b1\uf3b7\uf1aa\uf3b8"
+            "\uf3b9\uf1cc\uf5fa\uf4f5\uf3ba\uf3bb\uf3bc\uf42f\uf3bd\uf202\uf203\uf212"
+            "\uf41d\uf3c0\uf08c\uf0e1\uf2b8\uf17c\uf3c3\uf3c4\uf59e\uf50f\uf60f\uf4f6"
+            "\uf136\uf8ca\uf3c6\uf23a\uf23a\uf3c8\uf2e0\uf5a3\uf7b3\ue01a\uf3ca\uf3cb"
+            "\uf289\ue056\uf3cc\uf285\uf3d0\uf3d2\uf612\uf5a8\uf419\uf3d3\uf3d4\uf3d5"
+            "\uf3d6\ue082\uf263\uf264\uf510\uf23d\uf19b\uf26a\uf23c\uf8d2\uf41a\uf3d7"
+            "\uf18c\uf3d8\uf3d9\uf1ed\uf704\ue083\uf3da\uf3db\uf3dc\uf511\uf457\uf2ae"
+            "\uf1a8\uf4e5\uf1a7\ue01e\uf0d2\uf231\uf0d3\uf3df\uf288\uf3e1\uf3e2\uf1d6"
+            "\uf459\uf2c4\uf4f7\uf7bb\uf2d9\uf41b\uf75d\uf4d5\uf1d0\uf3e3\uf1a1\uf281"
+            "\uf1a2\uf7bc\uf18b\uf3e6\uf4f8\uf3e7\uf5b2\uf3e8\uf3e9\ue07a\uf267\uf83b"
+            "\uf41e\uf3ea\uf28a\uf3eb\uf2da\uf213\uf3ec\uf214\ue057\uf5b5\uf215\uf3ee"
+            "\uf512\uf7c6\uf216\uf17e\uf198\uf198\uf1e7\uf2ab\uf2ab\uf2ad\uf1be\uf7d3"
+            "\uf3f3\uf83c\uf1bc\uf425\uf35c\uf5be\uf18d\uf16c\uf842\uf3f5\uf1b6\uf1b7"
+            "\uf3f6\uf3f7\uf428\uf429\uf42a\uf3f8\uf1a4\uf1a3\uf2dd\uf3f9\uf7d6\uf8e1"
+            "\uf83d\uf4f9\uf2c6\uf2c6\uf1d5\uf69d\uf5c6\uf2b2\uf731\ue07b\uf513\uf181"
+            "\uf262\uf173\uf174\uf1e8\uf099\uf081\uf42b\uf402\uf7df\uf403\uf8e8\ue084"
+            "\uf404\ue049\ue07c\uf405\uf7e0\uf287\uf7e1\uf407\uf408\uf237\uf2a9\uf2aa"
+            "\uf409\uf40a\uf194\uf27d\uf1ca\uf189\uf40b\uf41f\ue087\uf83f\uf5cc\uf18a"
+            "\uf1d7\uf232\uf40c\uf40d\uf266\uf17a\ue2d0\uf5cf\uf730\ue088\uf514\uf19a"
+            "\uf411\uf297\uf2de\uf298\uf3e4\ue2d0\uf412\uf168\uf169\uf23b\uf19e\uf840"
+            "\uf413\uf414\uf7e3\uf1e9\uf2b1\uf167\uf431\uf63f",
+        ),
+        "regular": (
+            "address-book\naddress-card\nangry\narrow-alt-circle-down\narrow-alt-circle-left\n"
+            "arrow-alt-circle-right\narrow-alt-circle-up\nbar-chart\nbell\nbell-slash\nbookmark\n"
+            "building\ncalendar\ncalendar-alt\ncalendar-check\ncalendar-days\ncalendar-minus\n"
+            "calendar-plus\ncalendar-times\ncalendar-xmark\ncaret-square-down\ncaret-square-left\n"
+            "caret-square-right\ncaret-square-up\nchart-bar\ncheck-circle\ncheck-square\nchess-bishop\n"
+            "chess-king\nchess-knight\nchess-pawn\nchess-queen\nchess-rook\ncircle\ncircle-check\n"
+            "circle-dot\ncircle-down\ncircle-left\ncircle-pause\ncircle-play\ncircle-question\n"
+            "circle-right\ncircle-stop\ncircle-up\ncircle-user\ncircle-xmark\nclipboard\nclock\n"
+            "clock-four\nclone\nclosed-captioning\ncomment\ncomment-alt\ncomment-dots\ncommenting\n"
+            "comments\ncompass\ncontact-book\ncontact-card\ncopy\ncopyright\ncredit-card\ncredit-card-alt\n"
+            "dizzy\ndot-circle\ndrivers-license\nedit\nenvelope\nenvelope-open\neye\neye-slash\n"
+            "face-angry\nface-dizzy\nface-flushed\nface-frown\nface-frown-open\nface-grimace\n"
+            "face-grin\nface-grin-beam\nface-grin-beam-sweat\nface-grin-hearts\nface-grin-squint\n"
+            "face-grin-squint-tears\nface-grin-stars\nface-grin-tears\nface-grin-tongue\nface-grin-tongue-squint\n"
+            "face-grin-tongue-wink\nface-grin-wide\nface-grin-wink\nface-kiss\nface-kiss-beam\n"
+            "face-kiss-wink-heart\nface-laugh\nface-laugh-beam\nface-laugh-squint\nface-laugh-wink\n"
+            "face-meh\nface-meh-blank\nface-rolling-eyes\nface-sad-cry\nface-sad-tear\nface-smile\n"
+            "face-smile-beam\nface-smile-wink\nface-surprise\nface-tired\nfile\nfile-alt\nfile-archive\n"
+            "file-audio\nfile-code\nfile-excel\nfile-image\nfile-lines\nfile-pdf\nfile-powerpoint\n"
+            "file-text\nfile-video\nfile-word\nfile-zipper\nflag\nfloppy-disk\nflushed\nfolder\n"
+            "folder-open\nfont-awesome\nfont-awesome-flag\nfont-awesome-logo-full\nfrown\nfrown-open\n"
+            "futbol\nfutbol-ball\ngem\ngrimace\ngrin\ngrin-alt\ngrin-beam\ngrin-beam-sweat\ngrin-hearts\n"
+            "grin-squint\ngrin-squint-tears\ngrin-stars\ngrin-tears\ngrin-tongue\ngrin-tongue-squint\n"
+            "grin-tongue-wink\ngrin-wink\nhand\nhand-back-fist\nhand-lizard\nhand-paper\nhand-peace\n"
+            "hand-point-down\nhand-point-left\nhand-point-right\nhand-point-up\nhand-pointer\n"
+            "hand-rock\nhand-scissors\nhand-spock\nhandshake\nhard-drive\nhdd\nheart\nhospital\n"
+            "hourglass\nhourglass-2\nhourglass-half\nid-badge\nid-card\nimage\nimages\nkeyboard\n"
+            "kiss\nkiss-beam\nkiss-wink-heart\nlaugh\nlaugh-beam\nlaugh-squint\nlaugh-wink\nlemon\n"
+            "life-ring\nlightbulb\nlist-alt\nmap\nmeh\nmeh-blank\nmeh-rolling-eyes\nmessage\nminus-square\n"
+            "money-bill-1\nmoney-bill-alt\nmoon\nnewspaper\nnote-sticky\nobject-group\nobject-ungroup\n"
+            "paper-plane\npause-circle\npen-to-square\nplay-circle\nplus-square\nquestion-circle\n"
+            "rectangle-list\nrectangle-times\nrectangle-xmark\nregistered\nsad-cry\nsad-tear\n"
+            "save\nshare-from-square\nshare-square\nsmile\nsmile-beam\nsmile-wink\nsnowflake\n"
+            "soccer-ball\nsquare\nsquare-caret-down\nsquare-caret-left\nsquare-caret-right\n"
+            "square-caret-up\nsquare-check\nsquare-full\nsquare-minus\nsquare-plus\nstar\nstar-half\n"
+            "sticky-note\nstop-circle\nsun\nsurprise\nthumbs-down\nthumbs-up\ntimes-circle\ntimes-rectangle\n"
+            "tired\ntrash-alt\ntrash-can\nuser\nuser-circle\nvcard\nwindow-close\nwindow-maximize\n"
+            "window-minimize\nwindow-restore\nxmark-circle",
+            "\uf2b9\uf2bb\uf556\uf358\uf359\uf35a\uf35b\uf080\uf0f3\uf1f6\uf02e\uf1ad"
+            "\uf133\uf073\uf274\uf073\uf272\uf271\uf273\uf273\uf150\uf191\uf152\uf151"
+            "\uf080\uf058\uf14a\uf43a\uf43f\uf441\uf443\uf445\uf447\uf111\uf058\uf192"
+            "\uf358\uf359\uf28b\uf144\uf059\uf35a\uf28d\uf35b\uf2bd\uf057\uf328\ue33e"
+            "\ue33e\uf24d\uf20a\uf075\uf27a\uf4ad\uf4ad\uf086\uf14e\uf2b9\uf2bb\uf0c5"
+            "\uf1f9\uf09d\uf09d\uf567\uf192\uf2c2\uf044\uf0e0\uf2b6\uf06e\uf070\uf556"
+            "\uf567\uf579\uf119\uf57a\uf57f\uf580\uf582\uf583\uf584\uf585\uf586\uf587"
+            "\uf588\uf589\uf58a\uf58b\uf581\uf58c\uf596\uf597\uf598\uf599\uf59a\uf59b"
+            "\uf59c\uf11a\uf5a4\uf5a5\uf5b3\uf5b4\uf118\uf5b8\uf4da\uf5c2\uf5c8\uf15b"
+            "\uf15c\uf1c6\uf1c7\uf1c9\uf1c3\uf1c5\uf15c\uf1c1\uf1c4\uf15c\uf1c8\uf1c2"
+            "\uf1c6\uf024\uf0c7\uf579\uf07b\uf07c\uf2b4\uf2b4\uf2b4\uf119\uf57a\uf1e3"
+            "\uf1e3\uf3a5\uf57f\uf580\uf581\uf582\uf583\uf584\uf585\uf586\uf587\uf588"
+            "\uf589\uf58a\uf58b\uf58c\uf256\uf255\uf258\uf256\uf25b\uf0a7\uf0a5\uf0a4"
+            "\uf0a6\uf25a\uf255\uf257\uf259\uf2b5\uf0a0\uf0a0\uf004\uf0f8\uf254\uf254"
+            "\uf254\uf2c1\uf2c2\uf03e\uf302\uf11c\uf596\uf597\uf598\uf599\uf59a\uf59b"
+            "\uf59c\uf094\uf1cd\uf0eb\uf022\uf279\uf11a\uf5a4\uf5a5\uf27a\uf146\uf3d1"
+            "\uf3d1\uf186\uf1ea\uf249\uf247\uf248\uf1d8\uf28b\uf044\uf144\uf0fe\uf059"
+            "\uf022\uf410\uf410\uf25d\uf5b3\uf5b4\uf0c7\uf14d\uf14d\uf118\uf5b8\uf4da"
+            "\uf2dc\uf1e3\uf0c8\uf150\uf191\uf152\uf151\uf14a\uf45c\uf146\uf0fe\uf005"
+            "\uf089\uf249\uf28d\uf185\uf5c2\uf165\uf164\uf057\uf410\uf5c8\uf2ed\uf2ed"
+            "\uf007\uf2bd\uf2bb\uf410\uf2d0\uf2d1\uf2d2\uf057",
+        ),
     }
+)
+
+# Font files of each style, relative to the fontawesomefree package
+font_files = {
+    "brands": "static/fontawesomefree/otfs/Font Awesome 6 Brands-Regular-400.otf",
+    "regular": "static/fontawesomefree/otfs/Font Awesome 6 Free-Regular-400.otf",
+    "solid": "static/fontawesomefree/otfs/Font Awesome 6 Free-Solid-900.otf",
 }
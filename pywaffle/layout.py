@@ -0,0 +1,520 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Block allocation and layout of waffle charts.
+# This module does not create any Figure or Axes, so layouts can be computed without rendering them.
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+METHOD_MAPPING = {
+    "float": lambda a, b: a / b,
+    "nearest": lambda a, b: round(a / b),
+    "ceil": lambda a, b: math.ceil(a / b),
+    "floor": lambda a, b: a // b,
+}
+
+# Vectorized rounding of each rounding_rule. np.round rounds half to even, same as built-in round
+ROUNDING_FUNCTIONS = {
+    "nearest": np.round,
+    "ceil": np.ceil,
+    "floor": np.floor,
+}
+
+DIRECTION_VALUES = {
+    "NW": {"column_order": 1, "row_order": -1},
+    "SW": {"column_order": 1, "row_order": 1},
+    "NE": {"column_order": -1, "row_order": -1},
+    "SE": {"column_order": -1, "row_order": 1},
+}
+
+
+def division(x: int, y: int, method: str = "float") -> Union[int, float]:
+    """
+    :param x: dividend
+    :param y: divisor
+    :param method: {'float', 'nearest', 'ceil', 'floor'}
+    """
+    return METHOD_MAPPING[method.lower()](x, y)
+
+
+def round_up_to_multiple(x: int, base: int) -> int:
+    """
+    Round a positive integer up to the nearest multiple of given base number
+    For example: 12 -> 15, with base = 5
+    """
+    return base * math.ceil(x / base)
+
+
+def array_resize(
+    array: Union[Tuple, List], length: int, array_len: int = None
+) -> Union[Tuple, List]:
+    """
+    Resize array to given length. If the array is shorter than given length, repeat the array; If the array is longer
+    than the length, trim the array.
+    :param array: array
+    :param length: target length
+    :param array_len: if length of original array is known, pass it in here
+    :return: resized array
+    """
+    if not array_len:
+        array_len = len(array)
+    return array * (length // array_len) + array[: length % array_len]
+
+
+def block_layout(
+    rows: int,
+    columns: int,
+    row_order: int,
+    column_order: int,
+    is_vertical: bool,
+    is_snake: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Given the size of a matrix and starting point, return the column and row indexes of every element in the matrix,
+    in the order of going through them
+
+    :param rows: number of rows
+    :param columns: number of columns
+    :param row_order: 1 to go from the bottom row to the top one, -1 for the reverse
+    :param column_order: 1 to go from the left column to the right one, -1 for the reverse
+    :param is_vertical: whether to go through the matrix column by column
+    :param is_snake: whether to flip the direction of every odd line
+    :return: two integer arrays of column indexes and row indexes
+    """
+    if is_vertical:
+        x, x_order, y, y_order = rows, row_order, columns, column_order
+    else:
+        x, x_order, y, y_order = columns, column_order, rows, row_order
+
+    # Every line is a run along y, and lines are stacked along x
+    outer = np.arange(x)[::x_order]
+    inner = np.broadcast_to(np.arange(y)[::y_order], (x, y)).copy()
+
+    if is_snake:
+        inner[1::2] = inner[1::2, ::-1]
+
+    outer = np.repeat(outer, y)
+    inner = inner.ravel()
+
+    if is_vertical:
+        return inner, outer
+    return outer, inner
+
+
+def block_categories(
+    block_per_cat: Sequence[int],
+    colored_block_per_cat: Sequence[int],
+    block_number: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign blocks to categories in order, and tell which blocks should be colored
+
+    :param block_per_cat: number of blocks of each category, including transparent ones
+    :param colored_block_per_cat: number of colored blocks of each category
+    :param block_number: number of available blocks. Blocks of categories beyond it are dropped
+    :return: an integer array of the category index of every block, and a boolean array of whether it is colored
+    """
+    block_per_cat = np.asarray(block_per_cat).astype(int)
+    colored_block_per_cat = np.asarray(colored_block_per_cat).astype(int)
+
+    if (block_per_cat < 0).any():
+        raise ValueError("Negative value is not acceptable")
+
+    categories = np.repeat(np.arange(len(block_per_cat)), block_per_cat)[:block_number]
+
+    # Position of every block within its category
+    cat_start = np.cumsum(block_per_cat) - block_per_cat
+    position = np.arange(len(categories)) - cat_start[categories]
+
+    return categories, position < colored_block_per_cat[categories]
+
+
+def standardize_layout_parameters(par: Dict):
+    """
+    Standardize and validate the arguments of block allocation and layout in par, in place
+    """
+    par["rounding_rule"] = par["rounding_rule"].lower().strip()
+    par["block_arranging_style"] = par["block_arranging_style"].lower().strip()
+    par["starting_location"] = par["starting_location"].upper().strip()
+
+    # - rounding_rule
+    if par["rounding_rule"] not in ("nearest", "ceil", "floor", "largest_remainder"):
+        raise ValueError(
+            "Argument rounding_rule should be one of nearest, ceil, floor or largest_remainder."
+        )
+
+    # - values
+    if len(par["values"]) == 0:
+        raise ValueError("Argument values is required.")
+
+    # - starting_location
+    if par["starting_location"] not in DIRECTION_VALUES:
+        raise KeyError("starting_location should be one of 'NW', 'SW', 'NE', 'SE'")
+
+
+def values_array(values: Union[Sequence[float], Dict]) -> np.ndarray:
+    """
+    Convert values in a list, dict, NumPy array, pandas Series or other array-like into a float array
+    """
+    if isinstance(values, dict):
+        values = list(values.values())
+    return np.asarray(values, dtype=float).ravel()
+
+
+def largest_remainder(quotas: np.ndarray, total: int) -> np.ndarray:
+    """
+    Round quotas to integers adding up to total, with the largest remainder method.
+    Every quota is rounded down, and the remaining units go to the quotas with the largest fractional parts. Ties go
+    to the earlier quota.
+    For example: quotas=[1.5, 1.5, 2], total=5 -> [2, 1, 2]
+    """
+    quotas = np.asarray(quotas, dtype=float)
+    result = np.floor(quotas)
+    remaining = min(max(int(total - result.sum()), 0), len(quotas))
+    order = np.argsort(result - quotas, kind="stable")
+    result[order[:remaining]] += 1
+    return result.astype(int)
+
+
+def round_values(
+    values: np.ndarray, rounding_rule: str, total: Optional[int] = None
+) -> np.ndarray:
+    """
+    Round values to integers with given rounding_rule
+
+    :param total: the sum of rounded values with rounding rule 'largest_remainder'. If it is None, the rounded sum of
+        values is used
+    """
+    if rounding_rule == "largest_remainder":
+        return largest_remainder(
+            values, round(values.sum()) if total is None else total
+        )
+    return ROUNDING_FUNCTIONS[rounding_rule](values).astype(int)
+
+
+def allocate_blocks(
+    values: Union[Sequence[float], np.ndarray],
+    rows: Optional[int],
+    columns: Optional[int],
+    rounding_rule: str,
+    block_arranging_style: str,
+    vertical: bool,
+) -> Tuple[int, int, np.ndarray, np.ndarray]:
+    """
+    Calculate the size of the chart and the number of blocks of each category
+
+    :param values: numerical value of each category, in a list or any array-like
+    :param rows: the number of rows. If it is None, it is calculated from values
+    :param columns: the number of columns. If it is None, it is calculated from values
+    :param rounding_rule: {'nearest', 'ceil', 'floor', 'largest_remainder'}
+    :param block_arranging_style: {'normal', 'snake', 'new-line'}
+    :param vertical: whether blocks are arranged column by column
+    :return: rows, columns, integer arrays of the number of blocks of each category including transparent padding
+        blocks, and of the number of colored blocks of each category
+    """
+    values = values_array(values)
+    if not np.isfinite(values).all():
+        raise ValueError("Values should be finite numbers.")
+    if (values < 0).any():
+        raise ValueError("Negative value is not acceptable")
+
+    # if only one of rows/columns given, use the values as number of blocks
+    if not rows and not columns:
+        raise ValueError("At least one of rows and columns is required.")
+    # if columns is given, rows is not
+    elif rows is None:
+        colored_block_per_cat = round_values(values, rounding_rule)
+        if block_arranging_style == "new-line" and vertical:
+            block_per_cat = (np.ceil(values / columns) * columns).astype(int)
+        else:
+            block_per_cat = colored_block_per_cat
+        rows = math.ceil(int(block_per_cat.sum()) / columns)
+    # if rows is given, columns is not
+    elif columns is None:
+        colored_block_per_cat = round_values(values, rounding_rule)
+        if block_arranging_style == "new-line" and not vertical:
+            block_per_cat = (np.ceil(values / rows) * rows).astype(int)
+        else:
+            block_per_cat = colored_block_per_cat
+        columns = math.ceil(int(block_per_cat.sum()) / rows)
+    # if both of rows and columns are given
+    else:
+        # The grid is empty if all values are 0
+        if values.sum() == 0:
+            block_per_cat = colored_block_per_cat = np.zeros(len(values), dtype=int)
+        else:
+            block_per_cat = colored_block_per_cat = round_values(
+                values * columns * rows / values.sum(),
+                rounding_rule,
+                total=columns * rows,
+            )
+
+    return rows, columns, block_per_cat, colored_block_per_cat
+
+
+def find_units_per_block(
+    values: Union[Sequence[float], np.ndarray],
+    rows: Optional[int],
+    columns: Optional[int],
+    max_blocks: int,
+    rounding_rule: str,
+    block_arranging_style: str,
+    vertical: bool,
+    strict: bool = False,
+    min_units_per_block: float = 1,
+) -> float:
+    """
+    Find the smallest value of each block, so the chart has at most max_blocks blocks including transparent ones.
+    Candidates are min_units_per_block times 1, 2 and 5 multiplied by powers of 10.
+    For example: values=[3_000_000, 1_200_000], rows=10, max_blocks=10_000 -> 500
+
+    :param strict: raise ValueError instead of scaling values, if there are more than max_blocks blocks
+    :param min_units_per_block: the value of each block if blocks do not exceed max_blocks
+    :return: the value of each block. Values should be divided by it before allocating blocks
+    """
+    values = values_array(values)
+
+    def block_number(scale: float) -> int:
+        # Only numbers of blocks are calculated here, so pathological values cost nothing
+        _, _, block_per_cat, _ = allocate_blocks(
+            values=values / scale,
+            rows=rows,
+            columns=columns,
+            rounding_rule=rounding_rule,
+            block_arranging_style=block_arranging_style,
+            vertical=vertical,
+        )
+        return int(block_per_cat.sum())
+
+    # A grid with both rows and columns always has rows * columns blocks, and it can't be scaled
+    if rows and columns:
+        if rows * columns > max_blocks:
+            raise ValueError(
+                f"Number of blocks {rows * columns} exceeds max_blocks {max_blocks}."
+            )
+        return min_units_per_block
+
+    blocks = block_number(min_units_per_block)
+    if blocks <= max_blocks:
+        return min_units_per_block
+    if strict:
+        raise ValueError(f"Number of blocks {blocks} exceeds max_blocks {max_blocks}.")
+
+    # Every block holds at most one unit, so smaller scales than the one of the sum are skipped
+    exponent = max(
+        math.floor(math.log10(values.sum() / max_blocks / min_units_per_block)), 0
+    )
+    while True:
+        for step in (1, 2, 5):
+            scale = min_units_per_block * step * 10**exponent
+            if scale <= min_units_per_block:
+                continue
+            if block_number(scale) <= max_blocks:
+                return scale
+            # Values can't be scaled further when they are all rounded to at most one block
+            if scale > 2 * values.max():
+                raise ValueError(
+                    f"Categories of values can't fit into max_blocks {max_blocks}."
+                )
+        exponent += 1
+
+
+def block_size(
+    rows: int, interval_ratio_y: float, block_aspect_ratio: float, height: float = 1
+) -> Tuple[float, float]:
+    """
+    Calculate the width and height of a block, when the chart has given height
+    """
+    block_height = height / (rows + rows * interval_ratio_y - interval_ratio_y)
+    return block_aspect_ratio * block_height, block_height
+
+
+def resolve_colors(colors: Optional[Sequence], cmap_name: str, length: int) -> Sequence:
+    """
+    Return colors if it is given, otherwise build a color sequence of given length from the colormap
+    """
+    if colors:
+        return colors
+
+    from matplotlib import colormaps
+
+    return array_resize(
+        array=colormaps[cmap_name].colors,
+        length=length,
+        array_len=colormaps[cmap_name].N,
+    )
+
+
+def rgba_colors(colors: Optional[Sequence], cmap_name: str, length: int) -> np.ndarray:
+    """
+    Same as resolve_colors, but return the colors as an RGBA array. Colors from the colormap are only converted once
+    before being repeated.
+    """
+    from matplotlib.colors import to_rgba_array
+
+    if colors:
+        return to_rgba_array(colors)
+
+    from matplotlib import colormaps
+
+    return np.resize(to_rgba_array(colormaps[cmap_name].colors), (length, 4))
+
+
+class WaffleLayout:
+    """
+    Geometry and colors of all blocks of a waffle chart, stored as columnar arrays with one element per block.
+    The chart is placed in a box from (0, 0) to (width, height), and the position of a block is its lower-left corner.
+    """
+
+    __slots__ = (
+        "rows",
+        "columns",
+        "width",
+        "height",
+        "block_width",
+        "block_height",
+        "interval_ratio_x",
+        "interval_ratio_y",
+        "column_index",
+        "row_index",
+        "x",
+        "y",
+        "category",
+        "colored",
+        "colors",
+        "block_per_cat",
+        "colored_block_per_cat",
+        "units_per_block",
+    )
+
+    def __init__(self, **kwargs):
+        for attr in self.__slots__:
+            setattr(self, attr, kwargs[attr])
+
+    def __len__(self) -> int:
+        return len(self.category)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(rows={self.rows}, columns={self.columns}, "
+            f"blocks={len(self)}, categories={len(self.colors)})"
+        )
+
+    @property
+    def block_colors(self) -> np.ndarray:
+        """
+        RGBA color of every block. Blocks that are not colored are transparent.
+        """
+        return np.where(self.colored[:, None], self.colors[self.category], 0.0)
+
+
+def compute_layout(
+    values: Union[Sequence[float], Dict],
+    rows: Optional[int] = None,
+    columns: Optional[int] = None,
+    colors: Optional[Sequence] = None,
+    cmap_name: str = "Set2",
+    interval_ratio_x: float = 0.2,
+    interval_ratio_y: float = 0.2,
+    block_aspect_ratio: float = 1,
+    vertical: bool = False,
+    starting_location: str = "SW",
+    rounding_rule: str = "nearest",
+    block_arranging_style: str = "normal",
+    units_per_block: float = 1,
+    max_blocks: Optional[int] = None,
+    max_blocks_strict: bool = False,
+) -> WaffleLayout:
+    """
+    Compute the layout of a waffle chart without creating any Figure or Axes.
+    Arguments have the same meaning and default values as in Waffle.
+    If blocks exceed max_blocks, ValueError is raised before any per-block array is allocated.
+
+    ``compute_layout(values=[48, 46, 6], rows=5)``
+
+    :return: A WaffleLayout with the position, size, category and color of every block
+    :rtype: WaffleLayout
+    """
+    par = {
+        "values": values,
+        "rounding_rule": rounding_rule,
+        "block_arranging_style": block_arranging_style,
+        "starting_location": starting_location,
+    }
+    standardize_layout_parameters(par)
+
+    values = values_array(values)
+
+    if colors and len(colors) != len(values):
+        raise ValueError("Length of colors doesn't match the values.")
+
+    from pywaffle.cache import get_block_layout
+
+    if max_blocks is not None:
+        units_per_block = find_units_per_block(
+            values=values,
+            rows=rows,
+            columns=columns,
+            max_blocks=max_blocks,
+            rounding_rule=par["rounding_rule"],
+            block_arranging_style=par["block_arranging_style"],
+            vertical=vertical,
+            strict=max_blocks_strict,
+            min_units_per_block=units_per_block,
+        )
+    if units_per_block != 1:
+        values = values / units_per_block
+
+    rows, columns, block_per_cat, colored_block_per_cat = allocate_blocks(
+        values=values,
+        rows=rows,
+        columns=columns,
+        rounding_rule=par["rounding_rule"],
+        block_arranging_style=par["block_arranging_style"],
+        vertical=vertical,
+    )
+    block_width, block_height = block_size(
+        rows=rows,
+        interval_ratio_y=interval_ratio_y,
+        block_aspect_ratio=block_aspect_ratio,
+    )
+
+    column_index, row_index = get_block_layout(
+        rows=rows,
+        columns=columns,
+        row_order=DIRECTION_VALUES[par["starting_location"]]["row_order"],
+        column_order=DIRECTION_VALUES[par["starting_location"]]["column_order"],
+        is_vertical=vertical,
+        is_snake=par["block_arranging_style"] == "snake",
+    )
+    category, colored = block_categories(
+        block_per_cat=block_per_cat,
+        colored_block_per_cat=colored_block_per_cat,
+        block_number=len(column_index),
+    )
+    column_index = column_index[: len(category)]
+    row_index = row_index[: len(category)]
+
+    return WaffleLayout(
+        rows=rows,
+        columns=columns,
+        width=(columns + columns * interval_ratio_x - interval_ratio_x) * block_width,
+        height=1,
+        block_width=block_width,
+        block_height=block_height,
+        interval_ratio_x=interval_ratio_x,
+        interval_ratio_y=interval_ratio_y,
+        column_index=column_index,
+        row_index=row_index,
+        x=(1 + interval_ratio_x) * block_width * column_index,
+        y=(1 + interval_ratio_y) * block_height * row_index,
+        category=category,
+        colored=colored,
+        colors=rgba_colors(colors, cmap_name, len(values)),
+        block_per_cat=block_per_cat,
+        colored_block_per_cat=colored_block_per_cat,
+        units_per_block=units_per_block,
+    )
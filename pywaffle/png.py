@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# A direct PNG writer of waffle charts with rectangle blocks.
+# Blocks are filled into a NumPy RGBA buffer from the layout and encoded with zlib, without any Figure or renderer.
+
+import struct
+from typing import IO, Optional, Union
+import zlib
+
+import numpy as np
+
+from pywaffle.layout import compute_layout
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def pixel_block_index(
+    pixels: int,
+    blocks: int,
+    block_length: float,
+    interval_length: float,
+    pixel_length: float,
+) -> np.ndarray:
+    """
+    Map every pixel along one axis to the index of the block covering its center, or -1 if it is in a gap
+
+    :param pixels: number of pixels
+    :param blocks: number of blocks
+    :param block_length: length of a block
+    :param interval_length: length of the gap between two blocks
+    :param pixel_length: length of a pixel, in the same unit as block_length
+    """
+    step = block_length + interval_length
+    centers = (np.arange(pixels) + 0.5) * pixel_length
+    index = np.floor(centers / step).astype(int)
+    inside = (centers - index * step < block_length) & (index < blocks)
+    return np.where(inside, index, -1)
+
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + tag
+        + data
+        + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(image: np.ndarray, compress_level: int = 6) -> bytes:
+    """
+    Encode an RGBA image of shape (height, width, 4) in uint8 into PNG
+    """
+    height, width = image.shape[:2]
+    # Every scanline starts with filter type 0
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 4)
+    return b"".join(
+        [
+            PNG_SIGNATURE,
+            png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)),
+            png_chunk(b"IDAT", zlib.compress(raw.tobytes(), compress_level)),
+            png_chunk(b"IEND", b""),
+        ]
+    )
+
+
+def render_image(
+    height: int = 480, background: Optional[str] = None, **kwargs
+) -> np.ndarray:
+    """
+    Render the blocks of a waffle chart into an RGBA image of shape (height, width, 4) in uint8.
+
+    :param height: Height of the image in pixels. The width is calculated from the layout. [Default 480]
+    :param background: Background color of the image. [Default None, which is transparent]
+    :param **kwargs: Arguments of pywaffle.layout.compute_layout, like values, rows, columns and colors
+    """
+    layout = compute_layout(**kwargs)
+    pixel_length = layout.height / height
+    width = max(round(layout.width / pixel_length), 1)
+
+    # Category index of every grid cell, -1 for cells without colored block
+    grid = np.full((layout.rows + 1, layout.columns + 1), -1)
+    grid[layout.row_index[layout.colored], layout.column_index[layout.colored]] = (
+        layout.category[layout.colored]
+    )
+
+    pixel_col = pixel_block_index(
+        pixels=width,
+        blocks=layout.columns,
+        block_length=layout.block_width,
+        interval_length=layout.block_width * layout.interval_ratio_x,
+        pixel_length=pixel_length,
+    )
+    # Image rows go from top to bottom
+    pixel_row = pixel_block_index(
+        pixels=height,
+        blocks=layout.rows,
+        block_length=layout.block_height,
+        interval_length=layout.block_height * layout.interval_ratio_y,
+        pixel_length=pixel_length,
+    )[::-1]
+
+    # Colors of all categories composited over the background, which is the last color
+    if background is None:
+        background_color = np.zeros(4)
+    else:
+        from matplotlib.colors import to_rgba
+
+        background_color = np.asarray(to_rgba(background))
+    alpha = layout.colors[:, 3:]
+    out_alpha = alpha + background_color[3] * (1 - alpha)
+    colors = np.divide(
+        layout.colors[:, :3] * alpha
+        + background_color[:3] * background_color[3] * (1 - alpha),
+        out_alpha,
+        out=np.zeros_like(layout.colors[:, :3]),
+        where=out_alpha > 0,
+    )
+    color_table = np.vstack([np.hstack([colors, out_alpha]), background_color])
+    color_table = np.round(color_table * 255).astype(np.uint8)
+
+    return color_table[grid[pixel_row[:, None], pixel_col[None, :]]]
+
+
+def save_png(
+    file: Union[str, IO],
+    height: int = 480,
+    background: Optional[str] = None,
+    compress_level: int = 6,
+    **kwargs,
+):
+    """
+    Write the blocks of a waffle chart with rectangle blocks into a PNG file, without creating any Figure.
+    Titles, legends, icons and characters are not supported.
+
+    ``save_png("waffle.png", values=[48, 46, 6], rows=5)``
+
+    :param file: Path of the PNG file, or a binary file object to write into
+    :type file: str|file object
+
+    :param height: Height of the image in pixels. The width is calculated from the layout. [Default 480]
+    :type height: int, optional
+
+    :param background: Background color of the image. [Default None, which is transparent]
+    :type background: str, optional
+
+    :param compress_level: zlib compression level from 0 to 9. [Default 6]
+    :type compress_level: int, optional
+
+    :param **kwargs: Arguments of pywaffle.layout.compute_layout, like values, rows, columns and colors
+    """
+    data = encode_png(
+        render_image(height=height, background=background, **kwargs),
+        compress_level=compress_level,
+    )
+    if hasattr(file, "write"):
+        file.write(data)
+    else:
+        with open(file, "wb") as f:
+            f.write(data)
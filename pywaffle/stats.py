@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Opt-in instrumentation of plotting waffle charts.
+# It records the time spent in each phase, the numbers of blocks and artists created, and the hits of shared caches.
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+import time
+from typing import Callable, Dict, Iterator
+
+from pywaffle.cache import font_properties_cache, glyph_path_cache, layout_cache
+
+# Caches whose hits and misses are recorded
+CACHES = {
+    "layout": layout_cache,
+    "font_properties": font_properties_cache,
+    "glyph_path": glyph_path_cache,
+}
+
+
+class WaffleStats:
+    """
+    Timings and counts of plotting waffle charts, summed up over all charts and draws recorded into it.
+
+    Durations are in seconds, with keys of phase names:
+
+    | validation: standardizing and validating arguments, including icons and colors;
+    | layout: allocating blocks and computing their positions;
+    | blocks: creating the block artists;
+    | title, legend: adding the title and legend;
+    | tight_layout: adjusting subplot positions when drawing;
+    | draw: drawing the figure, including tight_layout.
+
+    Caches are shared by the whole process, so hits and misses include the ones from other threads plotting at the
+    same time.
+    """
+
+    def __init__(self):
+        #:Seconds spent in each phase
+        self.durations: Dict[str, float] = defaultdict(float)
+        #:Number of waffle charts plotted
+        self.charts = 0
+        #:Number of blocks, including transparent ones
+        self.blocks = 0
+        #:Number of artists created for blocks
+        self.artists = 0
+        #:Number of times the figure is drawn
+        self.draws = 0
+        #:Hits of each cache
+        self.cache_hits: Dict[str, int] = defaultdict(int)
+        #:Misses of each cache
+        self.cache_misses: Dict[str, int] = defaultdict(int)
+
+    def __repr__(self) -> str:
+        durations = ", ".join(
+            f"{name}={duration * 1000:.1f}ms"
+            for name, duration in self.durations.items()
+        )
+        return (
+            f"{type(self).__name__}(charts={self.charts}, blocks={self.blocks}, artists={self.artists}, "
+            f"draws={self.draws}, {durations})"
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Add the time spent in the with block to phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] += time.perf_counter() - start
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        """
+        Wrap func, so the time spent in it is added to phase name
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    @contextmanager
+    def track_caches(self) -> Iterator[None]:
+        """
+        Add the cache hits and misses during the with block
+        """
+        before = {name: cache.info() for name, cache in CACHES.items()}
+        try:
+            yield
+        finally:
+            for name, cache in CACHES.items():
+                info = cache.info()
+                self.cache_hits[name] += max(info["hits"] - before[name]["hits"], 0)
+                self.cache_misses[name] += max(
+                    info["misses"] - before[name]["misses"], 0
+                )
+
+    def as_dict(self) -> Dict:
+        """
+        Return all stats in a dict, which can be serialized into JSON
+        """
+        return {
+            "durations": dict(self.durations),
+            "charts": self.charts,
+            "blocks": self.blocks,
+            "artists": self.artists,
+            "draws": self.draws,
+            "cache_hits": dict(self.cache_hits),
+            "cache_misses": dict(self.cache_misses),
+        }
@@ -0,0 +1,185 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# A direct SVG writer of waffle charts.
+# Every block shape or glyph is defined once in <defs>, and blocks reference it with <use>. The document is written to
+# the file while blocks are visited, so it is never held in memory as a whole.
+
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Sequence, Union
+
+from matplotlib.colors import to_hex, to_rgba
+from matplotlib.path import Path
+
+from pywaffle.cache import get_glyph_path
+from pywaffle.layout import compute_layout
+
+SVG_PATH_COMMANDS = {
+    Path.MOVETO: "M",
+    Path.LINETO: "L",
+    Path.CURVE3: "Q",
+    Path.CURVE4: "C",
+}
+
+
+def svg_number(x: float) -> str:
+    """
+    Format a number with at most 2 decimals, without trailing zeros
+    For example: 1.50 -> '1.5'
+    """
+    return f"{x:.2f}".rstrip("0").rstrip(".")
+
+
+def svg_path_data(path: Path, scale: float = 1) -> str:
+    """
+    Convert a matplotlib path into SVG path data, scaled by given factor and flipped vertically
+    """
+    commands = []
+    for vertices, code in path.iter_segments(simplify=False, curves=True):
+        if code == Path.CLOSEPOLY:
+            commands.append("Z")
+            continue
+        points = " ".join(
+            f"{svg_number(x * scale)} {svg_number(-y * scale)}"
+            for x, y in vertices.reshape(-1, 2)
+        )
+        commands.append(f"{SVG_PATH_COMMANDS[code]}{points}")
+    return "".join(commands)
+
+
+def svg_fill(color: Sequence[float]) -> str:
+    """
+    Return fill attributes of a RGBA color
+    """
+    fill = f'fill="{to_hex(color, keep_alpha=False)}"'
+    if color[3] < 1:
+        fill += f' fill-opacity="{svg_number(color[3])}"'
+    return fill
+
+
+@contextmanager
+def _open(file: Union[str, IO]) -> Iterator[IO]:
+    if hasattr(file, "write"):
+        yield file
+    else:
+        with open(file, "w", encoding="utf-8") as f:
+            yield f
+
+
+def save_svg(
+    file: Union[str, IO],
+    height: float = 480,
+    background: Optional[str] = None,
+    characters: Union[str, Sequence[str], None] = None,
+    font_file: Optional[str] = None,
+    font_size: Optional[float] = None,
+    icons: Union[str, Sequence[str], None] = None,
+    icon_style: Union[str, Sequence[str]] = "solid",
+    **kwargs,
+):
+    """
+    Write the blocks of a waffle chart into an SVG file, without creating any Figure.
+    Titles, legends and other elements of Waffle are not drawn.
+
+    ``save_svg("waffle.svg", values=[48, 46, 6], rows=5, icons="star")``
+
+    :param file: Path of the SVG file, or a text file object to write into
+    :type file: str|file object
+
+    :param height: Height of the image in pixels. The width is calculated from the layout. [Default 480]
+    :type height: float, optional
+
+    :param background: Background color of the image. [Default None, which is transparent]
+    :type background: str, optional
+
+    :param characters: Same as in Waffle.
+    :param font_file: Same as in Waffle.
+    :param font_size: Font size of icons and characters in pixels. [Default the block width]
+    :param icons: Same as in Waffle.
+    :param icon_style: Same as in Waffle.
+
+    :param **kwargs: Arguments of pywaffle.layout.compute_layout, like values, rows, columns and colors
+    """
+    layout = compute_layout(**kwargs)
+    scale = height / layout.height
+    categories = len(layout.colors)
+
+    # Font file and text of each category, if blocks are glyphs
+    glyphs = None
+    if icons:
+        from pywaffle.fontawesome_handler import get_font_file
+        from pywaffle.fontawesome_mapping import icons as icon_mapping
+
+        icons = [icons] * categories if isinstance(icons, str) else icons
+        icon_style = (
+            [icon_style] * categories if isinstance(icon_style, str) else icon_style
+        )
+        if len(icons) != categories:
+            raise ValueError("Length of icons doesn't match the values.")
+        glyphs = [
+            (get_font_file(style.lower()), icon_mapping[style.lower()][icon])
+            for icon, style in zip(icons, icon_style)
+        ]
+    elif characters:
+        characters = (
+            [characters] * categories if isinstance(characters, str) else characters
+        )
+        if len(characters) != categories:
+            raise ValueError("Length of characters doesn't match the values.")
+        glyphs = [(font_file, character) for character in characters]
+
+    with _open(file) as f:
+        f.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{svg_number(layout.width * scale)}" height="{svg_number(height)}" '
+            f'viewBox="0 0 {svg_number(layout.width * scale)} {svg_number(height)}">\n'
+        )
+        if background is not None:
+            f.write(
+                f'<rect width="100%" height="100%" {svg_fill(to_rgba(background))}/>\n'
+            )
+
+        # Definitions of shapes, and the shape id of each category
+        f.write("<defs>\n")
+        if glyphs is None:
+            f.write(
+                f'<rect id="block" width="{svg_number(layout.block_width * scale)}" '
+                f'height="{svg_number(layout.block_height * scale)}"/>\n'
+            )
+            shape_ids = ["block"] * categories
+        else:
+            # Glyph paths are in units of the font size
+            glyph_scale = font_size or layout.block_width * scale
+            glyph_ids = {}
+            for glyph in glyphs:
+                if glyph not in glyph_ids:
+                    glyph_ids[glyph] = f"glyph{len(glyph_ids)}"
+                    path = get_glyph_path(font_file=glyph[0], text=glyph[1], size=1)
+                    f.write(
+                        f'<path id="{glyph_ids[glyph]}" d="{svg_path_data(path, glyph_scale)}"/>\n'
+                    )
+            shape_ids = [glyph_ids[glyph] for glyph in glyphs]
+        f.write("</defs>\n")
+
+        # Blocks of each category are grouped, so they share the fill color. Transparent blocks are skipped.
+        x = layout.x * scale
+        if glyphs is None:
+            y = height - (layout.y + layout.block_height) * scale
+        else:
+            # Glyphs are anchored at their baseline
+            y = height - layout.y * scale
+        for class_index in range(categories):
+            in_category = (layout.category == class_index) & layout.colored
+            if not in_category.any():
+                continue
+            f.write(f"<g {svg_fill(layout.colors[class_index])}>\n")
+            href = f'xlink:href="#{shape_ids[class_index]}"'
+            for block_x, block_y in zip(
+                x[in_category].tolist(), y[in_category].tolist()
+            ):
+                f.write(
+                    f'<use {href} x="{svg_number(block_x)}" y="{svg_number(block_y)}"/>\n'
+                )
+            f.write("</g>\n")
+
+        f.write("</svg>\n")
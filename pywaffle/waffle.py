@@ -1,73 +1,578 @@
 #!/usr/bin/python
 # -*-coding: utf-8 -*-
 
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 import copy
+from fractions import Fraction
 import math
-from itertools import islice, product
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from itertools import islice
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 import warnings
 
-import matplotlib.font_manager as fm
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection, PolyCollection
 from matplotlib.figure import Figure
+from matplotlib.layout_engine import TightLayoutEngine
 from matplotlib.patches import Patch, Rectangle
-import matplotlib.pyplot as plt
+from matplotlib import rcParams
+from matplotlib.text import Text
+from matplotlib.transforms import Affine2D, Bbox
+import numpy as np
+
+from pywaffle.cache import get_block_layout, get_font_properties, get_glyph_path
+from pywaffle.stats import WaffleStats
+
+# array_resize, division and round_up_to_multiple are kept importable from this module
+from pywaffle.layout import (  # noqa: F401
+    DIRECTION_VALUES,
+    array_resize,
+    compute_layout,
+    division,
+    resolve_colors,
+    round_up_to_multiple,
+    standardize_layout_parameters,
+    WaffleLayout,
+)
 
-METHOD_MAPPING = {
-    "float": lambda a, b: a / b,
-    "nearest": lambda a, b: round(a / b),
-    "ceil": lambda a, b: math.ceil(a / b),
-    "floor": lambda a, b: a // b,
-}
+
+def chunked(iterable: Iterable, step: int) -> List:
+    """
+    Yield successive step-sized chunks from list
+    """
+    iterable = iter(iterable)
+    yield from iter(lambda: list(islice(iterable, step)), [])
 
 
-def division(x: int, y: int, method: str = "float") -> Union[int, float]:
+def flip_lines(matrix: Iterable[Tuple[int, int]], base: int) -> Tuple[int, int]:
     """
-    :param x: dividend
-    :param y: divisor
-    :param method: {'float', 'nearest', 'ceil', 'floor'}
+    Given a matrix in a linear array, flip the element order of every odd row
     """
-    return METHOD_MAPPING[method.lower()](x, y)
+    for line_number, line in enumerate(chunked(matrix, base)):
+        yield from line if line_number % 2 == 0 else line[::-1]
 
 
-def round_up_to_multiple(x: int, base: int) -> int:
+def raster_block_pixels(
+    interval_ratio: float,
+    min_block_pixels: int = 10,
+    max_denominator: int = 20,
+    max_step_pixels: Optional[int] = None,
+) -> Tuple[int, int]:
     """
-    Round a positive integer up to the nearest multiple of given base number
-    For example: 12 -> 15, with base = 5
+    Find the pixel sizes of a block and of the gap after it, so that their ratio approximates interval_ratio
+    and the block is at least min_block_pixels wide.
+    If max_step_pixels is given, the block and the gap together are at most max_step_pixels wide, and gaps disappear
+    when blocks are only 1 pixel wide.
+    For example: 0.2 -> (10, 2); 0.2 with max_step_pixels=3 -> (2, 1)
     """
-    return base * math.ceil(x / base)
+    ratio = Fraction(interval_ratio).limit_denominator(max_denominator)
+    scale = math.ceil(min_block_pixels / ratio.denominator)
+    block_pixels, gap_pixels = ratio.denominator * scale, ratio.numerator * scale
+    if max_step_pixels is not None and block_pixels + gap_pixels > max_step_pixels:
+        block_pixels = min(
+            max(round(max_step_pixels / (1 + interval_ratio)), 1), max_step_pixels
+        )
+        gap_pixels = max_step_pixels - block_pixels
+    return block_pixels, gap_pixels
+
 
+# Resolution of images of engine raster, relative to the size of the axis on the canvas, so it stays sharp when saved
+# with a higher dpi
+RASTER_OVERSAMPLING = 2
 
-def array_resize(
-    array: Union[Tuple, List], length: int, array_len: int = None
-) -> Union[Tuple, List]:
+
+def raster_pixel_index(blocks: int, block_pixels: int, gap_pixels: int) -> np.ndarray:
+    """
+    Map every pixel along one axis of a rasterized waffle to the index of the block it belongs to, or -1 for gaps
+    For example: blocks=2, block_pixels=2, gap_pixels=1 -> [0, 0, -1, 1, 1]
+    """
+    step = block_pixels + gap_pixels
+    pixels = np.arange(max(blocks * step - gap_pixels, 0))
+    return np.where(pixels % step < block_pixels, pixels // step, -1)
+
+
+def chart_layout(
+    par: Dict,
+    values: List,
+    rows: Optional[int],
+    columns: Optional[int],
+    units_per_block: float,
+) -> WaffleLayout:
+    """
+    Compute the layout of a chart with standardized arguments par.
+    rows, columns and units_per_block are the ones given by user, since the calculated ones are saved into par when
+    the chart is drawn.
     """
-    Resize array to given length. If the array is shorter than given length, repeat the array; If the array is longer
-    than the length, trim the array.
-    :param array: array
-    :param length: target length
-    :param array_len: if length of original array is known, pass it in here
-    :return: resized array
+    return compute_layout(
+        values=values,
+        rows=rows,
+        columns=columns,
+        colors=par["colors"],
+        interval_ratio_x=par["interval_ratio_x"],
+        interval_ratio_y=par["interval_ratio_y"],
+        block_aspect_ratio=par["block_aspect_ratio"],
+        vertical=par["vertical"],
+        starting_location=par["starting_location"],
+        rounding_rule=par["rounding_rule"],
+        block_arranging_style=par["block_arranging_style"],
+        units_per_block=units_per_block,
+        max_blocks=par["max_blocks"],
+        max_blocks_strict=par["max_blocks_strict"],
+    )
+
+
+class GlyphCollection(PathCollection):
     """
-    if not array_len:
-        array_len = len(array)
-    return array * (length // array_len) + array[: length % array_len]
+    PathCollection of one glyph placed at many offsets, whose window extent is measured as the texts it replaces, so
+    that tight layout leaves the same room around it as in engine artist
+    """
+
+    def __init__(self, paths, *, text: str, fontproperties, **kwargs):
+        super().__init__(paths, **kwargs)
+        self._text = text
+        self._fontproperties = fontproperties
+
+    def get_window_extent(self, renderer=None):
+        offsets = self.get_offset_transform().transform(self.get_offsets())
+        if not len(offsets):
+            return Bbox.null()
+        # Extent of a single text anchored at the display origin, which is then shifted to every offset
+        text = Text(x=0, y=0, text=self._text, fontproperties=self._fontproperties)
+        text.set_figure(self.axes.figure)
+        glyph = text.get_window_extent(renderer)
+        return Bbox.from_extents(
+            offsets[:, 0].min() + glyph.x0,
+            offsets[:, 1].min() + glyph.y0,
+            offsets[:, 0].max() + glyph.x1,
+            offsets[:, 1].max() + glyph.y1,
+        )
 
 
-def chunked(iterable: Iterable, step: int) -> List:
+class WaffleBlocks:
     """
-    Yield successive step-sized chunks from list
+    The block artists of one waffle chart. They are kept, so the chart can be updated in place when values change.
+
+    :param ax: The axis the blocks are drawn on
+    :param par: Standardized arguments of the chart
+    :param glyphs: Font file and text of each category if blocks are icons or characters, otherwise None
     """
-    iterable = iter(iterable)
-    yield from iter(lambda: list(islice(iterable, step)), [])
 
+    def __init__(
+        self,
+        ax: Axes,
+        par: Dict,
+        glyphs: Optional[List[Tuple[Optional[str], str]]] = None,
+    ):
+        self.ax = ax
+        self.par = par
+        self.glyphs = glyphs
+        # rows and columns as given by user, since they are replaced with the calculated ones in par
+        self.rows, self.columns = par["rows"], par["columns"]
+        # units_per_block as given by user, which could be scaled up by max_blocks
+        self.units_per_block = par["units_per_block"]
+        self.layout: Optional[WaffleLayout] = None
+        self.font_size = None
+        #:Artists of all blocks. Transparent blocks have no artists.
+        self.artists: List[Artist] = []
+        # Artist of each block in the order of the layout for engine artist, or None for transparent blocks
+        self._block_artists: List[Optional[Artist]] = []
+        # PathCollection of each glyph, for engine collection with glyphs
+        self._glyph_collections: Dict[Tuple[Optional[str], str], GlyphCollection] = {}
+
+    def compute_layout(self, values: List) -> WaffleLayout:
+        return chart_layout(
+            par=self.par,
+            values=values,
+            rows=self.rows,
+            columns=self.columns,
+            units_per_block=self.units_per_block,
+        )
 
-def flip_lines(matrix: Iterable[Tuple[int, int]], base: int) -> Tuple[int, int]:
+    def draw(
+        self, layout: WaffleLayout, arrays: Optional[Dict[str, np.ndarray]] = None
+    ):
+        """
+        Remove existing blocks and draw all blocks of given layout
+
+        :param arrays: The result of block_arrays of given layout, if it is computed in advance
+        """
+        if arrays is None:
+            arrays = self.block_arrays(
+                layout=layout,
+                engine=self.par["engine"],
+                has_glyphs=self.glyphs is not None,
+            )
+        self.remove()
+        ax = self.ax
+        self.layout = layout
+        self.par["rows"], self.par["columns"] = layout.rows, layout.columns
+        self.par["units_per_block"] = layout.units_per_block
+
+        # Define the limit of X, Y axis
+        ax.axis(xmin=0, xmax=layout.width, ymin=0, ymax=layout.height)
+
+        if self.glyphs is not None:
+            # Calculate icon size based on the block size
+            tx, ty = ax.transData.transform([(0, 0), (0, layout.block_width)])
+            self.font_size = self.par["font_size"] or int((ty[1] - tx[1]) / 16 * 12)
+
+        if self.par["engine"] == "raster" and not (layout.rows and layout.columns):
+            # An empty grid has no image, same as no artists in other engines
+            self.artists = []
+        elif self.par["engine"] == "raster":
+            self.artists = [
+                ax.imshow(
+                    self._raster_image(layout, **arrays),
+                    origin="lower",
+                    extent=(0, layout.width, 0, layout.height),
+                    interpolation="nearest",
+                    aspect=ax.get_aspect(),
+                )
+            ]
+        elif self.par["engine"] == "collection" and self.glyphs is not None:
+            self._update_glyph_collections(layout)
+        elif self.par["engine"] == "collection":
+            block_colors = arrays["colors"]
+            # Same styles as a Rectangle patch created with color, so the output matches the artist engine
+            self.artists = [
+                ax.add_collection(
+                    PolyCollection(
+                        arrays["verts"],
+                        facecolors=block_colors,
+                        edgecolors=block_colors,
+                        linewidths=rcParams["patch.linewidth"],
+                        antialiaseds=rcParams["patch.antialiased"],
+                        joinstyle="miter",
+                    ),
+                    autolim=False,
+                )
+            ]
+        else:
+            self._block_artists = [
+                (
+                    self._add_block_artist(layout, x, y, class_index)
+                    if is_colored
+                    else None
+                )
+                for x, y, class_index, is_colored in zip(
+                    layout.x.tolist(),
+                    layout.y.tolist(),
+                    layout.category.tolist(),
+                    layout.colored.tolist(),
+                )
+            ]
+            self.artists = [
+                artist for artist in self._block_artists if artist is not None
+            ]
+
+    def update(self, values: List) -> List[Artist]:
+        """
+        Recompute the layout of new values, and only update the blocks that changed.
+        If the number of rows or columns changes, all blocks are drawn again.
+
+        :return: Artists that are updated or created
+        """
+        if isinstance(values, dict):
+            values = list(values.values())
+        if len(values) != len(self.par["colors"]):
+            raise ValueError("Length of values doesn't match the chart.")
+
+        layout = self.compute_layout(values)
+        self.par["values"] = values
+        old = self.layout
+
+        if (layout.rows, layout.columns) != (old.rows, old.columns):
+            self.draw(layout)
+            return list(self.artists)
+
+        self.layout = layout
+        self.par["units_per_block"] = layout.units_per_block
+        arrays = self.block_arrays(
+            layout=layout, engine=self.par["engine"], has_glyphs=self.glyphs is not None
+        )
+        if self.par["engine"] == "raster":
+            # The grid has the same size, so it is still empty if there was no image
+            if self.artists:
+                self.artists[0].set_data(self._raster_image(layout, **arrays))
+            return list(self.artists)
+        if self.par["engine"] == "collection" and self.glyphs is not None:
+            return self._update_glyph_collections(layout)
+        if self.par["engine"] == "collection":
+            collection = self.artists[0]
+            collection.set_verts(arrays["verts"])
+            collection.set_facecolor(arrays["colors"])
+            collection.set_edgecolor(arrays["colors"])
+            return [collection]
+
+        # Blocks are placed in the same order, so only the blocks whose category or color changed are updated
+        common = min(len(old), len(layout))
+        changed = np.flatnonzero(
+            (old.colored[:common] != layout.colored[:common])
+            | (
+                layout.colored[:common]
+                & (old.category[:common] != layout.category[:common])
+            )
+        )
+        updated = []
+        for i in changed.tolist():
+            artist = self._block_artists[i]
+            if not layout.colored[i]:
+                artist.remove()
+                self._block_artists[i] = None
+                continue
+            if artist is None:
+                self._block_artists[i] = self._add_block_artist(
+                    layout,
+                    float(layout.x[i]),
+                    float(layout.y[i]),
+                    int(layout.category[i]),
+                )
+            else:
+                self._set_block_artist(artist, int(layout.category[i]))
+            updated.append(self._block_artists[i])
+
+        for artist in self._block_artists[len(layout) :]:
+            if artist is not None:
+                artist.remove()
+        del self._block_artists[len(layout) :]
+
+        for x, y, class_index, is_colored in zip(
+            layout.x[common:].tolist(),
+            layout.y[common:].tolist(),
+            layout.category[common:].tolist(),
+            layout.colored[common:].tolist(),
+        ):
+            self._block_artists.append(
+                self._add_block_artist(layout, x, y, class_index)
+                if is_colored
+                else None
+            )
+            if is_colored:
+                updated.append(self._block_artists[-1])
+
+        self.artists = [artist for artist in self._block_artists if artist is not None]
+        return updated
+
+    def remove(self):
+        """
+        Remove all block artists from the axis
+        """
+        for artist in self.artists:
+            artist.remove()
+        self.artists = []
+        self._block_artists = []
+        self._glyph_collections = {}
+
+    @classmethod
+    def block_arrays(
+        cls, layout: WaffleLayout, engine: str, has_glyphs: bool
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute the arrays that blocks of given layout are drawn from with engine collection and raster.
+        They do not depend on the axis, so they could be computed by a worker thread or process.
+
+        :return: Vertices and colors of rectangles for engine collection, the block grid and color table for engine
+            raster, or an empty dict for other engines and glyphs
+        """
+        if engine == "raster":
+            return {
+                "block_grid": cls._block_grid(layout),
+                "color_table": cls._color_table(layout),
+            }
+        if engine == "collection" and not has_glyphs:
+            return {
+                "verts": cls._rectangle_verts(layout),
+                "colors": cls._colored_block_colors(layout),
+            }
+        return {}
+
+    @staticmethod
+    def _colored_block_colors(layout: WaffleLayout) -> np.ndarray:
+        return layout.colors[layout.category[layout.colored]]
+
+    @staticmethod
+    def _rectangle_verts(layout: WaffleLayout) -> np.ndarray:
+        """
+        Vertices of the rectangles of colored blocks
+        """
+        x, y = layout.x[layout.colored], layout.y[layout.colored]
+        return np.stack(
+            [
+                np.column_stack([x, y]),
+                np.column_stack([x + layout.block_width, y]),
+                np.column_stack([x + layout.block_width, y + layout.block_height]),
+                np.column_stack([x, y + layout.block_height]),
+            ],
+            axis=1,
+        )
+
+    @staticmethod
+    def _color_table(layout: WaffleLayout) -> np.ndarray:
+        """
+        RGBA pixel of each category for engine raster. The last color is for transparent blocks, gaps and empty cells
+        """
+        return np.round(np.vstack([layout.colors, np.zeros(4)]) * 255).astype(np.uint8)
+
+    @staticmethod
+    def _block_grid(layout: WaffleLayout) -> np.ndarray:
+        """
+        Category index of every grid cell for engine raster. -1 stands for no colored block
+        """
+        block_grid = np.full((layout.rows + 1, layout.columns + 1), -1)
+        block_grid[layout.row_index, layout.column_index] = np.where(
+            layout.colored, layout.category, -1
+        )
+        return block_grid
+
+    def _raster_image(
+        self, layout: WaffleLayout, block_grid: np.ndarray, color_table: np.ndarray
+    ) -> np.ndarray:
+        # The image has at most RASTER_OVERSAMPLING times as many pixels as the axis on the canvas
+        ax_extent = self.ax.get_window_extent()
+        block_pixels_x, gap_pixels_x = raster_block_pixels(
+            layout.interval_ratio_x,
+            max_step_pixels=max(
+                math.ceil(
+                    RASTER_OVERSAMPLING * ax_extent.width / max(layout.columns, 1)
+                ),
+                1,
+            ),
+        )
+        block_pixels_y, gap_pixels_y = raster_block_pixels(
+            layout.interval_ratio_y,
+            max_step_pixels=max(
+                math.ceil(RASTER_OVERSAMPLING * ax_extent.height / max(layout.rows, 1)),
+                1,
+            ),
+        )
+        pixel_col = raster_pixel_index(layout.columns, block_pixels_x, gap_pixels_x)
+        pixel_row = raster_pixel_index(layout.rows, block_pixels_y, gap_pixels_y)
+        return color_table[block_grid[pixel_row[:, None], pixel_col[None, :]]]
+
+    def _update_glyph_collections(self, layout: WaffleLayout) -> List[Artist]:
+        """
+        Update the PathCollection of each glyph with blocks of given layout, creating or removing collections if
+        necessary
+        """
+        # Group categories by glyph, so every distinct glyph is converted to a path only once
+        glyph_cats = defaultdict(list)
+        for class_index, glyph in enumerate(self.glyphs):
+            glyph_cats[glyph].append(class_index)
+
+        # Glyph paths are measured in points, and they are placed at the same locations as texts
+        glyph_transform = Affine2D().scale(1 / 72) + self.ax.figure.dpi_scale_trans
+        updated = []
+        for glyph, cats in glyph_cats.items():
+            # Transparent blocks are skipped
+            in_glyph = np.isin(layout.category, cats) & layout.colored
+            collection = self._glyph_collections.get(glyph)
+            if not in_glyph.any():
+                if collection is not None:
+                    collection.remove()
+                    del self._glyph_collections[glyph]
+                continue
+
+            offsets = np.column_stack([layout.x[in_glyph], layout.y[in_glyph]])
+            if collection is None:
+                font_file, text = glyph
+                collection = self.ax.add_collection(
+                    GlyphCollection(
+                        [
+                            get_glyph_path(
+                                font_file=font_file, text=text, size=self.font_size
+                            )
+                        ],
+                        text=text,
+                        fontproperties=get_font_properties(
+                            font_file=font_file, size=self.font_size
+                        ),
+                        offsets=offsets,
+                        offset_transform=self.ax.transData,
+                        transform=glyph_transform,
+                        facecolors=layout.colors[layout.category[in_glyph]],
+                        edgecolors="none",
+                        zorder=Text.zorder,
+                        # Texts are not clipped by the axis either
+                        clip_on=False,
+                    ),
+                    autolim=False,
+                )
+                self._glyph_collections[glyph] = collection
+            else:
+                collection.set_offsets(offsets)
+                collection.set_facecolor(layout.colors[layout.category[in_glyph]])
+            updated.append(collection)
+
+        self.artists = list(self._glyph_collections.values())
+        return updated
+
+    def _add_block_artist(
+        self, layout: WaffleLayout, x: float, y: float, class_index: int
+    ) -> Artist:
+        color = self.par["colors"][class_index]
+
+        if self.glyphs is not None:
+            font_file, text = self.glyphs[class_index]
+            return self.ax.text(
+                x=x,
+                y=y,
+                s=text,
+                color=color,
+                fontproperties=get_font_properties(
+                    font_file=font_file, size=self.font_size
+                ),
+            )
+        return self.ax.add_artist(
+            Rectangle(
+                xy=(x, y),
+                width=layout.block_width,
+                height=layout.block_height,
+                color=color,
+            )
+        )
+
+    def _set_block_artist(self, artist: Artist, class_index: int):
+        color = self.par["colors"][class_index]
+
+        if self.glyphs is not None:
+            font_file, text = self.glyphs[class_index]
+            artist.set_text(text)
+            artist.set_fontproperties(
+                get_font_properties(font_file=font_file, size=self.font_size)
+            )
+        artist.set_color(color)
+
+
+class TimedTightLayoutEngine(TightLayoutEngine):
     """
-    Given a matrix in a linear array, flip the element order of every odd row
+    TightLayoutEngine recording the time spent in it into phase tight_layout of the figure's stats
     """
-    for line_number, line in enumerate(chunked(matrix, base)):
-        yield from line if line_number % 2 == 0 else line[::-1]
+
+    def execute(self, fig):
+        stats = getattr(fig, "stats", None)
+        if stats is None:
+            return super().execute(fig)
+        with stats.phase("tight_layout"):
+            return super().execute(fig)
+
+
+def get_waffle_blocks(ax: Axes) -> Optional[WaffleBlocks]:
+    """
+    Return the blocks of the waffle chart on ax, or None if there is no waffle chart on it.
+    They are stored on the axis, so they are freed together with it.
+    """
+    return getattr(ax, "_waffle_blocks", None)
 
 
 class Waffle(Figure):
@@ -76,7 +581,7 @@ class Waffle(Figure):
     A custom Figure class to make waffle charts.
 
     :param values: Numerical value of each category. If it is a dict, the keys would be used as labels.
-    :type values: list|dict|pandas.Series
+    :type values: list|dict|numpy.ndarray|pandas.Series
 
     :param rows: The number of lines of the waffle chart.
     :type rows: int
@@ -192,11 +697,15 @@ class Waffle(Figure):
         | [Default 'SW']
     :type starting_location: str, optional
 
-    :param rounding_rule: The rounding rule applied when adjusting values to fit the chart size. ``{'nearest', 'floor', 'ceil'}``
+    :param rounding_rule: The rounding rule applied when adjusting values to fit the chart size.
+        ``{'nearest', 'floor', 'ceil', 'largest_remainder'}``
 
         | When it's 'nearest', it is "round to nearest, ties to even" rounding mode;
         | When it's 'floor', it rounds to less of the two endpoints of the interval;
-        | When it's 'ceil', it rounds to greater of the two endpoints of the interval.
+        | When it's 'ceil', it rounds to greater of the two endpoints of the interval;
+        | When it's 'largest_remainder', all values are rounded down first, and the remaining blocks go to the values
+          with the largest fractional parts, so the total matches exactly. With both rows and columns, the grid is
+          always fully filled; Otherwise, the number of blocks is the rounded sum of values.
         | [Default 'nearest']
     :type rounding_rule: str, optional
 
@@ -216,14 +725,57 @@ class Waffle(Figure):
         | If it is 'new-line', it starts with a new line when drawing each category. This only works when only one of ``rows`` and ``columns`` is assigned, and ``vertical=False`` when ``rows`` is assigned or ``vertical=True`` when ``rows`` is assigned.
         | [Default 'normal']
     :type block_arranging_style: string, optional
+
+    :param engine: Set how blocks are rendered. ``{'artist', 'collection', 'raster', 'auto'}``
+
+        | If it is 'artist', every block is added to the axis as an individual artist.
+        | If it is 'collection', all rectangle blocks of a subplot are drawn as a single PolyCollection, which is much faster for large grids. The image matches engine 'artist' except for anti-aliasing of some block edges, which could differ slightly at low dpi. Icons and characters are converted to paths once per glyph, and blocks sharing a glyph are drawn as one PathCollection. Glyph paths are not hinted like texts, so their edges look a little different, while the layout stays the same.
+        | If it is 'raster', the whole grid is drawn as one image, with gaps between blocks kept as transparent pixels. It is the fastest option for very dense charts, and it does not support icons or characters.
+        | If it is 'auto', the engine is chosen by the number of colored blocks of each subplot, with thresholds in engine_thresholds. Engine raster is never chosen for icons, characters, or when the default format of saved figures is a vector format, like SVG and PDF. The chosen engine is saved in ``plot_args``.
+        | [Default 'artist']
+    :type engine: string, optional
+
+    :param engine_thresholds: Numbers of colored blocks from which engine 'auto' chooses engine 'collection' and 'raster', in a dict with keys 'collection' and 'raster'. Missing keys are taken from ``Waffle.auto_engine_thresholds``, which could be updated to change the thresholds of all charts.
+
+        | [Default None, which is ``{'collection': 1000, 'raster': 50000}``]
+    :type engine_thresholds: dict, optional
+
+    :param units_per_block: The value of each block, when only one of rows and columns is given. Values are divided by it before being rounded to numbers of blocks. [Default 1]
+    :type units_per_block: float, optional
+
+    :param max_blocks: The maximum number of blocks of each subplot, including transparent ones.
+
+        | When only one of rows and columns is given and blocks exceed it, units_per_block is scaled up to 2, 5, 10, 20, 50... times, until blocks fit. The scaled value is saved in ``plot_args``, and ``{units_per_block}`` in the title label and labels is replaced with it, e.g. ``labels=["Cars ({units_per_block} per block)"]``.
+        | When both rows and columns are given, the grid can't be scaled and ValueError is raised.
+        | [Default None, which means no limit]
+    :type max_blocks: int, optional
+
+    :param max_blocks_strict: Whether to raise ValueError instead of scaling units_per_block when blocks exceed max_blocks. It is raised before any block is drawn. [Default False]
+    :type max_blocks_strict: bool, optional
+
+    :param executor: Prepare subplots in ``plots`` concurrently. Validation, block allocation, layout, the engine
+        chosen by 'auto', and the rectangle vertices and colors of engine collection or the block grid of engine raster
+        of each subplot are computed by the executor, while axes and artists are created in the main thread in the order
+        of plots. If any subplot fails, the error of the first failing one in that order is raised.
+
+        | It can only pay off for subplots with large grids, like engine collection or raster with hundreds of thousands of blocks each, on multiple CPU cores. Creating axes and artists takes most of the time of small charts, so they are plotted slower with an executor.
+        | If it is an int, a thread pool with that many workers is used. Threads only run NumPy computations in parallel.
+        | It could also be a ``concurrent.futures.Executor``, like a ProcessPoolExecutor, which is not shut down after use. Arguments of subplots should be picklable for a process pool, and the arrays computed by it are copied back.
+        | It is a figure parameter, and it can't be set in plots. Durations of work done by the executor are not recorded into stats.
+        | [Default None, which prepares subplots one by one]
+    :type executor: int|concurrent.futures.Executor, optional
+
+    :param stats: Whether to record timings and counts of plotting into attribute ``stats``.
+        It could also be a WaffleStats instance to record into, so stats of multiple figures can be summed up.
+        It is a figure parameter, and it can't be set in plots. [Default False]
+    :type stats: bool|WaffleStats, optional
+
+    :param stats_callback: A function called with the WaffleStats after the figure is created, and every time it is
+        drawn. If it is given, stats are recorded even if stats is False. [Default None]
+    :type stats_callback: callable, optional
     """
 
-    _direction_values = {
-        "NW": {"column_order": 1, "row_order": -1},
-        "SW": {"column_order": 1, "row_order": 1},
-        "NE": {"column_order": -1, "row_order": -1},
-        "SE": {"column_order": -1, "row_order": 1},
-    }
+    _direction_values = DIRECTION_VALUES
 
     _default_parameters = {
         "values": [],
@@ -250,14 +802,35 @@ class Waffle(Figure):
         "rounding_rule": "nearest",
         "tight": True,
         "block_arranging_style": "normal",
+        "engine": "artist",
+        "engine_thresholds": None,
+        "units_per_block": 1,
+        "max_blocks": None,
+        "max_blocks_strict": False,
         "plots": None,
     }
 
+    # Arguments that are copied in _kwarg_processor, since they could be updated when plotting
+    _copied_parameters = ("labels", "legend", "title", "plots")
+
+    #:Numbers of colored blocks from which engine 'auto' chooses engine collection and raster
+    auto_engine_thresholds = {"collection": 1_000, "raster": 50_000}
+
+    # File formats whose images should not be rasterized by engine auto
+    _vector_formats = ("svg", "svgz", "pdf", "ps", "eps")
+
     def __init__(self, *args, **kwargs):
-        #:All Waffle-specific arguments with default values
-        self.fig_args: Dict = self._kwarg_processor(
-            kwargs=kwargs, default_values=self._default_parameters
+        self._init_stats(
+            stats=kwargs.pop("stats", False),
+            stats_callback=kwargs.pop("stats_callback", None),
         )
+        executor = kwargs.pop("executor", None)
+
+        with self._stats_context(), self._phase("validation"):
+            #:All Waffle-specific arguments with default values
+            self.fig_args: Dict = self._kwarg_processor(
+                kwargs=kwargs, default_values=self._default_parameters
+            )
         super().__init__(*args, **kwargs)
 
         #:Standardized arguments of all subplots
@@ -268,19 +841,108 @@ class Waffle(Figure):
 
         plots = self.fig_args["plots"] or {} or {111: self.fig_args}
 
-        for loc, plot_args in plots.items():
-            # Add subplots
-            if isinstance(loc, tuple):
-                ax = self.add_subplot(*loc, aspect="equal")
-            elif isinstance(loc, (int, str)):
-                ax = self.add_subplot(loc, aspect="equal")
-            else:
-                raise TypeError("Subplot position should be tuple, int, or string.")
-
-            self._make_single_waffle(ax=ax, fig_args=self.fig_args, plot_args=plot_args)
+        with self._plot_executor(executor) as pool:
+            # Subplots are prepared by the executor, while artists are added here in the order of plots.
+            # Errors are raised by the first subplot that fails, same as plotting them one by one.
+            # Other subplots are not passed to workers, so each task only carries its own values
+            worker_fig_args = {**self.fig_args, "plots": None}
+            vector_format = self._is_vector_format(self)
+            futures = [
+                (
+                    pool.submit(
+                        self._prepare_plot,
+                        plot_args=plot_args,
+                        fig_args=worker_fig_args,
+                        vector_format=vector_format,
+                    )
+                    if pool
+                    else None
+                )
+                for plot_args in plots.values()
+            ]
+            try:
+                for (loc, plot_args), future in zip(plots.items(), futures):
+                    # Add subplots
+                    if isinstance(loc, tuple):
+                        ax = self.add_subplot(*loc, aspect="equal")
+                    elif isinstance(loc, (int, str)):
+                        ax = self.add_subplot(loc, aspect="equal")
+                    else:
+                        raise TypeError(
+                            "Subplot position should be tuple, int, or string."
+                        )
+
+                    with self._stats_context():
+                        self._make_single_waffle(
+                            ax=ax,
+                            fig_args=self.fig_args,
+                            plot_args=plot_args,
+                            prepared=future.result() if future else None,
+                        )
+            finally:
+                for future in futures:
+                    if future:
+                        future.cancel()
 
         # Adjust the layout
         self.set_tight_layout(self.fig_args["tight"])
+        if (
+            self.stats is not None
+            and type(self.get_layout_engine()) is TightLayoutEngine
+        ):
+            # Same settings, but the duration is recorded into stats
+            self.set_layout_engine(
+                TimedTightLayoutEngine(**self.get_layout_engine().get())
+            )
+        self._report_stats()
+
+    @staticmethod
+    @contextmanager
+    def _plot_executor(executor) -> Iterator[Optional[Executor]]:
+        """
+        Yield the executor preparing subplots, which is None if they are prepared one by one.
+        If executor is an int, a thread pool of that many workers is created and shut down afterwards.
+        """
+        if executor is None or isinstance(executor, Executor):
+            yield executor
+            return
+        if not isinstance(executor, int) or isinstance(executor, bool) or executor < 1:
+            raise ValueError(
+                "Argument executor should be a positive integer or a concurrent.futures.Executor."
+            )
+        pool = ThreadPoolExecutor(max_workers=executor)
+        try:
+            yield pool
+        finally:
+            # Pending futures are already cancelled by the caller if plotting fails
+            pool.shutdown()
+
+    def _init_stats(self, stats, stats_callback: Optional[Callable]):
+        #:WaffleStats of plotting, if parameter stats or stats_callback is set. Otherwise, it is None
+        self.stats: Optional[WaffleStats] = None
+        if isinstance(stats, WaffleStats):
+            self.stats = stats
+        elif stats or stats_callback is not None:
+            self.stats = WaffleStats()
+        self._stats_callback = stats_callback
+
+    def _stats_context(self):
+        return self.stats.track_caches() if self.stats is not None else nullcontext()
+
+    def _phase(self, name: str):
+        return self.stats.phase(name) if self.stats is not None else nullcontext()
+
+    def _report_stats(self):
+        if self._stats_callback is not None:
+            self._stats_callback(self.stats)
+
+    def draw(self, renderer):
+        if self.stats is None:
+            return super().draw(renderer)
+        with self._stats_context(), self._phase("draw"):
+            super().draw(renderer)
+        self.stats.draws += 1
+        self._report_stats()
 
     @staticmethod
     def _kwarg_processor(kwargs: Dict, default_values: Dict) -> Dict:
@@ -292,8 +954,14 @@ class Waffle(Figure):
         """
         result = {}
         for arg, val in default_values.items():
-            # passing a copy to avoid mutable legend and labels being updated in default_values
-            result[arg] = copy.deepcopy(kwargs.pop(arg, val))
+            val = kwargs.pop(arg, val)
+            # passing a copy of containers like legend and labels to avoid them being updated in default_values or
+            # user's arguments. Others like values are only read, so they are not copied.
+            result[arg] = (
+                copy.copy(val)
+                if arg in Waffle._copied_parameters and val is not None
+                else val
+            )
         return result
 
     @staticmethod
@@ -307,65 +975,65 @@ class Waffle(Figure):
     ) -> Iterator[Tuple[int, int]]:
         """
         Given the size of a matrix and starting point, return how to go through every element in the matrix
+        It is a wrapper of pywaffle.cache.get_block_layout, which returns the same positions as arrays
         """
-        if is_vertical:
-            x, x_order, y, y_order = rows, row_order, columns, column_order
-            vertical_order = -1
-        else:
-            x, x_order, y, y_order = columns, column_order, rows, row_order
-            vertical_order = 1
-
-        block_matrix = product(range(x)[::x_order], range(y)[::y_order])
-        line_base = columns if is_vertical else rows
-
-        if is_snake:
-            block_matrix = flip_lines(block_matrix, base=line_base)
-
-        return (c[::vertical_order] for c in block_matrix)
-
-    def _parameter_validation(self, par: Dict):
-        # Standardization
-        lower_string_par = (
-            "rounding_rule",
-            "block_arranging_style",
+        cols, rows = get_block_layout(
+            rows=rows,
+            columns=columns,
+            row_order=row_order,
+            column_order=column_order,
+            is_vertical=is_vertical,
+            is_snake=is_snake,
         )
-        for ls in lower_string_par:
-            par[ls] = par[ls].lower().strip()
+        return zip(cols.tolist(), rows.tolist())
 
-        upper_string_par = ("starting_location",)
-        for us in upper_string_par:
-            par[us] = par[us].upper().strip()
+    @classmethod
+    def _parameter_validation(cls, par: Dict):
+        # Standardization and validation of rounding_rule, block_arranging_style, starting_location and values
+        standardize_layout_parameters(par)
+
+        par["engine"] = par["engine"].lower().strip()
 
-        # - rounding_rule
-        if par["rounding_rule"] not in ("nearest", "ceil", "floor"):
+        # - engine
+        if par["engine"] not in ("artist", "collection", "raster", "auto"):
             raise ValueError(
-                "Argument rounding_rule should be one of nearest, ceil or floor."
+                "Argument engine should be one of artist, collection, raster or auto."
             )
+        if par["engine"] == "raster" and (par["icons"] or par["characters"]):
+            raise ValueError("Engine raster does not support icons or characters.")
+        if par["engine_thresholds"] is not None and (
+            not isinstance(par["engine_thresholds"], dict)
+            or not set(par["engine_thresholds"]) <= set(cls.auto_engine_thresholds)
+        ):
+            raise ValueError(
+                "Argument engine_thresholds should be a dict with keys collection and raster."
+            )
+
+        # - units_per_block and max_blocks
+        if par["units_per_block"] <= 0:
+            raise ValueError("Argument units_per_block should be a positive number.")
+        if par["max_blocks"] is not None and par["max_blocks"] < 1:
+            raise ValueError("Argument max_blocks should be a positive integer.")
 
-        # - values
-        if len(par["values"]) == 0:
-            raise ValueError("Argument values is required.")
-        self.values_len = len(par["values"])
+        values_len = len(par["values"])
 
         # - color
-        if par["colors"] and len(par["colors"]) != self.values_len:
+        if par["colors"] and len(par["colors"]) != values_len:
             raise ValueError("Length of colors doesn't match the values.")
 
         # - labels and values
         if isinstance(par["values"], dict):
             if not par["labels"]:
-                par["labels"] = par["values"].keys()
+                par["labels"] = list(par["values"].keys())
             par["values"] = list(par["values"].values())
 
-        if par["labels"] and len(par["labels"]) != self.values_len:
+        if par["labels"] and len(par["labels"]) != values_len:
             raise ValueError("Length of labels doesn't match the values.")
 
-        # - starting_location
-        if par["starting_location"] not in ("NW", "SW", "NE", "SE"):
-            raise KeyError("starting_location should be one of 'NW', 'SW', 'NE', 'SE'")
-
     @classmethod
-    def make_waffle(cls, ax: Axes, **kwargs):
+    def make_waffle(
+        cls, ax: Axes, stats=False, stats_callback: Optional[Callable] = None, **kwargs
+    ) -> Optional[WaffleStats]:
         """
         Plot waffle chart on given axis.
         Run it with codes like:
@@ -377,19 +1045,74 @@ class Waffle(Figure):
         :param ax: An instance of Matplotlib Axes
         :type ax: matplotlib.axes.Axes
 
+        :param stats: Same as in Waffle. Drawing of the figure is not recorded.
+        :param stats_callback: Same as in Waffle. It is called once the chart is plotted.
+
         :param **kwargs: Waffle properties
 
+        :return: WaffleStats of plotting, if stats or stats_callback is set
+        :rtype: WaffleStats|None
         """
         w = cls.__new__(cls)
+        w._init_stats(stats=stats, stats_callback=stats_callback)
 
-        w._make_single_waffle(
-            ax=ax,
-            plot_args=cls._kwarg_processor(
-                kwargs=kwargs, default_values=cls._default_parameters
-            ),
-        )
+        with w._stats_context():
+            with w._phase("validation"):
+                plot_args = cls._kwarg_processor(
+                    kwargs=kwargs, default_values=cls._default_parameters
+                )
+            w._make_single_waffle(ax=ax, plot_args=plot_args)
+        w._report_stats()
+        return w.stats
+
+    @classmethod
+    def set_waffle_values(cls, ax: Axes, values) -> List[Artist]:
+        """
+        Update the values of a waffle chart on given axis, which is plotted by Waffle or Waffle.make_waffle.
+        Blocks are recolored in place, instead of creating the chart again. They are only drawn again when the number
+        of rows or columns changes.
+        Run it with codes like:
+        ``Waffle.set_waffle_values(ax=ax, values=[30, 60, 10])``
+
+        :param ax: An instance of Matplotlib Axes with a waffle chart
+        :type ax: matplotlib.axes.Axes
+
+        :param values: New numerical value of each category. The number of categories should not change.
+        :type values: list|dict|numpy.ndarray|pandas.Series
+
+        :return: Artists of blocks that are updated or created
+        :rtype: list
+        """
+        blocks = get_waffle_blocks(ax)
+        if blocks is None:
+            raise ValueError("There is no waffle chart on the axis.")
+        return blocks.update(values)
 
-    def _make_single_waffle(self, ax: Axes, plot_args: Dict, fig_args: Dict = {}):
+    def set_values(self, values, index: int = 0) -> List[Artist]:
+        """
+        Update the values of a waffle chart in this figure. See Waffle.set_waffle_values.
+
+        :param values: New numerical value of each category. The number of categories should not change.
+        :type values: list|dict|numpy.ndarray|pandas.Series
+
+        :param index: Index of the subplot, in the order of parameter plots [Default 0]
+        :type index: int
+
+        :return: Artists of blocks that are updated or created
+        :rtype: list
+        """
+        waffle_axes = [ax for ax in self.axes if get_waffle_blocks(ax) is not None]
+        return self.set_waffle_values(ax=waffle_axes[index], values=values)
+
+    def _make_single_waffle(
+        self,
+        ax: Axes,
+        plot_args: Dict,
+        fig_args: Dict = {},
+        prepared: Optional[
+            Tuple[Dict, Optional[List[Tuple]], WaffleLayout, Dict[str, np.ndarray]]
+        ] = None,
+    ):
         """
         Plot single waffle chart.
         It's for internal use only and do not call this function for plotting directly.
@@ -402,112 +1125,192 @@ class Waffle(Figure):
 
         :param fig_args: Figure arguments passed to make_waffle or figure directly
         :type fig_args: dict
-        """
-        # _pa is the arguments for this single plot
-        # Arguments from "plots" have higher priority than figure arguments
-        _pa = {**fig_args, **plot_args}
 
-        self._parameter_validation(par=_pa)
+        :param prepared: The result of _prepare_plot with the same arguments, if it is computed in advance
+        :type prepared: tuple, optional
+        """
+        if prepared is None:
+            prepared = self._prepare_plot(
+                plot_args=plot_args,
+                fig_args=fig_args,
+                vector_format=self._is_vector_format(ax.figure),
+                phase=self._phase,
+            )
+        _pa, glyphs, layout, arrays = prepared
+        self.values_len = len(_pa["values"])
 
         # Alignment of subplots
         ax.set_anchor(_pa["plot_anchor"])
 
-        # if only one of rows/columns given, use the values as number of blocks
-        if not _pa["rows"] and not _pa["columns"]:
-            raise ValueError("At least one of rows and columns is required.")
-        # if columns is given, rows is not
-        elif _pa["rows"] is None:
-            if _pa["block_arranging_style"] == "new-line" and _pa["vertical"]:
-                block_per_cat = [
-                    round_up_to_multiple(i, base=_pa["columns"]) for i in _pa["values"]
-                ]
-                colored_block_per_cat = [
-                    division(v, 1, method=_pa["rounding_rule"]) for v in _pa["values"]
-                ]
-            else:
-                block_per_cat = colored_block_per_cat = [
-                    division(v, 1, method=_pa["rounding_rule"]) for v in _pa["values"]
-                ]
-            _pa["rows"] = division(sum(block_per_cat), _pa["columns"], method="ceil")
-        # if rows is given, columns is not
-        elif _pa["columns"] is None:
-            if _pa["block_arranging_style"] == "new-line" and not _pa["vertical"]:
-                block_per_cat = [
-                    round_up_to_multiple(i, base=_pa["rows"]) for i in _pa["values"]
-                ]
-                colored_block_per_cat = [
-                    division(v, 1, method=_pa["rounding_rule"]) for v in _pa["values"]
-                ]
-            else:
-                block_per_cat = colored_block_per_cat = [
-                    division(v, 1, method=_pa["rounding_rule"]) for v in _pa["values"]
-                ]
-            _pa["columns"] = division(sum(block_per_cat), _pa["rows"], method="ceil")
-        # if both of rows and columns are given
-        else:
-            block_per_cat = colored_block_per_cat = [
-                division(
-                    v * _pa["columns"] * _pa["rows"],
-                    sum(_pa["values"]),
-                    method=_pa["rounding_rule"],
-                )
-                for v in _pa["values"]
+        # Plot blocks
+        blocks = WaffleBlocks(ax=ax, par=_pa, glyphs=glyphs)
+        with self._phase("blocks"):
+            blocks.draw(layout, arrays=arrays)
+        ax._waffle_blocks = blocks
+
+        # Show the value of each block, which might be scaled by max_blocks, in title and labels
+        if _pa["title"] is not None and "label" in _pa["title"]:
+            _pa["title"] = {
+                **_pa["title"],
+                "label": self._fill_units_per_block(_pa["title"]["label"], _pa),
+            }
+        if _pa["labels"]:
+            _pa["labels"] = self._fill_units_per_block(_pa["labels"], _pa)
+        if "labels" in _pa["legend"]:
+            _pa["legend"]["labels"] = self._fill_units_per_block(
+                _pa["legend"]["labels"], _pa
+            )
+
+        # Add title
+        with self._phase("title"):
+            if _pa["title"] is not None:
+                ax.set_title(**_pa["title"])
+
+        with self._phase("legend"):
+            self._add_legend(ax=ax, par=_pa)
+
+        # Remove borders, ticks, etc.
+        ax.axis("off")
+
+        if self.stats is not None:
+            self.stats.charts += 1
+            self.stats.blocks += len(layout)
+            self.stats.artists += len(blocks.artists)
+
+        if hasattr(self, "plot_args"):
+            self.plot_args.append(_pa)
+
+    @staticmethod
+    def _fill_units_per_block(labels, par: Dict):
+        """
+        Replace {units_per_block} with its value in a label or a list of labels
+        Labels without it are returned as they are
+        """
+        units = par["units_per_block"]
+        text = f"{int(units):,}" if float(units).is_integer() else f"{units:,}"
+        if isinstance(labels, str):
+            return labels.replace("{units_per_block}", text)
+        if any(isinstance(l, str) and "{units_per_block}" in l for l in labels):
+            return [
+                l.replace("{units_per_block}", text) if isinstance(l, str) else l
+                for l in labels
             ]
+        return labels
 
-        # Absolute height of the plot
-        figure_height = 1
-        block_y_length = figure_height / (
-            _pa["rows"]
-            + _pa["rows"] * _pa["interval_ratio_y"]
-            - _pa["interval_ratio_y"]
-        )
-        block_x_length = _pa["block_aspect_ratio"] * block_y_length
+    @classmethod
+    def _is_vector_format(cls, fig: Figure) -> bool:
+        """
+        Whether the default format of saved figures is a vector format, which engine auto does not rasterize
+        """
+        return fig.canvas.get_default_filetype() in cls._vector_formats
 
-        # Define the limit of X, Y axis
-        ax.axis(
-            xmin=0,
-            xmax=(
-                _pa["columns"]
-                + _pa["columns"] * _pa["interval_ratio_x"]
-                - _pa["interval_ratio_x"]
+    @classmethod
+    def _choose_engine(
+        cls, par: Dict, layout: WaffleLayout, has_glyphs: bool, vector_format: bool
+    ) -> str:
+        """
+        Choose the engine of a chart with engine auto, by its number of colored blocks
+        """
+        thresholds = {**cls.auto_engine_thresholds, **(par["engine_thresholds"] or {})}
+        colored_blocks = int(np.count_nonzero(layout.colored))
+        if colored_blocks < thresholds["collection"]:
+            return "artist"
+        if colored_blocks < thresholds["raster"] or has_glyphs or vector_format:
+            return "collection"
+        return "raster"
+
+    @classmethod
+    def _prepare_plot(
+        cls,
+        plot_args: Dict,
+        fig_args: Dict,
+        vector_format: bool = False,
+        phase: Callable[[str], ContextManager] = nullcontext,
+    ) -> Tuple[Dict, Optional[List[Tuple]], WaffleLayout, Dict[str, np.ndarray]]:
+        """
+        Standardize arguments of a single plot, compute its layout, choose its engine if it is auto, and compute the
+        arrays its blocks are drawn from.
+        It does not use any figure or axis, so it could run in a worker thread or process.
+
+        :param vector_format: Whether the default format of saved figures is a vector format, for engine auto
+        :param phase: A function returning the context manager that records a phase of stats by its name
+
+        :return: Standardized arguments, glyphs of each category or None, the layout, and the arrays of blocks
+        """
+        with phase("validation"):
+            _pa, glyphs = cls._standardize_plot_args(
+                plot_args=plot_args, fig_args=fig_args
             )
-            * block_x_length,
-            ymin=0,
-            ymax=figure_height,
-        )
+        with phase("layout"):
+            layout = chart_layout(
+                par=_pa,
+                values=_pa["values"],
+                rows=_pa["rows"],
+                columns=_pa["columns"],
+                units_per_block=_pa["units_per_block"],
+            )
+        if _pa["engine"] == "auto":
+            _pa["engine"] = cls._choose_engine(
+                par=_pa,
+                layout=layout,
+                has_glyphs=glyphs is not None,
+                vector_format=vector_format,
+            )
+        with phase("blocks"):
+            arrays = WaffleBlocks.block_arrays(
+                layout=layout, engine=_pa["engine"], has_glyphs=glyphs is not None
+            )
+        return _pa, glyphs, layout, arrays
+
+    @classmethod
+    def _standardize_plot_args(
+        cls, plot_args: Dict, fig_args: Dict
+    ) -> Tuple[Dict, Optional[List[Tuple]]]:
+        """
+        Merge and validate arguments of a single plot, and resolve its colors, icons and characters
+
+        :return: Standardized arguments, and the font file and text of each category if blocks are icons or characters
+        """
+        # _pa is the arguments for this single plot
+        # Arguments from "plots" have higher priority than figure arguments
+        _pa = {**fig_args, **plot_args}
+        # Legend handles are added into legend, so it is not shared with the figure or other subplots
+        _pa["legend"] = dict(_pa["legend"])
+
+        cls._parameter_validation(par=_pa)
+        values_len = len(_pa["values"])
 
         # Build a color sequence if colors is empty
-        if not _pa["colors"]:
-            default_colors = plt.get_cmap(_pa["cmap_name"]).colors
-            default_color_num = plt.get_cmap(_pa["cmap_name"]).N
-            _pa["colors"] = array_resize(
-                array=default_colors,
-                length=self.values_len,
-                array_len=default_color_num,
-            )
+        _pa["colors"] = resolve_colors(
+            colors=_pa["colors"], cmap_name=_pa["cmap_name"], length=values_len
+        )
 
         # Set icons
+        glyphs = None
         if _pa["icons"]:
             from pywaffle.fontawesome_mapping import icons
-            from pywaffle.fontawesome_handler import fontawesome_files
+            from pywaffle.fontawesome_handler import get_font_file
 
             if _pa["icon_size"]:
-                warnings.warn("Parameter icon_size is deprecated. Use font_size instead.", DeprecationWarning)
+                warnings.warn(
+                    "Parameter icon_size is deprecated. Use font_size instead.",
+                    DeprecationWarning,
+                )
                 _pa["font_size"] = _pa["icon_size"]
 
             # If icon_style is a string, convert it into a list of same icons. The length is the value's length
             # 'solid' -> ['solid', 'solid', 'solid', ]
             if isinstance(_pa["icon_style"], str):
-                _pa["icon_style"] = [_pa["icon_style"].lower()] * self.values_len
+                _pa["icon_style"] = [_pa["icon_style"].lower()] * values_len
             elif set(_pa["icon_style"]) - set(icons.keys()):
                 raise KeyError(f"icon_style should be one of {', '.join(icons.keys())}")
 
             # If icons is a string, convert it into a list of same icon. The length is the value's length
             # '\uf26e' -> ['\uf26e', '\uf26e', '\uf26e', ]
             if isinstance(_pa["icons"], str):
-                _pa["icons"] = [_pa["icons"]] * self.values_len
+                _pa["icons"] = [_pa["icons"]] * values_len
 
-            if len(_pa["icons"]) != self.values_len:
+            if len(_pa["icons"]) != values_len:
                 raise ValueError("Length of icons doesn't match the values.")
 
             # Replace icon name with Unicode symbols in parameter icons
@@ -515,133 +1318,54 @@ class Waffle(Figure):
                 icons[icon_style][icon_name]
                 for icon_name, icon_style in zip(_pa["icons"], _pa["icon_style"])
             ]
-
-            # Calculate icon size based on the block size
-            tx, ty = ax.transData.transform([(0, 0), (0, block_x_length)])
-            prop = fm.FontProperties(
-                size=_pa["font_size"] or int((ty[1] - tx[1]) / 16 * 12)
-            )
+            glyphs = [
+                (get_font_file(style), icon)
+                for icon, style in zip(_pa["icons"], _pa["icon_style"])
+            ]
 
         elif _pa["characters"]:
             # If characters is a string, convert it into a list of same characters. It's length is the value's length
             if isinstance(_pa["characters"], str):
-                _pa["characters"] = [_pa["characters"]] * self.values_len
+                _pa["characters"] = [_pa["characters"]] * values_len
 
-            if len(_pa["characters"]) != self.values_len:
+            if len(_pa["characters"]) != values_len:
                 raise ValueError("Length of characters doesn't match the values.")
 
-            # Calculate icon size based on the block size
-            tx, ty = ax.transData.transform([(0, 0), (0, block_x_length)])
-            prop = fm.FontProperties(
-                size=_pa["font_size"] or int((ty[1] - tx[1]) / 16 * 12),
-                fname=_pa["font_file"],
-            )
-
-        # Plot blocks
-        class_index = 0
-        block_index = 0
-        this_cat_block_count = 0
-        x_full = (1 + _pa["interval_ratio_x"]) * block_x_length
-        y_full = (1 + _pa["interval_ratio_y"]) * block_y_length
-        column_order = self._direction_values[_pa["starting_location"]]["column_order"]
-        row_order = self._direction_values[_pa["starting_location"]]["row_order"]
-
-        for col, row in self._block_arranger(
-            rows=_pa["rows"],
-            columns=_pa["columns"],
-            row_order=row_order,
-            column_order=column_order,
-            is_vertical=_pa["vertical"],
-            is_snake=_pa["block_arranging_style"] == "snake",
-        ):
-            # Value could be 0. If so, skip it
-            while class_index < self.values_len and block_per_cat[class_index] == 0:
-                class_index += 1
-                this_cat_block_count = 0
-
-            if class_index > self.values_len - 1:
-                break
-
-            if block_per_cat[class_index] < 0:
-                raise ValueError("Negative value is not acceptable")
-
-            if this_cat_block_count > colored_block_per_cat[class_index] - 1:
-                color = (0, 0, 0, 0)  # transparent
-            else:
-                color = _pa["colors"][class_index]
-
-            x = x_full * col
-            y = y_full * row
-
-            if _pa["icons"]:
-                prop.set_file(fontawesome_files[_pa["icon_style"][class_index]])
-                ax.text(
-                    x=x,
-                    y=y,
-                    s=_pa["icons"][class_index],
-                    color=color,
-                    fontproperties=prop,
-                )
-            elif _pa["characters"]:
-                ax.text(
-                    x=x,
-                    y=y,
-                    s=_pa["characters"][class_index],
-                    color=color,
-                    fontproperties=prop,
-                )
-            else:
-                ax.add_artist(
-                    Rectangle(
-                        xy=(x, y),
-                        width=block_x_length,
-                        height=block_y_length,
-                        color=color,
-                    )
-                )
+            glyphs = [(_pa["font_file"], character) for character in _pa["characters"]]
 
-            block_index += 1
-            this_cat_block_count += 1
-            if block_index >= sum(block_per_cat[: class_index + 1]):
-                class_index += 1
-                if class_index > self.values_len - 1:
-                    break
-                this_cat_block_count = 0
-
-        # Add title
-        if _pa["title"] is not None:
-            ax.set_title(**_pa["title"])
+        return _pa, glyphs
 
-        # Add legend
-        if _pa["labels"] or "labels" in _pa["legend"]:
-            labels = _pa["labels"] or _pa["legend"].get("labels")
-            if _pa["icons"] and _pa["icon_legend"] is True:
+    def _add_legend(self, ax: Axes, par: Dict):
+        """
+        Add the legend of a single plot, if labels are given in par
+        """
+        if par["labels"] or "labels" in par["legend"]:
+            labels = par["labels"] or par["legend"].get("labels")
+            if par["icons"] and par["icon_legend"] is True:
                 from pywaffle.fontawesome_handler import (
-                    legend_handler_style_mapping,
+                    get_legend_handler,
                     legend_style_class_mapping,
                 )
 
-                _pa["legend"]["handles"] = [
+                par["legend"]["handles"] = [
                     legend_style_class_mapping[style](color=color, text=icon)
                     for color, icon, style in zip(
-                        _pa["colors"], _pa["icons"], _pa["icon_style"]
+                        par["colors"], par["icons"], par["icon_style"]
                     )
                 ]
-                _pa["legend"]["handler_map"] = legend_handler_style_mapping
-            elif not _pa['legend'].get('handles'):
-                _pa["legend"]["handles"] = [
-                    Patch(color=c, label=str(l)) for c, l in zip(_pa["colors"], labels)
+                # Only build handlers of the styles in use
+                par["legend"]["handler_map"] = {
+                    legend_style_class_mapping[style]: get_legend_handler(style)
+                    for style in set(par["icon_style"])
+                }
+            elif not par["legend"].get("handles"):
+                par["legend"]["handles"] = [
+                    Patch(color=c, label=str(l)) for c, l in zip(par["colors"], labels)
                 ]
 
             # labels is an alias of legend['labels']
-            if "labels" not in _pa["legend"] and _pa["labels"]:
-                _pa["legend"]["labels"] = _pa["labels"]
-
-            if "handles" in _pa["legend"] and "labels" in _pa["legend"]:
-                ax.legend(**_pa["legend"])
-
-        # Remove borders, ticks, etc.
-        ax.axis("off")
+            if "labels" not in par["legend"] and par["labels"]:
+                par["legend"]["labels"] = par["labels"]
 
-        if hasattr(self, "plot_args"):
-            self.plot_args.append(_pa)
+            if "handles" in par["legend"] and "labels" in par["legend"]:
+                ax.legend(**par["legend"])
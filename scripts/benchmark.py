@@ -0,0 +1,289 @@
+# This script benchmarks the hot paths of PyWaffle in the working tree, and compares results of two runs
+#
+# Run the benchmarks and save the results:
+#     python3 scripts/benchmark.py run --output results.json
+# Compare two results, exiting with status 1 if any benchmark is slower than the threshold:
+#     python3 scripts/benchmark.py compare baseline.json results.json --threshold 1.2
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+PACKAGE_ROOT = Path(__file__).parent.parent.absolute()
+# Benchmark the package in the working tree instead of an installed one
+sys.path.insert(0, str(PACKAGE_ROOT))
+
+# Number of blocks of charts in grid size benchmarks
+GRID_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+QUICK_GRID_SIZES = [10, 100, 1_000]
+# Engine artist creates one artist per block, so it is only measured up to this size
+MAX_ARTIST_BLOCKS = 10_000
+MODES = {
+    "rectangles": {},
+    "characters": {"characters": ["A", "B", "C"]},
+    "icons": {
+        "icons": ["star", "user", "apple"],
+        "icon_style": ["solid", "regular", "brands"],
+    },
+}
+ENGINES = ["artist", "collection", "raster"]
+SAVEFIG_FORMATS = ["png", "svg", "pdf"]
+
+IMPORT_SCRIPT = "import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+
+
+def measure(func: Callable[[], None], repeat: int, min_time: float) -> Dict:
+    """
+    Call func at least repeat times and until min_time seconds are spent, and return statistics of the durations
+    """
+    durations = []
+    start = time.perf_counter()
+    while len(durations) < repeat or time.perf_counter() - start < min_time:
+        run_start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - run_start)
+    return {
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "runs": len(durations),
+    }
+
+
+def grid(blocks: int) -> Dict:
+    """
+    Arguments of a chart with 10 rows and given number of blocks
+    """
+    rows = min(blocks, 10)
+    columns = blocks // rows
+    return {
+        "rows": rows,
+        "columns": columns,
+        "values": [columns * rows * 0.5, columns * rows * 0.3, columns * rows * 0.2],
+    }
+
+
+def import_benchmark(module: str) -> Callable[[], float]:
+    """
+    Import module in a new interpreter, so nothing is cached, and return the duration measured in it
+    """
+
+    def run():
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(PACKAGE_ROOT)},
+        )
+        return float(result.stdout)
+
+    return run
+
+
+def benchmarks(sizes: List[int]) -> Iterator[Tuple[str, Callable[[], None]]]:
+    """
+    Yield the name and function of every benchmark
+    """
+    from matplotlib.figure import Figure
+
+    from pywaffle import Waffle, compute_layout
+
+    def close(fig):
+        # Figures are created without pyplot, so they are freed once they are not referenced
+        fig.clear()
+
+    for blocks in sizes:
+        yield f"compute_layout/{blocks}", lambda blocks=blocks: compute_layout(
+            **grid(blocks)
+        )
+
+    for engine in ENGINES:
+        for mode, mode_args in MODES.items():
+            if engine == "raster" and mode != "rectangles":
+                continue
+            for blocks in sizes:
+                if engine == "artist" and blocks > MAX_ARTIST_BLOCKS:
+                    continue
+
+                def construct(engine=engine, mode_args=mode_args, blocks=blocks):
+                    close(Waffle(engine=engine, **mode_args, **grid(blocks)))
+
+                yield f"construct/{engine}/{mode}/{blocks}", construct
+
+    for engine in ENGINES:
+        for fmt in SAVEFIG_FORMATS:
+            fig = Waffle(engine=engine, **grid(1_000))
+
+            def savefig(fig=fig, fmt=fmt):
+                fig.savefig(io.BytesIO(), format=fmt)
+
+            yield f"savefig/{fmt}/{engine}/1000", savefig
+
+    def make_waffle():
+        fig = Figure()
+        Waffle.make_waffle(ax=fig.add_subplot(111, aspect="equal"), **grid(1_000))
+        close(fig)
+
+    yield "make_waffle/1000", make_waffle
+
+    for subplots in (4, 16, 64):
+        plots = {(8, 8, i + 1): {"values": [i + 1, 10, 20]} for i in range(subplots)}
+        yield f"plots/{subplots}", lambda plots=plots: close(
+            Waffle(rows=5, columns=10, plots=plots)
+        )
+        yield f"plots/{subplots}/executor", lambda plots=plots: close(
+            Waffle(rows=5, columns=10, plots=plots, executor=4)
+        )
+
+    # Subplots with large grids, whose preparation is a large part of the time, so an executor could pay off
+    blocks = max(sizes)
+    plots = {(2, 2, i + 1): grid(blocks) for i in range(4)}
+    for engine in ("collection", "raster"):
+        yield f"plots/4/{engine}/{blocks}", lambda engine=engine: close(
+            Waffle(engine=engine, plots=plots)
+        )
+        yield f"plots/4/{engine}/{blocks}/executor", lambda engine=engine: close(
+            Waffle(engine=engine, plots=plots, executor=4)
+        )
+
+    for engine in ENGINES:
+        fig = Waffle(engine=engine, **grid(1_000))
+        if not hasattr(fig, "set_values"):
+            continue
+        snapshots = [[500, 300, 200], [300, 500, 200]]
+
+        def set_values(fig=fig, snapshots=snapshots):
+            for values in snapshots:
+                fig.set_values(values)
+
+        yield f"set_values/{engine}/1000", set_values
+
+
+def run(args: argparse.Namespace):
+    import matplotlib
+    import numpy
+
+    sizes = QUICK_GRID_SIZES if args.quick else GRID_SIZES
+    results = {}
+
+    def record(name: str, result: Dict):
+        results[name] = result
+        print(
+            f"{name:<45} {result['min'] * 1000:>10.2f} ms  (median {result['median'] * 1000:.2f} ms)",
+            flush=True,
+        )
+
+    # Import time is measured inside every new interpreter
+    for module in ("pywaffle", "pywaffle.fontawesome_mapping"):
+        if args.filter and args.filter not in f"import/{module}":
+            continue
+        durations = [import_benchmark(module)() for _ in range(args.repeat)]
+        record(
+            f"import/{module}",
+            {
+                "min": min(durations),
+                "median": statistics.median(durations),
+                "runs": len(durations),
+            },
+        )
+
+    for name, func in benchmarks(sizes):
+        if args.filter and args.filter not in name:
+            continue
+        record(name, measure(func, repeat=args.repeat, min_time=args.min_time))
+
+    output = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "matplotlib": matplotlib.__version__,
+            "numpy": numpy.__version__,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+
+def compare(args: argparse.Namespace) -> int:
+    """
+    Print the ratio of minimum durations of benchmarks in both results, and return 1 if any is slower than threshold
+    """
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.results) as f:
+        results = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':<45} {'baseline':>12} {'results':>12} {'ratio':>8}")
+    for name in [name for name in baseline if name in results]:
+        old, new = baseline[name]["min"], results[name]["min"]
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  slower"
+            regressions += 1
+        elif ratio < 1 / args.threshold:
+            flag = "  faster"
+        print(
+            f"{name:<45} {old * 1000:>10.2f}ms {new * 1000:>10.2f}ms {ratio:>8.2f}{flag}"
+        )
+
+    for name in sorted(baseline.keys() ^ results.keys()):
+        print(f"{name:<45} only in {'baseline' if name in baseline else 'results'}")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PyWaffle")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument(
+        "--output", "-o", help="Path of the JSON file to save results into"
+    )
+    run_parser.add_argument(
+        "--filter", "-k", help="Only run benchmarks whose names contain this string"
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=3, help="Minimum number of runs of each benchmark"
+    )
+    run_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum seconds spent on each benchmark",
+    )
+    run_parser.add_argument(
+        "--quick", action="store_true", help="Only use grids up to 1000 blocks"
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two JSON results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.1,
+        help="Ratio of durations over which a benchmark is a regression",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return compare(args)
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
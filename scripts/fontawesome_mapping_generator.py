@@ -1,17 +1,94 @@
 # This script generates Font Awesome icon mapping file pywaffle/fontawesome_mapping.py
 # It's called in setup.py, and it runs as post-install command
 
-import inspect
 import json
 import subprocess
 import sys
 from collections import defaultdict
 from pathlib import Path
 
-import fontawesomefree
+from pywaffle.fontawesome_files import (
+    FONTAWESOME_PACKAGE_NAME,
+    font_file_finder,
+    fontawesome_package_path,
+)
+from pywaffle.fontawesome_index import NAME_SEPARATOR, pack_style
 
 INDENT = " " * 4
-FONTAWESOME_PACKAGE_NAME = "fontawesomefree"
+MAPPING_FILE_PATH = (
+    Path(__file__).parent.parent.absolute() / "pywaffle/fontawesome_mapping.py"
+)
+# Approximate length of every line of packed strings in the mapping file
+LINE_LENGTH = 72
+
+
+def string_literal(s):
+    """
+    Return a Python string literal in double quotes which only contains ASCII characters
+    """
+    return '"' + s.encode("unicode_escape").decode("ascii").replace('"', '\\"') + '"'
+
+
+def chunk_string(s, step):
+    """
+    Split a string into parts with at most step characters
+    """
+    return [s[i : i + step] for i in range(0, len(s), step)] or [""]
+
+
+def write_string_lines(file, lines):
+    """
+    Write a string as implicitly concatenated literals, one line for each part, followed by a comma
+    """
+    for i, line in enumerate(lines):
+        comma = "," if i == len(lines) - 1 else ""
+        file.write(f"{INDENT * 3}{string_literal(line)}{comma}\n")
+
+
+def write_mapping(mapping, font_files, fa_version, path=MAPPING_FILE_PATH):
+    """
+    Write the icon mapping of all styles into a Python file, where each style is packed into sorted icon names and
+    their symbols, so the file is small and fast to import.
+    Paths to font files of each style, relative to the fontawesomefree package, are written as well, so they don't
+    need to be searched at runtime.
+    """
+    with open(path, "w") as file:
+        file.write(f"# For Font Awesome version: {fa_version}\n")
+        file.write("# Generated by scripts/fontawesome_mapping_generator.py\n")
+        file.write("\n")
+        file.write("from pywaffle.fontawesome_index import IconIndex\n")
+        file.write("\n")
+        file.write("icons = IconIndex(\n")
+        file.write(f"{INDENT}{{\n")
+        for style, style_mapping in mapping.items():
+            names, symbols = pack_style(style_mapping)
+            file.write(f"{INDENT * 2}{string_literal(style)}: (\n")
+
+            # Icon names, each line ends with a separator except for the last one
+            name_lines = [""]
+            for name in names.split(NAME_SEPARATOR):
+                if len(name_lines[-1]) > LINE_LENGTH:
+                    name_lines.append("")
+                name_lines[-1] += name + NAME_SEPARATOR
+            name_lines[-1] = name_lines[-1][: -len(NAME_SEPARATOR)]
+            write_string_lines(file, name_lines)
+
+            # Symbols are escaped into 6 or 10 characters each
+            write_string_lines(file, chunk_string(symbols, LINE_LENGTH // 6))
+
+            file.write(f"{INDENT * 2}),\n")
+        file.write(f"{INDENT}}}\n")
+        file.write(")\n")
+        file.write("\n")
+        file.write(
+            f"# Font files of each style, relative to the {FONTAWESOME_PACKAGE_NAME} package\n"
+        )
+        file.write("font_files = {\n")
+        for style, font_file in font_files.items():
+            file.write(
+                f"{INDENT}{string_literal(style)}: {string_literal(font_file)},\n"
+            )
+        file.write("}\n")
 
 
 def main():
@@ -25,10 +102,8 @@ def main():
     fa_pip_version = pip_show.split("\n")[1].lstrip("Version: ")
 
     # Get font meta data from the package
-    package_path = Path(inspect.getsourcefile(fontawesomefree))
-    icons_json_path = (
-        package_path.parent / "static/fontawesomefree/metadata" / "icons.json"
-    )
+    package_path = fontawesome_package_path()
+    icons_json_path = package_path / "static/fontawesomefree/metadata" / "icons.json"
     with open(icons_json_path, "r") as f:
         icons = json.load(f)
 
@@ -43,14 +118,12 @@ def main():
                     print(f"Font {alias} existed. This mapping might contain issues!")
                 mapping[style][alias] = chr(int(font_meta["unicode"], 16))
 
-    with open(
-        Path(__file__).parent.parent.absolute() / "pywaffle/fontawesome_mapping.py", "w"
-    ) as file:
-        file.write(f"# For Font Awesome version: {fa_pip_version}\n")
-        file.write("\n")
-        file.write("icons = ")
-        file.write(json.dumps(mapping, indent=4))
-        file.write("\n")
+    font_files = {
+        style: path.relative_to(package_path).as_posix()
+        for style, path in sorted(font_file_finder().items())
+    }
+
+    write_mapping(mapping, font_files=font_files, fa_version=fa_pip_version)
 
 
 if __name__ == "__main__":
@@ -29,7 +29,7 @@ setup(
     author_email="mail@guangyangli.com",
     url="https://github.com/gyli/PyWaffle",
     packages=["pywaffle"],
-    install_requires=["fontawesomefree", "matplotlib"],
+    install_requires=["fontawesomefree", "matplotlib>=3.6", "numpy"],
     cmdclass={"install": InstallCommand},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
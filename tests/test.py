@@ -1,11 +1,19 @@
 #!/usr/bin/python
 # -*-coding: utf-8 -*-
 
+from concurrent.futures import ProcessPoolExecutor
+import gc
+import io
 import os
+import pickle
 import unittest
+import weakref
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection, PolyCollection
+import numpy as np
 
+from pywaffle.layout import compute_layout
 from pywaffle.waffle import Waffle
 
 
@@ -41,6 +49,18 @@ class TestWaffle(unittest.TestCase):
         self.assertEqual(fig.fig_args["labels"], ["cat1", "cat2"])
         self.assertEqual(fig.plot_args[0]["labels"], ["cat3", "cat4"])
         self.assertEqual(fig.plot_args[1]["labels"], ["cat5", "cat6"])
+        # Legend handles are built for each subplot
+        self.assertEqual([h.get_label() for h in fig.plot_args[1]["legend"]["handles"]], ["cat5", "cat6"])
+
+    def test_argument_copies(self):
+        values = np.arange(1, 101)
+        legend = {"loc": "upper left"}
+        fig = plt.figure(FigureClass=Waffle, rows=10, values=values, labels=[str(v) for v in values], legend=legend)
+        # Values are not copied, while legend is copied before adding handles
+        self.assertIs(fig.fig_args["values"], values)
+        self.assertEqual(legend, {"loc": "upper left"})
+        self.assertNotIn("handles", Waffle._default_parameters["legend"])
+        plt.close(fig)
 
     def test_block_arranger(self):
         self.assertEqual(
@@ -72,12 +92,319 @@ class TestWaffle(unittest.TestCase):
             [],
         )
 
+    def test_engine(self):
+        def render(**kwargs):
+            fig = plt.figure(FigureClass=Waffle, **kwargs)
+            fig.canvas.draw()
+            image = np.asarray(fig.canvas.buffer_rgba()).copy()
+            plt.close(fig)
+            return fig, image
+
+        for kwargs in (
+            {"rows": 5, "values": [48, 46, 3]},
+            {"rows": 7, "columns": 9, "values": [3, 5, 2], "vertical": True, "block_arranging_style": "snake"},
+            {"rows": 4, "values": [5, 0, 7], "block_arranging_style": "new-line", "block_aspect_ratio": 1.5},
+        ):
+            artist_fig, artist_image = render(**kwargs)
+            collection_fig, collection_image = render(engine="collection", **kwargs)
+
+            self.assertEqual(len(collection_fig.axes[0].collections), 1)
+            self.assertIsInstance(collection_fig.axes[0].collections[0], PolyCollection)
+            self.assertEqual(len(collection_fig.axes[0].patches), 0)
+            np.testing.assert_array_equal(artist_image, collection_image)
+
+        # At a low dpi, anti-aliasing of some block edges differs, by at most 23/255 on less than 0.5% of pixels
+        for kwargs in (
+            {"rows": 4, "values": [5, 0, 7], "block_arranging_style": "new-line", "block_aspect_ratio": 1.5},
+            {"rows": 11, "values": [13, 29], "block_aspect_ratio": 0.7, "interval_ratio_x": 0.5, "vertical": True},
+        ):
+            _, artist_image = render(dpi=50, **kwargs)
+            _, collection_image = render(dpi=50, engine="collection", **kwargs)
+            diff = np.abs(artist_image.astype(int) - collection_image.astype(int)).max(axis=-1)
+            self.assertLessEqual(diff.max(), 23)
+            self.assertLess((diff > 0).mean(), 0.005)
+
+        with self.assertRaises(ValueError):
+            plt.figure(FigureClass=Waffle, rows=5, values=[1, 2], engine="unknown")
+
+    def test_collection_engine_glyphs(self):
+        fig = plt.figure(
+            FigureClass=Waffle,
+            rows=5,
+            values=[12, 8, 5],
+            icons=["star", "star", "apple"],
+            icon_style=["solid", "solid", "brands"],
+            engine="collection",
+        )
+        ax = fig.axes[0]
+        # One collection per distinct glyph
+        self.assertEqual(len(ax.collections), 2)
+        self.assertTrue(all(isinstance(c, PathCollection) for c in ax.collections))
+        self.assertEqual([len(c.get_offsets()) for c in ax.collections], [20, 5])
+        self.assertEqual(len(ax.texts), 0)
+        plt.close(fig)
+
+        fig = plt.figure(FigureClass=Waffle, rows=4, values=[7, 8], characters=["A", "B"], engine="collection")
+        self.assertEqual([len(c.get_offsets()) for c in fig.axes[0].collections], [7, 8])
+        plt.close(fig)
+
+        # Tight layout leaves the same room around glyph collections as around texts
+        for kwargs in ({"icons": "star"}, {"characters": ["A", "B", "g"]}):
+            positions = []
+            for engine in ("artist", "collection"):
+                fig = plt.figure(FigureClass=Waffle, rows=5, values=[12, 8, 5], engine=engine, **kwargs)
+                fig.canvas.draw()
+                positions.append(fig.axes[0].get_position().bounds)
+                plt.close(fig)
+            np.testing.assert_allclose(positions[0], positions[1])
+
+    def test_raster_engine(self):
+        fig = plt.figure(FigureClass=Waffle, rows=2, values=[3, 1], colors=("#FF0000", "#0000FF"), engine="raster")
+        ax = fig.axes[0]
+        self.assertEqual(len(ax.images), 1)
+        self.assertEqual(len(ax.patches), 0)
+
+        # 2 rows x 2 columns of 10-pixel blocks with 2-pixel gaps
+        image = ax.images[0].get_array()
+        self.assertEqual(image.shape, (22, 22, 4))
+        np.testing.assert_array_equal(image[0, 0], [255, 0, 0, 255])
+        np.testing.assert_array_equal(image[10, 10], [0, 0, 0, 0])
+        np.testing.assert_array_equal(image[21, 21], [0, 0, 255, 255])
+        self.assertEqual(ax.images[0].get_extent(), [0, ax.get_xlim()[1], 0, 1])
+        plt.close(fig)
+
+        # Values rounded to no blocks give an empty grid without any image
+        for values in ([0, 0], [0.2, 0.1]):
+            fig = plt.figure(FigureClass=Waffle, rows=2, values=values, engine="raster")
+            self.assertEqual(len(fig.axes[0].images), 0)
+            fig.savefig(io.BytesIO(), format="png")
+            self.assertEqual(fig.set_values([0, 0]), [])
+            fig.set_values([3, 1])
+            self.assertEqual(len(fig.axes[0].images), 1)
+            self.assertEqual(fig.set_values([0, 0]), [])
+            self.assertEqual(len(fig.axes[0].images), 0)
+            fig.savefig(io.BytesIO(), format="png")
+            plt.close(fig)
+
+        with self.assertRaises(ValueError):
+            plt.figure(FigureClass=Waffle, rows=5, values=[1, 2], icons="star", engine="raster")
+
+    def test_transparent_blocks(self):
+        # new-line style pads categories with transparent blocks, which have no artists
+        kwargs = {"rows": 4, "values": [5, 1, 2], "block_arranging_style": "new-line"}
+        fig = plt.figure(FigureClass=Waffle, **kwargs)
+        ax = fig.axes[0]
+        self.assertEqual(len(ax.patches), 8)
+        # Padding blocks still take their places
+        self.assertEqual(fig.plot_args[0]["columns"], 4)
+        self.assertEqual(ax.get_xlim(), (0, compute_layout(**kwargs).width))
+
+        fig = plt.figure(FigureClass=Waffle, engine="collection", **kwargs)
+        self.assertEqual(len(fig.axes[0].collections[0].get_paths()), 8)
+        fig = plt.figure(FigureClass=Waffle, engine="collection", characters=["A", "B", "C"], **kwargs)
+        self.assertEqual([len(c.get_offsets()) for c in fig.axes[0].collections], [5, 1, 2])
+        plt.close("all")
+
+    def test_auto_engine(self):
+        fig = plt.figure(
+            FigureClass=Waffle,
+            plots={
+                221: {"values": [30, 20]},
+                222: {"values": [3000, 2000]},
+                223: {"values": [30000, 20000]},
+                224: {"values": [3000, 2000], "characters": "A"},
+            },
+            rows=10,
+            engine="auto",
+            engine_thresholds={"raster": 50000},
+        )
+        self.assertEqual([p["engine"] for p in fig.plot_args], ["artist", "collection", "raster", "collection"])
+        self.assertEqual(len(fig.axes[2].images), 1)
+        plt.close(fig)
+
+        # Per call thresholds override the global ones
+        fig = plt.figure(FigureClass=Waffle, rows=10, values=[30, 20], engine="auto", engine_thresholds={"collection": 10})
+        self.assertEqual(fig.plot_args[0]["engine"], "collection")
+        plt.close(fig)
+
+        # Transparent blocks are not counted
+        fig = plt.figure(FigureClass=Waffle, rows=2, values=[1] * 600, block_arranging_style="new-line", engine="auto")
+        self.assertEqual(fig.plot_args[0]["engine"], "artist")
+        plt.close(fig)
+
+        # Images are not used when saving vector formats
+        with plt.rc_context({"savefig.format": "svg"}):
+            fig = plt.figure(FigureClass=Waffle, rows=10, values=[30000, 20000], engine="auto")
+        self.assertEqual(fig.plot_args[0]["engine"], "collection")
+        plt.close(fig)
+
+        with self.assertRaises(ValueError):
+            plt.figure(FigureClass=Waffle, rows=10, values=[30, 20], engine="auto", engine_thresholds={"image": 10})
+
+    def test_max_blocks(self):
+        fig = plt.figure(
+            FigureClass=Waffle,
+            rows=10,
+            values=[3_000_000, 1_200_000],
+            max_blocks=10_000,
+            engine="collection",
+            labels=["a", "b ({units_per_block} per block)"],
+            title={"label": "{units_per_block} per block"},
+        )
+        self.assertEqual(fig.plot_args[0]["units_per_block"], 500)
+        self.assertEqual(fig.plot_args[0]["columns"], 840)
+        self.assertEqual(fig.axes[0].get_title(), "500 per block")
+        self.assertEqual(fig.plot_args[0]["labels"], ["a", "b (500 per block)"])
+        plt.close(fig)
+
+        # Nothing is drawn in strict mode
+        fig, ax = plt.subplots()
+        with self.assertRaises(ValueError):
+            Waffle.make_waffle(ax=ax, rows=10, values=[3_000_000, 1_200_000], max_blocks=10_000, max_blocks_strict=True)
+        self.assertEqual(len(ax.patches), 0)
+        plt.close(fig)
+
+    def test_executor(self):
+        plots = {
+            221: {"values": [30, 20], "labels": ["a", "b"]},
+            222: {"values": {"c": 4, "d": 6}},
+            223: {"values": [3, 2], "icons": "star"},
+            224: {"values": [5, 5], "columns": 4, "title": {"label": "t"}},
+        }
+        expected = plt.figure(FigureClass=Waffle, rows=5, plots=plots, engine="auto")
+        for executor in (2, ProcessPoolExecutor(max_workers=1)):
+            fig = plt.figure(FigureClass=Waffle, rows=5, plots=plots, engine="auto", executor=executor)
+            self.assertEqual(
+                [(p["rows"], p["columns"], p["labels"], p["engine"]) for p in fig.plot_args],
+                [(p["rows"], p["columns"], p["labels"], p["engine"]) for p in expected.plot_args],
+            )
+            self.assertEqual([len(ax.patches) + len(ax.texts) for ax in fig.axes], [50, 10, 5, 20])
+            # Other subplots are not sent to workers
+            self.assertEqual([p["plots"] for p in fig.plot_args], [None] * 4)
+            plt.close(fig)
+            if isinstance(executor, ProcessPoolExecutor):
+                executor.shutdown()
+        plt.close(expected)
+
+        # Arrays of engine collection and raster are computed by the executor, and the image stays the same
+        for engine in ("collection", "raster"):
+            images = []
+            for executor in (None, 2):
+                fig = plt.figure(
+                    FigureClass=Waffle, rows=5, plots={121: plots[221], 122: plots[224]}, engine=engine, executor=executor
+                )
+                fig.canvas.draw()
+                images.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+                plt.close(fig)
+            np.testing.assert_array_equal(images[0], images[1])
+
+        # The error of the first failing subplot is raised
+        with self.assertRaisesRegex(ValueError, "colors"):
+            plt.figure(
+                FigureClass=Waffle,
+                rows=5,
+                plots={
+                    121: {"values": [1, 2], "colors": ["red"]},
+                    122: {"values": [1, 2], "icons": "star", "icon_style": "unknown"},
+                },
+                executor=2,
+            )
+        with self.assertRaises(ValueError):
+            plt.figure(FigureClass=Waffle, rows=5, values=[1, 2], executor=0)
+        plt.close("all")
+
+    def test_figures_are_freed(self):
+        fig = plt.figure(FigureClass=Waffle, rows=5, values=[30, 20])
+        ref = weakref.ref(fig)
+        plt.close(fig)
+        del fig
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_set_values(self):
+        def render(fig):
+            fig.canvas.draw()
+            image = np.asarray(fig.canvas.buffer_rgba()).copy()
+            plt.close(fig)
+            return image
+
+        for engine in ("artist", "collection", "raster"):
+            # The second update changes the number of columns, so blocks are drawn again
+            for new_values in ([30, 60, 10], [20, 10, 3], [100, 100, 100]):
+                fig = plt.figure(FigureClass=Waffle, rows=5, values=[48, 46, 6], engine=engine)
+                fig.set_values(new_values)
+                self.assertEqual(fig.plot_args[0]["values"], new_values)
+                expected = plt.figure(FigureClass=Waffle, rows=5, values=new_values, engine=engine)
+                self.assertEqual(fig.plot_args[0]["columns"], expected.plot_args[0]["columns"])
+                np.testing.assert_array_equal(render(fig), render(expected))
+
+        # Only changed blocks are updated
+        fig = plt.figure(FigureClass=Waffle, rows=5, columns=10, values=[20, 20, 10])
+        self.assertEqual(len(fig.set_values([19, 21, 10])), 1)
+        with self.assertRaises(ValueError):
+            fig.set_values([1, 2])
+        plt.close(fig)
+
+        fig, ax = plt.subplots()
+        Waffle.make_waffle(ax=ax, rows=5, values=[12, 8], icons=["star", "user"], engine="collection")
+        self.assertEqual([len(c.get_offsets()) for c in ax.collections], [12, 8])
+        Waffle.set_waffle_values(ax=ax, values={"a": 16, "b": 4})
+        self.assertEqual([len(c.get_offsets()) for c in ax.collections], [16, 4])
+        with self.assertRaises(ValueError):
+            Waffle.set_waffle_values(ax=fig.add_subplot(222), values=[1, 2])
+        plt.close(fig)
+
+    def test_stats(self):
+        reports = []
+        fig = plt.figure(
+            FigureClass=Waffle,
+            plots={121: {"values": [3, 2]}, 122: {"values": [1, 4], "labels": ["a", "b"]}},
+            rows=2,
+            icons="star",
+            engine="collection",
+            stats_callback=reports.append,
+        )
+        self.assertEqual(len(reports), 1)
+        self.assertEqual((fig.stats.charts, fig.stats.blocks), (2, 10))
+        # One PathCollection per chart
+        self.assertEqual(fig.stats.artists, 2)
+        self.assertEqual(set(fig.stats.durations), {"validation", "layout", "blocks", "title", "legend"})
+        self.assertEqual(fig.stats.cache_hits["layout"] + fig.stats.cache_misses["layout"], 2)
+
+        fig.canvas.draw()
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(fig.stats.draws, 1)
+        self.assertIn("tight_layout", fig.stats.durations)
+        self.assertGreaterEqual(fig.stats.durations["draw"], fig.stats.durations["tight_layout"])
+        plt.close(fig)
+
+        fig = plt.figure(FigureClass=Waffle, rows=2, values=[3, 2])
+        self.assertIsNone(fig.stats)
+        plt.close(fig)
+
+        # Figures with stats can be pickled, and tight_layout is still timed after unpickling
+        fig = pickle.loads(pickle.dumps(plt.figure(FigureClass=Waffle, rows=2, values=[3, 2], stats=True)))
+        self.assertEqual(fig.stats.charts, 1)
+        fig.canvas.draw()
+        self.assertIn("tight_layout", fig.stats.durations)
+        plt.close("all")
+
+        # Stats of make_waffle can be summed up into an existing WaffleStats
+        fig, ax = plt.subplots()
+        stats = Waffle.make_waffle(ax=ax, rows=2, values=[3, 2], stats=True)
+        self.assertEqual(stats.artists, 5)
+        self.assertIs(Waffle.make_waffle(ax=fig.add_subplot(222), rows=2, values=[1, 1], stats=stats), stats)
+        self.assertEqual(stats.as_dict()["blocks"], 7)
+        self.assertIsNone(Waffle.make_waffle(ax=fig.add_subplot(223), rows=2, values=[1, 1]))
+        plt.close(fig)
+
     def test_legend(self):
         fig = plt.figure(FigureClass=Waffle, rows=10, values=[10], labels=["cat1"])
         self.assertEqual(fig.gca().get_legend().texts[0]._text, "cat1")
 
     def test_plot(self):
         test_plots_folder = "test_plots/"
+        os.makedirs(test_plots_folder, exist_ok=True)
 
         # Most of the parameters
         plot_file_name = "title_and_legend.png"
@@ -117,6 +444,7 @@ class TestWaffle(unittest.TestCase):
 
     def test_make_waffle(self):
         test_plots_folder = "test_plots/"
+        os.makedirs(test_plots_folder, exist_ok=True)
 
         # Most of the parameters
         plot_file_name = "make_waffle_on_ax.png"
@@ -0,0 +1,58 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+
+import matplotlib.pyplot as plt
+
+from pywaffle.animation import animate_waffle, interpolate_values
+from pywaffle.waffle import Waffle
+
+
+class TestAnimation(unittest.TestCase):
+    def test_interpolate_values(self):
+        self.assertEqual(
+            list(interpolate_values([[0, 10], [10, 0]], steps=2)),
+            [[0, 10], [5, 5], [10, 0]],
+        )
+        self.assertEqual(
+            list(
+                interpolate_values(
+                    [{"a": 1, "b": 2}, {"a": 3, "b": 2}, {"a": 3, "b": 0}], steps=1
+                )
+            ),
+            [[1, 2], [3, 2], [3, 0]],
+        )
+        self.assertEqual(list(interpolate_values([])), [])
+
+    def test_animate_waffle(self):
+        fig = plt.figure(
+            FigureClass=Waffle,
+            rows=5,
+            columns=10,
+            values=[20, 20, 10],
+            engine="collection",
+            labels=["a", "b", "c"],
+        )
+        frames = list(interpolate_values([[20, 20, 10], [10, 30, 10]], steps=3))
+        anim = animate_waffle(fig, frames=frames, interval=10)
+
+        # Only the block collection changes between frames
+        self.assertEqual(anim._init_func(), fig.axes[0].collections[:])
+        self.assertEqual(anim._func(frames[1]), fig.axes[0].collections[:])
+
+        with tempfile.TemporaryDirectory() as folder:
+            anim.save(os.path.join(folder, "waffle.gif"), writer="pillow")
+        self.assertEqual(fig.plot_args[0]["values"], [10, 30, 10])
+        plt.close(fig)
+
+        fig, ax = plt.subplots()
+        with self.assertRaises(ValueError):
+            animate_waffle(fig, frames=frames)
+        plt.close(fig)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+
+from pywaffle.batch import render_batch
+
+
+class TestBatch(unittest.TestCase):
+    def test_render_batch(self):
+        with tempfile.TemporaryDirectory() as folder:
+            specs = [
+                {"rows": 5, "values": [48, 46, 6], "figsize": (3, 2)},
+                {"rows": 5, "values": [1, 2], "starting_location": "unknown"},
+                {
+                    "rows": 5,
+                    "values": [12, 8],
+                    "icons": "star",
+                    "labels": ["a", "b"],
+                    "icon_legend": True,
+                },
+                {"columns": 4, "values": {"a": 3, "b": 5}, "engine": "collection"},
+            ]
+            targets = [
+                os.path.join(folder, f"{i}.{ext}")
+                for i, ext in enumerate(["png", "png", "svg", "pdf"])
+            ]
+            progress_calls = []
+
+            for processes in (1, 2):
+                progress_calls.clear()
+                results = render_batch(
+                    specs=specs,
+                    targets=targets,
+                    processes=processes,
+                    progress=lambda done, total, result: progress_calls.append(
+                        (done, total, result.index)
+                    ),
+                    savefig_kwargs={"dpi": 50},
+                )
+
+                self.assertEqual([r.index for r in results], [0, 1, 2, 3])
+                self.assertEqual([r.target for r in results], targets)
+                self.assertEqual([r.ok for r in results], [True, False, True, True])
+                self.assertIn("KeyError", results[1].error)
+                self.assertTrue(
+                    all(os.path.exists(t) for i, t in enumerate(targets) if i != 1)
+                )
+
+                self.assertEqual(sorted(c[0] for c in progress_calls), [1, 2, 3, 4])
+                self.assertTrue(all(c[1] == 4 for c in progress_calls))
+                self.assertEqual(sorted(c[2] for c in progress_calls), [0, 1, 2, 3])
+
+            with self.assertRaises(ValueError):
+                render_batch(specs=specs, targets=targets[:3], processes=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
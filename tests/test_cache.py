@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import unittest
+
+from matplotlib import rc_context
+import numpy as np
+
+from pywaffle.cache import (
+    LRUCache,
+    get_block_layout,
+    get_font_properties,
+    get_glyph_path,
+    layout_cache,
+)
+from pywaffle.layout import block_layout, compute_layout
+
+
+class TestCache(unittest.TestCase):
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+        self.assertEqual(cache.get("a", lambda: 1), 1)
+        self.assertEqual(cache.get("b", lambda: 2), 2)
+        # Cached value is returned without calling factory
+        self.assertEqual(cache.get("a", lambda: 0), 1)
+        # "b" is the least recently used one
+        cache.get("c", lambda: 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(
+            cache.info(), {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+        )
+
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+
+        cache.clear()
+        self.assertEqual(
+            cache.info(), {"hits": 0, "misses": 0, "size": 0, "maxsize": 1}
+        )
+
+        cache = LRUCache(maxsize=0)
+        self.assertEqual(cache.get("a", lambda: 1), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_cache_bytes(self):
+        cache = LRUCache(maxsize=10, maxbytes=100, sizeof=len)
+        cache.get("a", lambda: b"x" * 40)
+        cache.get("b", lambda: b"x" * 40)
+        self.assertEqual(cache.nbytes, 80)
+        # "a" is evicted to keep the total size under maxbytes
+        cache.get("c", lambda: b"x" * 40)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.nbytes, 80)
+        # Items larger than maxbytes are returned without being cached
+        self.assertEqual(len(cache.get("d", lambda: b"x" * 101)), 101)
+        self.assertNotIn("d", cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.resize(maxsize=10, maxbytes=50)
+        self.assertEqual((len(cache), cache.nbytes), (1, 40))
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
+
+        with self.assertRaises(ValueError):
+            LRUCache(maxbytes=100)
+
+        # Large grids don't fill the layout cache
+        get_block_layout(
+            rows=1000,
+            columns=5000,
+            row_order=1,
+            column_order=1,
+            is_vertical=False,
+            is_snake=False,
+        )
+        self.assertNotIn((1000, 5000, 1, 1, False, False), layout_cache)
+        self.assertLessEqual(layout_cache.nbytes, layout_cache.maxbytes)
+
+    def test_get_block_layout(self):
+        geometry = dict(
+            rows=3,
+            columns=4,
+            row_order=-1,
+            column_order=1,
+            is_vertical=True,
+            is_snake=True,
+        )
+        cols, rows = get_block_layout(**geometry)
+        expected_cols, expected_rows = block_layout(**geometry)
+        np.testing.assert_array_equal(cols, expected_cols)
+        np.testing.assert_array_equal(rows, expected_rows)
+        self.assertFalse(cols.flags.writeable)
+
+        # Charts with the same geometry share the arrays
+        self.assertIs(get_block_layout(**geometry)[0], cols)
+        # The cache is shared with other tests, so it is cleared before counting hits
+        layout_cache.clear()
+        compute_layout(values=[1, 2], rows=7, columns=9)
+        compute_layout(values=[5, 3], rows=7, columns=9)
+        self.assertEqual(
+            (layout_cache.info()["hits"], layout_cache.info()["misses"]), (1, 1)
+        )
+
+    def test_get_font_properties(self):
+        prop = get_font_properties(size=12)
+        self.assertIs(get_font_properties(size=12), prop)
+        self.assertEqual(prop.get_size(), 12)
+        self.assertIsNot(get_font_properties(size=13), prop)
+
+    def test_font_cache_rc_params(self):
+        default = get_font_properties(size="large")
+        with rc_context({"font.family": "serif", "font.size": 30}):
+            prop = get_font_properties(size="large")
+            self.assertEqual(prop.get_family(), ["serif"])
+            self.assertEqual(prop.get_size(), 36)
+            path = get_glyph_path(font_file=None, text="A", size="large")
+        self.assertIsNot(prop, default)
+        self.assertIs(get_font_properties(size="large"), default)
+        self.assertIsNot(get_glyph_path(font_file=None, text="A", size="large"), path)
+
+    def test_get_glyph_path(self):
+        path = get_glyph_path(font_file=None, text="A", size=12)
+        self.assertIs(get_glyph_path(font_file=None, text="A", size=12), path)
+        self.assertGreater(len(path.vertices), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,14 @@
 
 import unittest
 
-from pywaffle.fontawesome_handler import font_file_finder
+from pywaffle import fontawesome_handler
+from pywaffle.fontawesome_handler import (
+    font_file_finder,
+    get_font_file,
+    get_legend_handler,
+)
+from pywaffle.fontawesome_index import IconIndex, pack_style
+from pywaffle.fontawesome_mapping import icons
 
 
 class TestUtilities(unittest.TestCase):
@@ -17,6 +24,46 @@ class TestUtilities(unittest.TestCase):
             str(font_file_mapping["brands"].resolve()),
         )
 
+    def test_get_font_file(self):
+        self.assertTrue(get_font_file("solid").name.endswith("Free-Solid-900.otf"))
+        self.assertTrue(get_font_file("solid").is_file())
+        self.assertEqual(get_font_file("brands"), font_file_finder()["brands"])
+        self.assertEqual(
+            fontawesome_handler.fontawesome_files["regular"], get_font_file("regular")
+        )
+        with self.assertRaises(KeyError):
+            get_font_file("unknown")
+
+    def test_get_legend_handler(self):
+        self.assertIs(get_legend_handler("solid"), get_legend_handler("solid"))
+        self.assertEqual(get_legend_handler("solid").font_file, get_font_file("solid"))
+        self.assertEqual(len(fontawesome_handler.legend_handler_style_mapping), 3)
+
+    def test_icon_index(self):
+        index = IconIndex(
+            {
+                "solid": pack_style({"star": "\uf005", "add": "+", "user": "\uf007"}),
+                "brands": ("", ""),
+            }
+        )
+        self.assertEqual(list(index), ["solid", "brands"])
+        self.assertEqual(index["solid"]["star"], "\uf005")
+        self.assertEqual(list(index["solid"]), ["add", "star", "user"])
+        self.assertEqual(len(index["solid"]), 3)
+        self.assertEqual(len(index["brands"]), 0)
+        with self.assertRaises(KeyError):
+            index["solid"]["unknown"]
+        with self.assertRaises(KeyError):
+            index["brands"]["star"]
+        with self.assertRaises(KeyError):
+            index["unknown"]
+
+    def test_icons(self):
+        self.assertEqual(set(icons.keys()), {"solid", "regular", "brands"})
+        self.assertEqual(icons["solid"]["star"], "\uf005")
+        self.assertEqual(icons["regular"]["star"], "\uf005")
+        self.assertEqual(icons["brands"]["python"], "\uf3e2")
+
 
 if __name__ == "__main__":
     unittest.main()
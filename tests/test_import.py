@@ -0,0 +1,63 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Seconds allowed for "import pywaffle", excluding Python startup
+IMPORT_TIME_BUDGET = 0.1
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import pywaffle
+duration = time.perf_counter() - start
+print(json.dumps({"duration": duration, "modules": sorted(sys.modules)}))
+"""
+
+
+class TestImport(unittest.TestCase):
+    def run_script(self, script):
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = {**os.environ, "PYTHONPATH": package_root}
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            stdout=subprocess.PIPE,
+            env=env,
+            check=True,
+            text=True,
+        )
+        return json.loads(result.stdout)
+
+    def test_import_pywaffle(self):
+        result = self.run_script(IMPORT_SCRIPT)
+        self.assertNotIn("matplotlib", result["modules"])
+        self.assertLess(result["duration"], IMPORT_TIME_BUDGET)
+
+    def test_import_waffle(self):
+        result = self.run_script(
+            "import json, sys; from pywaffle import Waffle; print(json.dumps({'modules': sorted(sys.modules)}))"
+        )
+        self.assertIn("pywaffle.waffle", result["modules"])
+        self.assertNotIn("matplotlib.pyplot", result["modules"])
+
+    def test_submodule_attributes(self):
+        result = self.run_script(
+            "import json, pywaffle; print(json.dumps({'modules': [pywaffle.waffle.__name__, pywaffle.layout.__name__]}))"
+        )
+        self.assertEqual(result["modules"], ["pywaffle.waffle", "pywaffle.layout"])
+
+    def test_compute_layout_without_figure(self):
+        result = self.run_script(
+            "import json, sys; from pywaffle import compute_layout; compute_layout(values=[3, 1], rows=2); "
+            "print(json.dumps({'modules': sorted(sys.modules)}))"
+        )
+        self.assertNotIn("matplotlib.figure", result["modules"])
+        self.assertNotIn("pywaffle.waffle", result["modules"])
+
+
+if __name__ == "__main__":
+    unittest.main()
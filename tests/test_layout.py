@@ -0,0 +1,264 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import unittest
+
+import numpy as np
+
+from pywaffle.layout import (
+    allocate_blocks,
+    block_categories,
+    block_layout,
+    compute_layout,
+    find_units_per_block,
+    largest_remainder,
+)
+
+
+class TestLayout(unittest.TestCase):
+    def test_block_layout(self):
+        cols, rows = block_layout(
+            rows=2,
+            columns=3,
+            row_order=1,
+            column_order=1,
+            is_vertical=False,
+            is_snake=False,
+        )
+        self.assertEqual(cols.tolist(), [0, 0, 1, 1, 2, 2])
+        self.assertEqual(rows.tolist(), [0, 1, 0, 1, 0, 1])
+
+        cols, rows = block_layout(
+            rows=2,
+            columns=3,
+            row_order=-1,
+            column_order=1,
+            is_vertical=True,
+            is_snake=True,
+        )
+        self.assertEqual(cols.tolist(), [0, 1, 2, 2, 1, 0])
+        self.assertEqual(rows.tolist(), [1, 1, 1, 0, 0, 0])
+
+        cols, rows = block_layout(
+            rows=3,
+            columns=2,
+            row_order=1,
+            column_order=-1,
+            is_vertical=False,
+            is_snake=True,
+        )
+        self.assertEqual(cols.tolist(), [1, 1, 1, 0, 0, 0])
+        self.assertEqual(rows.tolist(), [0, 1, 2, 2, 1, 0])
+
+        cols, rows = block_layout(
+            rows=0,
+            columns=0,
+            row_order=1,
+            column_order=1,
+            is_vertical=True,
+            is_snake=True,
+        )
+        self.assertEqual(len(cols), 0)
+        self.assertEqual(len(rows), 0)
+
+    def test_block_categories(self):
+        categories, colored = block_categories(
+            block_per_cat=[2, 0, 0, 3],
+            colored_block_per_cat=[2, 0, 0, 3],
+            block_number=10,
+        )
+        self.assertEqual(categories.tolist(), [0, 0, 3, 3, 3])
+        self.assertEqual(colored.tolist(), [True] * 5)
+
+        # Padding blocks of new-line style are not colored, and blocks beyond the grid are dropped
+        categories, colored = block_categories(
+            block_per_cat=[4, 4], colored_block_per_cat=[3, 1], block_number=6
+        )
+        self.assertEqual(categories.tolist(), [0, 0, 0, 0, 1, 1])
+        self.assertEqual(colored.tolist(), [True, True, True, False, True, False])
+
+        with self.assertRaises(ValueError):
+            block_categories(
+                block_per_cat=[2, -1], colored_block_per_cat=[2, -1], block_number=10
+            )
+
+    def test_allocate_blocks(self):
+        args = dict(
+            rounding_rule="nearest", block_arranging_style="normal", vertical=False
+        )
+        rows, columns, block_per_cat, colored_block_per_cat = allocate_blocks(
+            values=[48, 46.5, 5.5], rows=5, columns=None, **args
+        )
+        self.assertEqual((rows, columns), (5, 20))
+        self.assertEqual(block_per_cat.tolist(), [48, 46, 6])
+
+        # Array-likes are accepted, and a category with all values fills the grid
+        for values in (np.array([34.2, 0]), (34.2, 0), {"a": 34.2, "b": 0}):
+            rows, columns, block_per_cat, _ = allocate_blocks(
+                values=values,
+                rows=5,
+                columns=8,
+                rounding_rule="floor",
+                block_arranging_style="normal",
+                vertical=False,
+            )
+            self.assertEqual(block_per_cat.tolist(), [40, 0])
+
+        rows, columns, block_per_cat, colored_block_per_cat = allocate_blocks(
+            values=np.array([3, 1]),
+            rows=2,
+            columns=None,
+            rounding_rule="ceil",
+            block_arranging_style="new-line",
+            vertical=False,
+        )
+        self.assertEqual((rows, columns), (2, 3))
+        self.assertEqual(block_per_cat.tolist(), [4, 2])
+        self.assertEqual(colored_block_per_cat.tolist(), [3, 1])
+
+        self.assertEqual(
+            allocate_blocks(values=[0, 0], rows=2, columns=2, **args)[2].tolist(),
+            [0, 0],
+        )
+        with self.assertRaises(ValueError):
+            allocate_blocks(values=[3, -1], rows=2, columns=None, **args)
+        with self.assertRaises(ValueError):
+            allocate_blocks(values=[3, np.nan], rows=2, columns=None, **args)
+
+    def test_largest_remainder(self):
+        self.assertEqual(largest_remainder([1.5, 1.5, 2], total=5).tolist(), [2, 1, 2])
+        self.assertEqual(
+            largest_remainder([0.2, 0.7, 3.1], total=4).tolist(), [0, 1, 3]
+        )
+        self.assertEqual(largest_remainder([], total=0).tolist(), [])
+
+        # The grid is always filled exactly, while rounding each value independently overfills or underfills it
+        values = np.random.default_rng(0).random(1000)
+        for rounding_rule, filled in (("nearest", False), ("largest_remainder", True)):
+            _, _, block_per_cat, _ = allocate_blocks(
+                values=values,
+                rows=7,
+                columns=11,
+                rounding_rule=rounding_rule,
+                block_arranging_style="normal",
+                vertical=False,
+            )
+            self.assertEqual(block_per_cat.sum() == 77, filled)
+
+        layout = compute_layout(
+            values=[1, 1, 1], rows=2, columns=5, rounding_rule="largest_remainder"
+        )
+        self.assertEqual(layout.block_per_cat.tolist(), [4, 3, 3])
+
+    def test_find_units_per_block(self):
+        kwargs = {
+            "rounding_rule": "nearest",
+            "block_arranging_style": "normal",
+            "vertical": False,
+        }
+        self.assertEqual(
+            find_units_per_block(
+                values=[3_000_000, 1_200_000],
+                rows=10,
+                columns=None,
+                max_blocks=10_000,
+                **kwargs,
+            ),
+            500,
+        )
+        self.assertEqual(
+            find_units_per_block(
+                values=[30, 20], rows=10, columns=None, max_blocks=100, **kwargs
+            ),
+            1,
+        )
+        self.assertEqual(
+            find_units_per_block(
+                values=[30, 20],
+                rows=10,
+                columns=None,
+                max_blocks=10,
+                min_units_per_block=3,
+                **kwargs,
+            ),
+            6,
+        )
+        # New-line padding blocks are counted
+        self.assertEqual(
+            find_units_per_block(
+                values=[11, 1],
+                rows=5,
+                columns=None,
+                max_blocks=10,
+                rounding_rule="ceil",
+                block_arranging_style="new-line",
+                vertical=False,
+            ),
+            5,
+        )
+        with self.assertRaises(ValueError):
+            find_units_per_block(
+                values=[30, 20],
+                rows=10,
+                columns=None,
+                max_blocks=10,
+                strict=True,
+                **kwargs,
+            )
+        with self.assertRaises(ValueError):
+            find_units_per_block(
+                values=[30, 20], rows=5, columns=5, max_blocks=10, **kwargs
+            )
+        # Blocks rounded up past the grid are dropped, so a fixed grid has rows * columns blocks
+        self.assertEqual(
+            compute_layout(
+                values=[1, 1, 1],
+                rows=10,
+                columns=10,
+                rounding_rule="ceil",
+                max_blocks=100,
+            ).units_per_block,
+            1,
+        )
+
+        layout = compute_layout(
+            values=[3_000_000, 1_200_000], rows=10, max_blocks=10_000
+        )
+        self.assertEqual((layout.units_per_block, len(layout)), (500, 8400))
+        # Without a fixed grid, the number of blocks is the rounded sum of values
+        layout = compute_layout(
+            values=[2.4, 2.4, 0.2], rows=1, rounding_rule="Largest_Remainder"
+        )
+        self.assertEqual(layout.block_per_cat.tolist(), [3, 2, 0])
+
+    def test_compute_layout(self):
+        layout = compute_layout(values=[3, 1], rows=2, colors=("#FF0000", "#0000FF"))
+        self.assertEqual((layout.rows, layout.columns), (2, 2))
+        self.assertEqual(len(layout), 4)
+        self.assertEqual(layout.category.tolist(), [0, 0, 0, 1])
+        self.assertEqual(layout.column_index.tolist(), [0, 0, 1, 1])
+        self.assertEqual(layout.row_index.tolist(), [0, 1, 0, 1])
+        self.assertAlmostEqual(layout.block_height, 1 / 2.2)
+        self.assertAlmostEqual(layout.width, 1)
+        np.testing.assert_allclose(layout.x, [0, 0, 1.2 / 2.2, 1.2 / 2.2])
+        np.testing.assert_allclose(layout.block_colors[-1], [0, 0, 1, 1])
+
+        # new-line style pads the first category with a transparent block
+        layout = compute_layout(
+            values={"a": 3, "b": 1}, rows=2, block_arranging_style="new-line"
+        )
+        self.assertEqual(layout.columns, 3)
+        self.assertEqual(
+            layout.colored.tolist(), [True, True, True, False, True, False]
+        )
+        self.assertEqual(layout.block_colors[3].tolist(), [0, 0, 0, 0])
+        self.assertEqual(len(layout.colors), 2)
+
+        with self.assertRaises(ValueError):
+            compute_layout(values=[3, 1])
+        with self.assertRaises(KeyError):
+            compute_layout(values=[3, 1], rows=2, starting_location="X")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import io
+import unittest
+
+import matplotlib.image as mpimg
+import numpy as np
+
+from pywaffle.png import encode_png, pixel_block_index, render_image, save_png
+
+
+class TestPng(unittest.TestCase):
+    def test_pixel_block_index(self):
+        self.assertEqual(
+            pixel_block_index(
+                pixels=5, blocks=2, block_length=2, interval_length=1, pixel_length=1
+            ).tolist(),
+            [0, 0, -1, 1, 1],
+        )
+        # Pixels beyond the last block are gaps
+        self.assertEqual(
+            pixel_block_index(
+                pixels=4, blocks=1, block_length=1, interval_length=1, pixel_length=1
+            ).tolist(),
+            [0, -1, -1, -1],
+        )
+
+    def test_render_image(self):
+        # 2 x 2 blocks of 10 pixels with 2-pixel gaps
+        image = render_image(
+            height=22, values=[3, 1], rows=2, colors=("#FF0000", "#0000FF")
+        )
+        self.assertEqual(image.shape, (22, 22, 4))
+        self.assertEqual(image.dtype, np.uint8)
+        np.testing.assert_array_equal(image[21, 0], [255, 0, 0, 255])
+        np.testing.assert_array_equal(image[0, 21], [0, 0, 255, 255])
+        np.testing.assert_array_equal(image[11, 11], [0, 0, 0, 0])
+
+        image = render_image(
+            height=22,
+            values=[3, 1],
+            rows=2,
+            colors=("#FF000080", "#0000FF"),
+            background="white",
+        )
+        np.testing.assert_array_equal(image[11, 11], [255, 255, 255, 255])
+        np.testing.assert_array_equal(image[21, 0], [255, 127, 127, 255])
+
+    def test_save_png(self):
+        f = io.BytesIO()
+        save_png(f, height=22, values=[3, 1], rows=2, colors=("#FF0000", "#0000FF"))
+        f.seek(0)
+        decoded = mpimg.imread(f, format="png")
+        np.testing.assert_array_equal(
+            np.round(decoded * 255).astype(np.uint8),
+            render_image(
+                height=22, values=[3, 1], rows=2, colors=("#FF0000", "#0000FF")
+            ),
+        )
+
+    def test_encode_png(self):
+        data = encode_png(np.zeros((1, 2, 4), dtype=np.uint8))
+        self.assertTrue(data.startswith(b"\x89PNG\r\n\x1a\n"))
+        self.assertTrue(data.endswith(b"IEND\xaeB`\x82"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import io
+import unittest
+import xml.etree.ElementTree as ET
+
+from pywaffle.svg import save_svg, svg_number
+
+SVG = "{http://www.w3.org/2000/svg}"
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+class TestSvg(unittest.TestCase):
+    def write(self, **kwargs):
+        f = io.StringIO()
+        save_svg(f, **kwargs)
+        return ET.fromstring(f.getvalue())
+
+    def test_svg_number(self):
+        self.assertEqual(svg_number(1.5), "1.5")
+        self.assertEqual(svg_number(2.0), "2")
+        self.assertEqual(svg_number(0.123), "0.12")
+
+    def test_blocks(self):
+        root = self.write(
+            values=[3, 1], rows=2, colors=("#FF0000", "#0000FF"), height=100
+        )
+        self.assertEqual(root.get("height"), "100")
+        self.assertEqual(root.get("width"), "100")
+        self.assertEqual(len(root.find(f"{SVG}defs")), 1)
+
+        groups = root.findall(f"{SVG}g")
+        self.assertEqual([g.get("fill") for g in groups], ["#ff0000", "#0000ff"])
+        self.assertEqual([len(g) for g in groups], [3, 1])
+        self.assertTrue(
+            all(use.get(XLINK_HREF) == "#block" for g in groups for use in g)
+        )
+
+        # The last block is on the upper-right corner
+        use = groups[1][0]
+        self.assertEqual((use.get("x"), use.get("y")), ("54.55", "0"))
+
+    def test_transparent_blocks(self):
+        root = self.write(values=[3, 1], rows=2, block_arranging_style="new-line")
+        self.assertEqual(sum(len(g) for g in root.findall(f"{SVG}g")), 4)
+
+    def test_glyphs(self):
+        root = self.write(
+            values=[3, 2, 1],
+            rows=2,
+            icons=["star", "star", "apple"],
+            icon_style=["solid", "solid", "brands"],
+        )
+        defs = root.find(f"{SVG}defs")
+        self.assertEqual(len(defs), 2)
+        self.assertEqual([len(g) for g in root.findall(f"{SVG}g")], [3, 2, 1])
+        self.assertEqual(root.findall(f"{SVG}g")[2][0].get(XLINK_HREF), "#glyph1")
+
+        root = self.write(values=[3, 2], rows=2, characters="A", background="white")
+        self.assertEqual(root.find(f"{SVG}rect").get("fill"), "#ffffff")
+        self.assertEqual(len(root.find(f"{SVG}defs")), 1)
+
+        with self.assertRaises(ValueError):
+            self.write(values=[3, 2], rows=2, icons=["star"])
+
+
+if __name__ == "__main__":
+    unittest.main()
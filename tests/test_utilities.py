@@ -3,7 +3,14 @@
 
 import unittest
 
-from pywaffle.waffle import array_resize, division, flip_lines, round_up_to_multiple
+from pywaffle.waffle import (
+    array_resize,
+    division,
+    flip_lines,
+    raster_block_pixels,
+    raster_pixel_index,
+    round_up_to_multiple,
+)
 
 
 class TestUtilities(unittest.TestCase):
@@ -45,6 +52,20 @@ class TestUtilities(unittest.TestCase):
         self.assertEqual(division(x=2, y=3, method="floor"), 0)
         self.assertIsInstance(division(x=2, y=3, method="floor"), int)
 
+    def test_raster_block_pixels(self):
+        self.assertEqual(raster_block_pixels(interval_ratio=0.2), (10, 2))
+        self.assertEqual(raster_block_pixels(interval_ratio=0), (10, 0))
+        self.assertEqual(raster_block_pixels(interval_ratio=1 / 3), (12, 4))
+        # Large grids are limited by the size of the axis
+        self.assertEqual(raster_block_pixels(interval_ratio=0.2, max_step_pixels=3), (2, 1))
+        self.assertEqual(raster_block_pixels(interval_ratio=0.2, max_step_pixels=1), (1, 0))
+        self.assertEqual(raster_block_pixels(interval_ratio=0.2, max_step_pixels=100), (10, 2))
+
+    def test_raster_pixel_index(self):
+        self.assertEqual(raster_pixel_index(blocks=2, block_pixels=2, gap_pixels=1).tolist(), [0, 0, -1, 1, 1])
+        self.assertEqual(raster_pixel_index(blocks=2, block_pixels=1, gap_pixels=0).tolist(), [0, 1])
+        self.assertEqual(raster_pixel_index(blocks=0, block_pixels=2, gap_pixels=1).tolist(), [])
+
 
 if __name__ == "__main__":
     unittest.main()